@@ -1,7 +1,11 @@
-import random
 import time
 import pygame
-import statistics
+
+from simujack.engine import (
+    Shoe, Hand, hit, is_blackjack, determine_result, print_hand_results, run_multiple_simulations,
+    run_basic_strategy_simulation, values
+)
+from simujack.progressions import HalfUp, Martingale, Oscars, ReverseMartingale
 
 # Pygame initialization
 pygame.init()
@@ -31,69 +35,11 @@ bet = 0
 starting_bankroll = 0
 hands_played = 0
 
-# created for cards, taken from original
-suits = ("Spades", "Clubs", "Hearts", "Diamonds")
-ranks = ("2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A")
-values = {
-    "2": 2, "3": 3, "4": 4, "5": 5, "6": 6, "7": 7, "8": 8, "9": 9,
-    "10": 10, "J": 10, "Q": 10, "K": 10, "A": 11
-}
-
 
-# CLASS DEFINTIONS (Card and Deck and Hand taken from original, Button classes added with help of
+# CLASS DEFINTIONS (Card, Deck and Hand now live in simujack.engine, Button classes added with help of
 # ChatGPT):
 
 
-class Card:
-    def __init__(self, suit, rank):
-        self.suit = suit
-        self.rank = rank
-
-    def __str__(self):
-        return f"{self.rank} of {self.suit}"
-
-
-class Deck:
-    def __init__(self, num_decks=6):
-        self.num_decks = num_decks
-        self.deck = []
-        for _ in range(self.num_decks):
-            for suit in suits:
-                for rank in ranks:
-                    self.deck.append(Card(suit, rank))
-
-    def __str__(self):
-        return "The deck has:" + "".join(f"\n {card}" for card in self.deck)
-
-    def shuffle(self):
-        random.shuffle(self.deck)
-
-    def deal(self):
-        return self.deck.pop()
-
-
-class Hand:
-    def __init__(self):
-        self.cards = []  # start with an empty list as we did in the Deck class
-        self.value = 0  # start with zero value
-        self.aces = 0  # add an attribute to keep track of aces
-
-    def add_card(self, card):
-        self.cards.append(card)
-        self.value += values[card.rank]
-        if card.rank == "A":
-            self.aces += 1  # Add to self.aces
-        self.adjust_for_ace()  # Ensure Ace adjustment happens immediately
-
-    def adjust_for_ace(self):
-        while self.value > 21 and self.aces:
-            self.value -= 10
-            self.aces -= 1
-
-    def __str__(self):
-        return ", ".join(str(card) for card in self.cards)
-
-
 class Button:
     def __init__(self, text, pos):
         self.text = text
@@ -158,54 +104,6 @@ class ClearBetButton:
         return False
 
 
-def hit(deck, hand):
-    """Adds a card to the player's hand, adjusts if the card happens to be an Ace"""
-    hand.add_card(deck.deal())
-    hand.adjust_for_ace()
-
-
-def is_blackjack(hand):
-    """Returns True if the hand is a blackjack (value = 21 with exactly 2 cards)."""
-    return hand.value == 21 and len(hand.cards) == 2
-
-
-def determine_result(player_hand, dealer_hand, bankroll, bet):
-    """Determines the result of the game and updates the bankroll."""
-    if dealer_hand.value > 21 or player_hand.value > dealer_hand.value:
-        result = "Win"
-        bankroll += bet * 2  # Winning payout
-    elif player_hand.value == dealer_hand.value:
-        result = "Push"
-        bankroll += bet  # Add the bet back on a push
-    else:
-        result = "Lose"
-    return result, bankroll
-
-
-def print_hand_results(hands_played, result, player_hand, dealer_hand, bankroll, bet, doubled=False):
-    """Prints the full results of a hand in a single-line format."""
-    player_cards = ", ".join([str(card) for card in player_hand.cards])
-    dealer_cards = ", ".join([str(card) for card in dealer_hand.cards])
-
-    # Add "(Doubled)" to the bet if it was doubled
-    bet_info = f"${bet}"
-    if doubled:
-        bet_info += " (Doubled)"
-
-    print(
-        f"Hand {hands_played + 1}: {result} | "
-        f"Bet: {bet_info} | Updated Bankroll: ${bankroll} | "
-        f"Player's Hand: [{player_cards}] (Score: {player_hand.value}) | "
-        f"Dealer's Hand: [{dealer_cards}] (Score: {dealer_hand.value})"
-    )
-
-
-def play_dealer_turn(deck, dealer_hand):
-    """Plays the dealer's turn according to dealer rules."""
-    while dealer_hand.value < 17:
-        dealer_hand.add_card(deck.deal())
-
-
 def get_display_value(hand):
     """Returns the hand's value for PyGame."""
     # Start with the current total value
@@ -242,25 +140,6 @@ def show_message(message):
     pygame.time.delay(2000)  # Delay for visibility
 
 
-def simulate_player_turn(deck, player_hand, dealer_upcard, bankroll, bet):
-    """Simulates the player's turn using basic strategy."""
-    doubled = False  # Tracks if the player doubled
-    while player_hand.value <= 21:
-        action = basic_strategy(player_hand, dealer_upcard)
-        if action == "Hit":
-            player_hand.add_card(deck.deal())
-        elif action == "Double" and len(player_hand.cards) == 2 and bankroll >= bet:
-            bankroll -= bet
-            bet *= 2
-            player_hand.add_card(deck.deal())
-            doubled = True  # Mark that the player doubled
-            break  # Doubling ends the player's turn
-        else:  # Stand
-            break
-
-    return bankroll, bet, doubled
-
-
 def draw_screen(player_hand=None, dealer_hand=None, show_dealer_hidden=True, show_cards=True, playing=True):
     """Draws the entire screen, including the bankroll, cards, and scores."""
     # Fill the background
@@ -329,42 +208,6 @@ play_blackjack_button.rect.x = (WIDTH - play_blackjack_button.rect.width) // 2
 run_simulation_button.rect.x = (WIDTH - run_simulation_button.rect.width) // 2
 
 
-def basic_strategy(player_hand, dealer_upcard):
-    """Uses basic blackjack strategy to determine if the player should hit, stand, or double their bet."""
-    dealer_upcard_value = values[dealer_upcard.rank]
-    total = player_hand.value
-
-    # Soft hand (contains Ace counted as 11)
-    if player_hand.aces > 0 and total <= 21:
-        # Soft total adjustments for strategy
-        if total >= 19:
-            return "Stand"
-        elif total == 18:
-            return "Double" if 2 <= dealer_upcard_value <= 6 else "Stand" if dealer_upcard_value in [7, 8] else "Hit"
-        elif total == 17:
-            return "Double" if 3 <= dealer_upcard_value <= 6 else "Hit"
-        elif total in [16, 15]:
-            return "Double" if 4 <= dealer_upcard_value <= 6 else "Hit"
-        elif total in [14, 13]:
-            return "Double" if 5 <= dealer_upcard_value <= 6 else "Hit"
-
-    # Hard hand (no Ace counted as 11 or Ace adjusted to 1)
-    if total >= 17:
-        return "Stand"
-    elif 13 <= total <= 16:
-        return "Stand" if 2 <= dealer_upcard_value <= 6 else "Hit"
-    elif total == 12:
-        return "Stand" if 4 <= dealer_upcard_value <= 6 else "Hit"
-    elif total == 11:
-        return "Double"
-    elif total == 10:
-        return "Double" if 2 <= dealer_upcard_value <= 9 else "Hit"
-    elif total == 9:
-        return "Double" if 3 <= dealer_upcard_value <= 6 else "Hit"
-    else:
-        return "Hit"
-
-
 def draw_simulation_menu():
     """Draws the simulation menu screen."""
     screen.fill(GREEN)  # Background color
@@ -472,302 +315,25 @@ def handle_simulation_menu():
                             running_simulation_menu = False
                         elif button.text == "Martingale":
                             results = run_multiple_simulations(bankroll, unit_size, num_simulations,
-                                                               martingale_strategy)
+                                                               Martingale)
                             display_simulation_results(results)
                             running_simulation_menu = False
                         elif button.text == "Reverse Martingale":
                             results = run_multiple_simulations(bankroll, unit_size, num_simulations,
-                                                               reverse_martingale_strategy)
+                                                               ReverseMartingale)
                             display_simulation_results(results)
                             running_simulation_menu = False
                         elif button.text == "Half Up":
-                            results = run_multiple_simulations(bankroll, unit_size, num_simulations, half_up_strategy)
+                            results = run_multiple_simulations(bankroll, unit_size, num_simulations, HalfUp)
                             display_simulation_results(results)
                             running_simulation_menu = False
                         elif button.text == "Oscar's System":
                             results = run_multiple_simulations(bankroll, unit_size, num_simulations,
-                                                               oscars_system_strategy)
+                                                               Oscars)
                             display_simulation_results(results)
                             running_simulation_menu = False
 
 
-def run_multiple_simulations(bankroll, unit_size, num_simulations, strategy_func):
-    """Runs a simulation multiple times and calculates median hands to bankruptcy and max bankroll."""
-    hands_list = []
-    max_bankroll_list = []
-
-    for sim in range(1, num_simulations + 1):
-        # Check if `strategy_func` is a full simulation function
-        if strategy_func == run_basic_strategy_simulation:
-            # Run directly if it's a simulation function
-            results = strategy_func(bankroll, unit_size, print_hands=(num_simulations == 1))
-        else:
-            # Otherwise, treat it as a strategy function
-            results = run_simulation_with_strategy(bankroll, unit_size, strategy_func,
-                                                   print_hands=(num_simulations == 1))
-
-        hands_list.append(results["hands_played"])
-        max_bankroll_list.append(results["max_bankroll"])
-
-        # Print per-simulation results for multiple simulations
-        if num_simulations > 1:
-            print(
-                f"Simulation {sim}: Hands to Bankruptcy = {results['hands_played']}, "
-                f"Max Bankroll = ${results['max_bankroll']:.2f}"
-            )
-
-    # Calculate medians
-    median_hands = statistics.median(hands_list)
-    median_max_bankroll = statistics.median(max_bankroll_list)
-
-    return {
-        "median_hands_to_bankruptcy": median_hands,
-        "median_max_bankroll": median_max_bankroll,
-    }
-
-
-def run_simulation_with_strategy(bankroll, unit_size, strategy_func, print_hands=True):
-    """Runs simulation with betting strategy until the bankroll is empty."""
-
-    hands_played = 0
-    max_bankroll = bankroll
-    win_streak = 0
-    lose_streak = 0
-    total_wins = 0
-    last_result = None
-
-    while bankroll > 0:  # Run until bankroll is depleted
-        # Initialize deck and hands for a new round
-        deck = Deck(num_decks=6)
-        deck.shuffle()
-        player_hand = Hand()
-        dealer_hand = Hand()
-        player_hand.add_card(deck.deal())
-        player_hand.add_card(deck.deal())
-        dealer_hand.add_card(deck.deal())
-        dealer_hand.add_card(deck.deal())
-
-        # Get the bet amount using the strategy function
-        bet = strategy_func(bankroll, unit_size, win_streak, lose_streak, last_result, total_wins)
-        if bankroll < bet:
-            bet = bankroll  # Bet the remaining bankroll if less than the calculated bet
-        bankroll -= bet
-        doubled = False  # Track whether the bet was doubled
-
-        # Check for blackjack immediately after dealing
-        if is_blackjack(player_hand) or is_blackjack(dealer_hand):
-            if is_blackjack(player_hand) and is_blackjack(dealer_hand):
-                result = "Push"
-                bankroll += bet  # Return the bet for a push
-            elif is_blackjack(player_hand):
-                result = "Blackjack"
-                win_streak += 1
-                lose_streak = 0
-                total_wins += 1
-                bankroll += bet * 2.5  # Correct 3:2 payout for Blackjack
-            elif is_blackjack(dealer_hand):
-                result = "Lose"  # Dealer wins
-                lose_streak += 1
-                win_streak = 0
-            if print_hands:
-                print_hand_results(hands_played, result, player_hand, dealer_hand, bankroll, bet)
-            hands_played += 1
-            continue  # Skip to the next round
-
-        # Play player's turn
-        bankroll, bet, doubled = simulate_player_turn(deck, player_hand, dealer_hand.cards[0], bankroll, bet)
-
-        # Check if player busts
-        if player_hand.value > 21:
-            result = "Lose"
-            lose_streak += 1
-            win_streak = 0
-        else:
-            # Dealer's turn
-            play_dealer_turn(deck, dealer_hand)
-
-            # Determine the result
-            if dealer_hand.value > 21 or player_hand.value > dealer_hand.value:
-                result = "Win"
-                bankroll += bet * 2  # Winning payout includes doubled bets
-                win_streak += 1
-                total_wins += 1
-                lose_streak = 0
-            elif player_hand.value == dealer_hand.value:
-                result = "Push"
-                bankroll += bet  # Return the bet amount on a push
-            else:
-                result = "Lose"
-                lose_streak += 1
-                win_streak = 0
-
-        max_bankroll = max(max_bankroll, bankroll)
-
-        # Print per-hand results only if print_hands is True
-        if print_hands:
-            print_hand_results(hands_played, result, player_hand, dealer_hand, bankroll, bet, doubled)
-
-        hands_played += 1
-        last_result = result
-
-    return {
-        "hands_played": hands_played,
-        "max_bankroll": max_bankroll,
-    }
-
-
-def run_basic_strategy_simulation(bankroll, unit_size, print_hands=True):
-    """Runs basic strategy simulation witt a never-changing bet size"""
-    hands_played = 0
-    max_bankroll = bankroll
-
-    while bankroll > 0:  # Continue until the bankroll is depleted
-        # Initialize and reshuffle the deck for each hand
-        deck = Deck(num_decks=6)
-        deck.shuffle()
-
-        # Deal initial hands
-        player_hand = Hand()
-        dealer_hand = Hand()
-        player_hand.add_card(deck.deal())
-        player_hand.add_card(deck.deal())
-        dealer_hand.add_card(deck.deal())
-        dealer_hand.add_card(deck.deal())
-
-        # Place the bet
-        bet = unit_size
-        if bankroll < unit_size:
-            bet = bankroll  # Bet the remaining bankroll if it's less than the unit size
-        bankroll -= bet
-
-        # Check for blackjack immediately after dealing
-        if is_blackjack(player_hand) or is_blackjack(dealer_hand):
-            if is_blackjack(player_hand) and is_blackjack(dealer_hand):
-                result = "Push"
-                bankroll += bet  # Return the bet for a push
-            elif is_blackjack(player_hand):
-                result = "Blackjack"
-                bankroll += bet * 2.5  # Correct 3:2 payout for Blackjack
-            elif is_blackjack(dealer_hand):
-                result = "Lose"  # Dealer wins
-            if print_hands:
-                print_hand_results(hands_played, result, player_hand, dealer_hand, bankroll, bet)
-            hands_played += 1
-            continue  # Skip to the next round
-
-        # Play player's turn
-        while player_hand.value <= 21:
-            action = basic_strategy(player_hand, dealer_hand.cards[0])
-            if action == "Hit":
-                player_hand.add_card(deck.deal())
-            elif action == "Double" and len(player_hand.cards) == 2 and bankroll >= bet:
-                bankroll -= bet
-                bet *= 2
-                player_hand.add_card(deck.deal())
-                break  # Doubling ends the player's turn
-            else:  # Stand
-                break
-
-        # Check if player busts
-        if player_hand.value > 21:
-            result = "Lose"
-        else:
-            # Dealer's turn
-            while dealer_hand.value < 17:
-                dealer_hand.add_card(deck.deal())
-
-            # Determine the result
-            if dealer_hand.value > 21 or player_hand.value > dealer_hand.value:
-                result = "Win"
-                bankroll += bet * 2  # Player wins
-            elif player_hand.value == dealer_hand.value:
-                result = "Push"
-                bankroll += bet  # Push
-            else:
-                result = "Lose"
-
-        max_bankroll = max(max_bankroll, bankroll)
-
-        # Print results only if print_hands is True
-        if print_hands:
-            print_hand_results(hands_played, result, player_hand, dealer_hand, bankroll, bet)
-
-        hands_played += 1
-
-    return {
-        "hands_played": hands_played,
-        "max_bankroll": max_bankroll,
-    }
-
-
-def reverse_martingale_strategy(bankroll, unit_size, win_streak, lose_streak, last_result, total_wins, streak_cap=4):
-    """Determines the next bet using the Reverse Martingale strategy"""
-    """Defined from great.com article: For every win along a streak, you double your stake. You get to choose how long your 
-    predetermined streak will be (in this case 4) and how much your initial bet will cost."""
-
-    # Start with the initial unit size
-    current_bet = unit_size
-
-    if last_result == "Lose" or win_streak == 0 or win_streak >= streak_cap:
-        # Reset to the initial unit size on a loss, streak cap, or no streak
-        current_bet = unit_size
-    elif last_result == "Push":
-        # Maintain the same bet on a push
-        pass  # The current bet remains unchanged
-    else:
-        # Progressively increase the bet on a win, doubling based on streak
-        current_bet = unit_size * (2 ** win_streak)
-
-    # Ensure the bet does not exceed the bankroll
-    current_bet = min(current_bet, bankroll)
-
-    return current_bet
-
-
-def martingale_strategy(bankroll, unit_size, win_streak, lose_streak, last_result, total_wins):
-    """Determines the next bet using the Martingale strategy"""
-    """Defined from great.com article: ou start at your minimum wager (let’s say you’re starting at $10, the common minimum 
-    bet in blackjack). After every loss, you double your wager. So, if you’d started betting with $10, then you’d bet 
-    $20, then $40, then $80, and so on if you kept losing. If you do win a hand, you restart the entire process and 
-    bet that $10 minimum on the next hand."""
-
-    # Start with the initial unit size
-    current_bet = unit_size
-    if lose_streak > 0:
-        # Double the bet for each loss in the streak
-        current_bet = unit_size * (2 ** lose_streak)
-    elif last_result == "Push":
-        # Maintain the same bet on a push
-        pass  # The current_bet remains unchanged
-    # Cap the bet to the available bankroll
-    current_bet = min(current_bet, bankroll)
-    return current_bet
-
-
-def half_up_strategy(bankroll, unit_size, win_streak, lose_streak, last_result, total_wins):
-    """Determines the next bet using the Half Up strategy"""
-    """Defined from great.com article: You start with a flat bet, and you bet the same amount until you win two consecutive 
-    hands. Then you’ll increase your bet by 50% of your initial stake."""
-    if last_result == "Lose" or win_streak < 2:
-        # Start over at the initial unit size if a loss occurs or win streak < 2
-        return min(unit_size, bankroll)
-    else:
-        # Increase the bet by 50% of the initial unit size after two consecutive wins
-        next_bet = unit_size + int(unit_size * 0.5 * (win_streak - 1))  # Incremental bet increase
-        # caps the bet to available bankroll
-        return min(next_bet, bankroll)
-
-
-def oscars_system_strategy(bankroll, unit_size, win_streak, lose_streak, last_result, total_wins):
-    """Determines the next bet using the Oscar's System strategy"""
-    """Defined from great.com article: You simply continue to add another unit to every wager if you win or stick to the same 
-    amount if you lose (you do not revert back to your original bet)."""
-    first_bet = unit_size
-
-    # Ensure the bet does not exceed the bankroll, the bet will equal the original unit + an extra unit for every winning bet
-    return min(first_bet + (total_wins * first_bet), bankroll)
-
-
 def simulation_setup(simulation_name):
     """Displays a setup screen to ask the user how they want to run their simulation."""
     input_active = [False, False, False]  # Track active input boxes for each question
@@ -1065,23 +631,13 @@ def show_end_screen():
 
 # main gameplay loop:
 
-# Create & shuffle the deck, deal two cards to each player
-deck = Deck()
-deck.shuffle()
-
-player_hand = Hand()
-player_hand.add_card(deck.deal())
-player_hand.add_card(deck.deal())
-
-dealer_hand = Hand()
-dealer_hand.add_card(deck.deal())
-dealer_hand.add_card(deck.deal())
+# Create & shuffle the shoe once, it is only reshuffled when the cut card comes out
+deck = Shoe(num_decks=6)
 
 bet = 0  # Reset the bet for each round
 while running:
-    # Initialize deck and hands for a new round
-    deck = Deck(num_decks=6)
-    deck.shuffle()
+    # Reshuffle the shoe if needed and start new hands for the round
+    deck.start_round()
     player_hand = Hand()
     dealer_hand = Hand()
     player_hand.add_card(deck.deal())
@@ -0,0 +1,13 @@
+"""SimuJack: blackjack betting-strategy simulations.
+
+The simulation engine lives in ``simujack.engine`` and has no pygame dependency;
+``simuJack_final.py`` is the pygame front-end built on top of it.
+"""
+from simujack.engine import (
+    Card, Deck, Shoe, Hand, basic_strategy, simulate_player_turn, play_dealer_turn, determine_result,
+    run_multiple_simulations, run_simulation_with_strategy, run_basic_strategy_simulation,
+    martingale_strategy, reverse_martingale_strategy, half_up_strategy, oscars_system_strategy, true_count_strategy
+)
+from simujack.progressions import (
+    Progression, FlatBet, Martingale, ReverseMartingale, HalfUp, Oscars, TrueCount, make_progression
+)
@@ -0,0 +1,6 @@
+"""Allows running the command line interface with python -m simujack."""
+import sys
+
+from simujack.cli import main
+
+sys.exit(main())
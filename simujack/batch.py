@@ -0,0 +1,375 @@
+"""NumPy batch engine that plays many independent blackjack sessions at once.
+
+Every lane of the batch is its own session with its own 6-deck shoe (a row of card codes from simujack.cards) dealt
+to a cut card, exactly like run_basic_strategy_simulation with a Shoe. Each step deals, plays basic strategy (the
+compiled chart from simujack.strategy, including doubling) and settles one hand in every lane that still has money,
+lanes that went bankrupt are masked out of the next step.
+
+    results = run_batch_basic_strategy_simulation(bankroll=1000, unit_size=10, num_sessions=100_000, seed=42)
+    results["hands_played"], results["max_bankroll"]  # one entry per session
+
+The betting progressions of simujack.progressions have batch forms here that keep the state of every lane in
+arrays and advance all of them at once from the net results of a round, so run_batch_strategy_simulation can bet
+them the way run_simulation_with_strategy does:
+
+    results = run_batch_strategy_simulation(1000, 10, 100_000, Martingale, seed=42)
+
+compare_with_scalar() plays the same number of hands through this engine and through the scalar engine and runs a
+chi-square test on the per-hand outcomes, to check both give the same outcome distribution.
+"""
+import math
+import random
+from functools import partial
+
+import numpy as np
+
+from simujack.cards import CARD_VALUES, CARD_VIEWS, HAND_TABLE
+from simujack.engine import Shoe, is_blackjack, play_dealer_turn, simulate_player_turn
+from simujack.progressions import FlatBet, HalfUp, Martingale, Oscars, ReverseMartingale
+from simujack.strategy import BASIC_STRATEGY_CHART, DOUBLE, HAND_STATES, HIT, hand_state
+
+# Possible net results of a flat 1 unit hand: lost double, lose, push, win, blackjack, won double
+hand_outcomes = (-2.0, -1.0, 0.0, 1.0, 1.5, 2.0)
+
+np_card_values = np.frombuffer(CARD_VALUES, dtype=np.uint8).astype(np.intp)
+np_hand_table = np.frombuffer(HAND_TABLE, dtype=np.uint8).astype(np.intp)
+blackjack_state = hand_state(21, 1)
+
+
+def action_table(chart):
+    """Returns a chart's action codes as an array indexed by [hand state, dealer upcard value]."""
+    return np.frombuffer(chart.table, dtype=np.uint8).reshape(HAND_STATES, 12)
+
+
+class BatchTable:
+    """Holds the shoes and hands of num_lanes independent sessions and plays rounds for any subset of them."""
+
+    def __init__(self, num_lanes, num_decks=6, penetration=0.75, cut_card=None, rng=None,
+                 chart=BASIC_STRATEGY_CHART):
+        if chart.pairs is not None or chart.surrender is not None:
+            raise ValueError(f"Batch sessions never split or surrender, chart {chart.name!r} does")
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.actions = action_table(chart)
+        self.num_lanes = num_lanes
+        self.size = len(CARD_VIEWS) * num_decks
+        self.cut_card = int(self.size * penetration) if cut_card is None else cut_card
+        if not 0 < self.cut_card <= self.size:
+            raise ValueError(f"Cut card must be between 1 and {self.size}, got {self.cut_card}")
+        single_shoe = np.tile(np.arange(len(CARD_VIEWS), dtype=np.uint8), num_decks)
+        self.shoes = np.tile(single_shoe, (num_lanes, 1))
+        self.positions = np.zeros(num_lanes, dtype=np.intp)  # next card to deal in every lane's shoe
+        self.shuffle(np.arange(num_lanes))
+
+    def shuffle(self, lanes):
+        """Puts every card back into the shoes of the given lanes and shuffles them."""
+        if lanes.size:
+            self.shoes[lanes] = self.rng.permuted(self.shoes[lanes], axis=1)
+            self.positions[lanes] = 0
+
+    def deal(self, lanes):
+        """Deals one card code to each of the given lanes."""
+        empty = lanes[self.positions[lanes] == self.size]
+        self.shuffle(empty)  # only happens with a very deep cut card, same as Shoe.deal
+        codes = self.shoes[lanes, self.positions[lanes]]
+        self.positions[lanes] += 1
+        return codes
+
+    def draw(self, states, lanes):
+        """Deals a card to each lane and moves their hand states along HAND_TABLE."""
+        states[lanes] = np_hand_table[states[lanes] * 12 + np_card_values[self.deal(lanes)]]
+
+    def play_round(self, lanes, bankroll, bet):
+        """Plays one hand of basic strategy in each lane, updating bankroll (an array for all lanes) in place.
+
+        `bet` is the stake per lane, it must already be covered by the bankroll. Returns the net result of every
+        lane, whether the player doubled and whether they were dealt a blackjack.
+        """
+        # Reshuffle the shoes whose cut card came out
+        self.shuffle(lanes[self.positions[lanes] >= self.cut_card])
+
+        player = np.zeros(self.num_lanes, dtype=np.intp)
+        dealer = np.zeros(self.num_lanes, dtype=np.intp)
+        self.draw(player, lanes)
+        self.draw(player, lanes)
+        upcards = np_card_values[self.deal(lanes)]
+        dealer[lanes] = np_hand_table[upcards]
+        self.draw(dealer, lanes)
+
+        start = bankroll[lanes]
+        bets = np.zeros(self.num_lanes)
+        bets[lanes] = bet
+        bankroll[lanes] -= bet
+        cards = np.zeros(self.num_lanes, dtype=np.intp)
+        cards[lanes] = 2
+        upcard = np.zeros(self.num_lanes, dtype=np.intp)
+        upcard[lanes] = upcards
+
+        # Blackjacks end the round right away
+        player_blackjack = player[lanes] == blackjack_state
+        dealer_blackjack = dealer[lanes] == blackjack_state
+        both = player_blackjack & dealer_blackjack
+        bankroll[lanes[both]] += bets[lanes[both]]
+        only_player = player_blackjack & ~dealer_blackjack
+        bankroll[lanes[only_player]] += bets[lanes[only_player]] * 2.5
+
+        # Player's turn, lanes leave `acting` when they stand, double or bust
+        doubled = np.zeros(self.num_lanes, dtype=bool)
+        acting = lanes[~(player_blackjack | dealer_blackjack)]
+        playing = acting
+        while acting.size:
+            acting = acting[(player[acting] >> 1) <= 21]
+            actions = self.actions[player[acting], upcard[acting]]
+            doubling = acting[(actions == DOUBLE) & (cards[acting] == 2) & (bankroll[acting] >= bets[acting])]
+            bankroll[doubling] -= bets[doubling]
+            bets[doubling] *= 2
+            doubled[doubling] = True
+            self.draw(player, doubling)
+            acting = acting[actions == HIT]
+            self.draw(player, acting)
+            cards[acting] += 1
+
+        # Dealer's turn for every player that did not bust
+        standing = playing[(player[playing] >> 1) <= 21]
+        drawing = standing
+        while drawing.size:
+            drawing = drawing[(dealer[drawing] >> 1) < 17]
+            self.draw(dealer, drawing)
+
+        # Settle the hands
+        player_value = player[standing] >> 1
+        dealer_value = dealer[standing] >> 1
+        wins = standing[(dealer_value > 21) | (player_value > dealer_value)]
+        bankroll[wins] += bets[wins] * 2
+        pushes = standing[(dealer_value <= 21) & (player_value == dealer_value)]
+        bankroll[pushes] += bets[pushes]
+
+        return bankroll[lanes] - start, doubled[lanes], player_blackjack & ~dealer_blackjack
+
+
+class BatchFlatBet:
+    """Batch form of FlatBet and base class of the batch progressions: `bets` holds the next bet of every lane and
+    record() moves the lanes' state along from the net results of a round (above 0 a win, 0 a push, below 0 a
+    loss)."""
+
+    def __init__(self, num_lanes, unit_size):
+        self.unit_size = unit_size
+        self.bets = np.full(num_lanes, float(unit_size))
+
+    def next_bets(self, lanes, bankrolls):
+        """Returns the bets of the given lanes for their next hand, capped to their bankrolls."""
+        return np.minimum(self.bets[lanes], bankrolls[lanes])
+
+    def record(self, lanes, net):
+        """Takes the net results of the hands the given lanes just played."""
+
+
+class BatchMartingale(BatchFlatBet):
+    def record(self, lanes, net):
+        self.bets[lanes[net > 0]] = self.unit_size
+        self.bets[lanes[net < 0]] *= 2
+
+
+class BatchReverseMartingale(BatchFlatBet):
+    def __init__(self, num_lanes, unit_size, streak_cap=4):
+        super().__init__(num_lanes, unit_size)
+        self.streak_cap = streak_cap
+        self.win_streaks = np.zeros(num_lanes, dtype=np.int64)
+
+    def record(self, lanes, net):
+        wins = lanes[net > 0]
+        self.win_streaks[wins] += 1
+        streaks = self.win_streaks[wins]
+        self.bets[wins] = np.where(streaks < self.streak_cap, self.unit_size * 2.0 ** streaks, self.unit_size)
+        self.bets[lanes[net == 0]] = self.unit_size  # the streak goes on, but the next bet is back to one unit
+        losses = lanes[net < 0]
+        self.win_streaks[losses] = 0
+        self.bets[losses] = self.unit_size
+
+
+class BatchHalfUp(BatchFlatBet):
+    def __init__(self, num_lanes, unit_size):
+        super().__init__(num_lanes, unit_size)
+        self.win_streaks = np.zeros(num_lanes, dtype=np.int64)
+
+    def record(self, lanes, net):
+        wins = lanes[net > 0]
+        self.win_streaks[wins] += 1
+        raised = wins[self.win_streaks[wins] >= 2]
+        self.bets[raised] = self.unit_size + np.floor(self.unit_size * 0.5 * (self.win_streaks[raised] - 1))
+        losses = lanes[net < 0]
+        self.win_streaks[losses] = 0
+        self.bets[losses] = self.unit_size
+
+
+class BatchOscars(BatchFlatBet):
+    def __init__(self, num_lanes, unit_size):
+        super().__init__(num_lanes, unit_size)
+        self.total_wins = np.zeros(num_lanes, dtype=np.int64)
+
+    def record(self, lanes, net):
+        wins = lanes[net > 0]
+        self.total_wins[wins] += 1
+        self.bets[wins] = self.unit_size + self.total_wins[wins] * self.unit_size
+
+
+# Batch form of every progression class that has one
+batch_progressions = {
+    FlatBet: BatchFlatBet,
+    Martingale: BatchMartingale,
+    ReverseMartingale: BatchReverseMartingale,
+    HalfUp: BatchHalfUp,
+    Oscars: BatchOscars,
+}
+
+
+def make_batch_progression(progression, num_lanes, unit_size):
+    """Returns the batch form of a progression class (or a functools.partial of one) for num_lanes sessions.
+
+    The arguments bound with functools.partial are passed on the way make_progression() passes them to the class,
+    positional ones before unit_size.
+    """
+    args = ()
+    keywords = {}
+    while isinstance(progression, partial):
+        args = progression.args + args
+        keywords = {**progression.keywords, **keywords}
+        progression = progression.func
+    if progression not in batch_progressions:
+        raise ValueError(f"{getattr(progression, '__name__', progression)!r} has no batch form, expected one of "
+                         f"{[cls.__name__ for cls in batch_progressions]}")
+    return batch_progressions[progression](num_lanes, *args, unit_size, **keywords)
+
+
+def run_batch_strategy_simulation(bankroll, unit_size, num_sessions, progression, num_decks=6, penetration=0.75,
+                                  seed=None, rng=None, chart=BASIC_STRATEGY_CHART):
+    """Runs num_sessions simulations of a betting progression side by side until every session is bankrupt.
+
+    `progression` is a progression class from simujack.progressions with a batch form (see batch_progressions) or a
+    functools.partial of one. Returns the hands played and max bankroll of every session as arrays, the batch
+    version of run_simulation_with_strategy.
+    """
+    if rng is None:
+        rng = np.random.default_rng(seed)
+    table = BatchTable(num_sessions, num_decks=num_decks, penetration=penetration, rng=rng, chart=chart)
+    progression = make_batch_progression(progression, num_sessions, unit_size)
+    bankrolls = np.full(num_sessions, float(bankroll))
+    max_bankroll = bankrolls.copy()
+    hands_played = np.zeros(num_sessions, dtype=np.int64)
+
+    active = np.flatnonzero(bankrolls > 0)
+    while active.size:
+        bet = progression.next_bets(active, bankrolls)  # bet the remaining bankroll if it's less than the bet
+        net, _, blackjack = table.play_round(active, bankrolls, bet)
+        progression.record(active, net)
+        # Like the scalar engine, a blackjack round skips the max bankroll update
+        settled = active[~blackjack]
+        max_bankroll[settled] = np.maximum(max_bankroll[settled], bankrolls[settled])
+        hands_played[active] += 1
+        active = active[bankrolls[active] > 0]
+
+    return {
+        "hands_played": hands_played,
+        "max_bankroll": max_bankroll,
+    }
+
+
+def run_batch_basic_strategy_simulation(bankroll, unit_size, num_sessions, num_decks=6, penetration=0.75, seed=None,
+                                        rng=None, chart=BASIC_STRATEGY_CHART):
+    """Runs num_sessions basic strategy simulations with a never-changing bet size side by side until every
+    session is bankrupt.
+
+    Returns the hands played and max bankroll of every session as arrays, the batch version of
+    run_basic_strategy_simulation.
+    """
+    return run_batch_strategy_simulation(bankroll, unit_size, num_sessions, FlatBet, num_decks=num_decks,
+                                         penetration=penetration, seed=seed, rng=rng, chart=chart)
+
+
+def batch_hand_outcomes(num_hands, num_lanes=10_000, num_decks=6, penetration=0.75, seed=None):
+    """Plays num_hands flat 1 unit hands through the batch engine and returns their net results."""
+    table = BatchTable(num_lanes, num_decks=num_decks, penetration=penetration, rng=np.random.default_rng(seed))
+    lanes = np.arange(num_lanes)
+    bankrolls = np.zeros(num_lanes)
+    outcomes = []
+    for _ in range(-(-num_hands // num_lanes)):
+        bankrolls[:] = 1000.0  # always enough to double
+        net, _, _ = table.play_round(lanes, bankrolls, 1.0)
+        outcomes.append(net)
+    return np.concatenate(outcomes)[:num_hands]
+
+
+def scalar_hand_outcomes(num_hands, num_decks=6, penetration=0.75, seed=None):
+    """Plays num_hands flat 1 unit hands through the scalar engine and returns their net results."""
+    shoe = Shoe(num_decks=num_decks, penetration=penetration, rng=random.Random(seed))
+    player_hand = shoe.new_hand()
+    dealer_hand = shoe.new_hand()
+    outcomes = np.zeros(num_hands)
+    for i in range(num_hands):
+        shoe.start_round()
+        player_hand.reset()
+        dealer_hand.reset()
+        player_hand.add_card(shoe.deal())
+        player_hand.add_card(shoe.deal())
+        dealer_hand.add_card(shoe.deal())
+        dealer_hand.add_card(shoe.deal())
+
+        if is_blackjack(player_hand) or is_blackjack(dealer_hand):
+            if is_blackjack(player_hand) and is_blackjack(dealer_hand):
+                outcomes[i] = 0.0
+            elif is_blackjack(player_hand):
+                outcomes[i] = 1.5
+            else:
+                outcomes[i] = -1.0
+            continue
+
+        _, bet, _ = simulate_player_turn(shoe, player_hand, dealer_hand.cards[0], 1000.0, 1.0)
+        if player_hand.value > 21:
+            outcomes[i] = -bet
+            continue
+        play_dealer_turn(shoe, dealer_hand)
+        if dealer_hand.value > 21 or player_hand.value > dealer_hand.value:
+            outcomes[i] = bet
+        elif player_hand.value < dealer_hand.value:
+            outcomes[i] = -bet
+    return outcomes
+
+
+def chi_square_sf(statistic, dof):
+    """Survival function (p-value) of the chi-square distribution, in closed form for integer degrees of freedom."""
+    half = statistic / 2
+    if dof % 2 == 0:
+        term = total = math.exp(-half)
+        for j in range(1, dof // 2):
+            term *= half / j
+            total += term
+        return total
+    total = math.erfc(math.sqrt(half))
+    term = math.sqrt(2 * statistic / math.pi) * math.exp(-half)
+    for j in range(1, (dof + 1) // 2):
+        total += term
+        term *= statistic / (2 * j + 1)
+    return total
+
+
+def compare_with_scalar(num_hands=200_000, seed=None):
+    """Chi-square test that the batch and scalar engines give the same per-hand outcome distribution.
+
+    Returns the outcome counts of both engines, the chi-square statistic and its p-value. A tiny p-value (say
+    below 0.001) means the engines disagree.
+    """
+    batch = batch_hand_outcomes(num_hands, seed=seed)
+    scalar = scalar_hand_outcomes(num_hands, seed=seed)
+    counts = np.array([[np.count_nonzero(results == outcome) for outcome in hand_outcomes]
+                       for results in (batch, scalar)], dtype=float)
+    if counts.sum() != 2 * num_hands:
+        raise ValueError("Found a hand outcome that is not in hand_outcomes")
+    counts = counts[:, counts.sum(axis=0) > 0]
+    expected = counts.sum(axis=1, keepdims=True) * counts.sum(axis=0) / counts.sum()
+    statistic = float(((counts - expected) ** 2 / expected).sum())
+    dof = counts.shape[1] - 1
+    return {
+        "batch_counts": counts[0].astype(int).tolist(),
+        "scalar_counts": counts[1].astype(int).tolist(),
+        "chi_square": statistic,
+        "p_value": chi_square_sf(statistic, dof),
+    }
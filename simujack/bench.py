@@ -0,0 +1,214 @@
+"""Benchmark suite for the simulation engine, with JSON baselines.
+
+Every benchmark deals from shoes seeded with a fixed seed, so a given engine version always does the same amount of
+work and the only thing that changes between runs is how long it takes. Each one is timed `repeat` times and the
+best time is kept, which is the least noisy estimate on a busy machine.
+
+    python -m simujack bench --output baseline.json      # measure and store a baseline
+    python -m simujack compare baseline.json             # measure again and flag regressions against it
+    python -m simujack compare baseline.json new.json    # compare two stored results
+
+A benchmark regresses when its rate (operations per second) drops by more than the threshold, 10% by default.
+Baselines are only comparable on the same machine and Python version, both are stored with the results.
+"""
+import functools
+import json
+import platform
+import random
+import time
+
+from simujack.engine import (
+    Deck, Shoe, basic_strategy, determine_result, is_blackjack, play_dealer_turn, run_multiple_simulations,
+    simulate_player_turn, simulation_rng, strategies
+)
+
+BENCHMARK_VERSION = 1
+DEFAULT_SEED = 2024
+DEFAULT_THRESHOLD = 0.10
+
+# Table used by the full bankruptcy runs, and how many runs of each strategy make roughly 100,000 hands
+BANKROLL = 1000
+UNIT_SIZE = 10
+bankruptcy_run_counts = {"basic": 20, "martingale": 200, "reverse-martingale": 30, "half-up": 25, "oscars": 1000}
+
+
+def deck_construction(seed, decks=1000):
+    """Builds 6-deck Decks from scratch."""
+    for _ in range(decks):
+        Deck(num_decks=6)
+    return decks
+
+
+def shoe_shuffle(seed, shuffles=2000):
+    """Reshuffles a 6-deck Shoe."""
+    shoe = Shoe(num_decks=6, rng=random.Random(seed))
+    for _ in range(shuffles):
+        shoe.shuffle()
+    return shuffles
+
+
+def shoe_shuffle_pcg64(seed, shuffles=2000):
+    """Reshuffles a 6-deck Shoe with a block-buffered PCG64 stream."""
+    shoe = Shoe(num_decks=6, rng=simulation_rng(seed, 1, "pcg64"))
+    for _ in range(shuffles):
+        shoe.shuffle()
+    return shuffles
+
+
+def deal_play_settle(seed, rounds=50_000):
+    """Deals rounds from a 6-deck shoe, plays both hands and settles the bet, without any bankroll bookkeeping."""
+    shoe = Shoe(num_decks=6, rng=random.Random(seed))
+    player_hand = shoe.new_hand()
+    dealer_hand = shoe.new_hand()
+    bankroll = 0.0
+    for _ in range(rounds):
+        shoe.start_round()
+        player_hand.reset()
+        dealer_hand.reset()
+        player_hand.add_card(shoe.deal())
+        player_hand.add_card(shoe.deal())
+        dealer_hand.add_card(shoe.deal())
+        dealer_hand.add_card(shoe.deal())
+        if is_blackjack(player_hand) or is_blackjack(dealer_hand):
+            continue
+        bankroll, bet, _ = simulate_player_turn(shoe, player_hand, dealer_hand.cards[0], bankroll + 2, 1)
+        if player_hand.value <= 21:
+            play_dealer_turn(shoe, dealer_hand)
+            _, bankroll = determine_result(player_hand, dealer_hand, bankroll, bet)
+    return rounds
+
+
+def basic_strategy_decisions(seed, decisions=200_000, positions=1000):
+    """Asks basic_strategy() for decisions on a fixed set of dealt positions."""
+    shoe = Shoe(num_decks=6, rng=random.Random(seed))
+    dealt = []
+    for _ in range(positions):
+        shoe.start_round()
+        hand = shoe.new_hand()
+        hand.add_card(shoe.deal())
+        hand.add_card(shoe.deal())
+        dealt.append((hand, shoe.deal()))
+    for index in range(decisions):
+        hand, upcard = dealt[index % positions]
+        basic_strategy(hand, upcard)
+    return decisions
+
+
+def bankruptcy_runs(strategy, runs, seed):
+    """Plays `runs` seeded simulations of a strategy until bankruptcy, returns the number of hands played."""
+    results = run_multiple_simulations(BANKROLL, UNIT_SIZE, runs, strategies[strategy], seed=seed, verbose=False)
+    summary = results["hands_to_bankruptcy"]
+    return round(summary["mean"] * summary["count"])
+
+
+# name -> (what one operation is, function taking the seed and returning the number of operations)
+benchmarks = {
+    "deck_construction": ("decks", deck_construction),
+    "shoe_shuffle": ("shuffles", shoe_shuffle),
+    "shoe_shuffle_pcg64": ("shuffles", shoe_shuffle_pcg64),
+    "deal_play_settle": ("rounds", deal_play_settle),
+    "basic_strategy_decisions": ("decisions", basic_strategy_decisions),
+}
+for strategy_name in strategies:
+    benchmarks[f"bankruptcy_{strategy_name}"] = (
+        "hands", functools.partial(bankruptcy_runs, strategy_name, bankruptcy_run_counts.get(strategy_name, 20))
+    )
+
+
+def time_benchmark(function, seed, repeat):
+    """Runs a benchmark `repeat` times, returns (operations, best time in seconds)."""
+    best = None
+    operations = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        operations = function(seed)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return operations, best
+
+
+def run_benchmarks(names=None, seed=DEFAULT_SEED, repeat=3, progress=None):
+    """Runs the named benchmarks (all of them by default) and returns the results as a JSON-ready dict.
+
+    `progress`, when given, is called with each benchmark's name and result as soon as it finishes.
+    """
+    names = list(benchmarks) if names is None else list(names)
+    unknown = [name for name in names if name not in benchmarks]
+    if unknown:
+        raise ValueError(f"Unknown benchmarks {unknown}, expected some of {list(benchmarks)}")
+    if repeat < 1:
+        raise ValueError(f"repeat must be at least 1, got {repeat}")
+
+    results = {}
+    for name in names:
+        unit, function = benchmarks[name]
+        operations, seconds = time_benchmark(function, seed, repeat)
+        results[name] = {"unit": unit, "operations": operations, "seconds": seconds, "rate": operations / seconds}
+        if progress is not None:
+            progress(name, results[name])
+    return {
+        "benchmark_version": BENCHMARK_VERSION,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "seed": seed,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def save_results(record, path):
+    with open(path, "w") as results_file:
+        json.dump(record, results_file, indent=2)
+        results_file.write("\n")
+
+
+def load_results(path):
+    with open(path) as results_file:
+        record = json.load(results_file)
+    if record.get("benchmark_version") != BENCHMARK_VERSION or "results" not in record:
+        raise ValueError(f"{path} is not a benchmark result file of version {BENCHMARK_VERSION}")
+    return record
+
+
+def compare_results(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """Compares two run_benchmarks() results, returns one row per benchmark of the baseline.
+
+    Each row is a dict with the name, both rates, the relative change of the rate and a status: "regression" if
+    the rate dropped by more than `threshold`, "faster" if it rose by more than that, "ok" otherwise, or
+    "missing" if the current results do not have the benchmark. `work_changed` is True when the two runs did a
+    different number of operations with the same seed, meaning the engine now plays differently and the numbers
+    measure different work.
+    """
+    rows = []
+    for name, old in baseline["results"].items():
+        new = current["results"].get(name)
+        if new is None:
+            rows.append({"name": name, "baseline_rate": old["rate"], "current_rate": None, "change": None,
+                         "status": "missing", "work_changed": False})
+            continue
+        change = new["rate"] / old["rate"] - 1
+        if change < -threshold:
+            status = "regression"
+        elif change > threshold:
+            status = "faster"
+        else:
+            status = "ok"
+        work_changed = baseline["seed"] == current["seed"] and old["operations"] != new["operations"]
+        rows.append({"name": name, "baseline_rate": old["rate"], "current_rate": new["rate"], "change": change,
+                     "status": status, "work_changed": work_changed})
+    return rows
+
+
+def format_comparison(rows):
+    """Formats compare_results() rows as a text table."""
+    lines = [f"{'benchmark':<32}{'baseline/s':>14}{'current/s':>14}{'change':>10}  status"]
+    for row in rows:
+        if row["current_rate"] is None:
+            lines.append(f"{row['name']:<32}{row['baseline_rate']:>14,.0f}{'-':>14}{'-':>10}  {row['status']}")
+            continue
+        status = row["status"] + (" (work changed)" if row["work_changed"] else "")
+        lines.append(f"{row['name']:<32}{row['baseline_rate']:>14,.0f}{row['current_rate']:>14,.0f}"
+                     f"{row['change']:>+10.1%}  {status}")
+    return "\n".join(lines)
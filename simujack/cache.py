@@ -0,0 +1,128 @@
+"""On-disk cache of campaign results.
+
+A seeded campaign always returns the same results, so run_multiple_simulations(..., cache=ResultCache()) looks
+them up before simulating anything and stores them afterwards. Entries are JSON files named after the SHA-256 of
+their key, which covers everything the results depend on:
+
+- the campaign: bankroll, unit size, number of simulations, seed and max_hands
+- the strategy: its qualified name, its source code and default arguments (streak_cap of the reverse Martingale),
+  and the arguments bound with functools.partial
+- the table rules: the shoe factory and its arguments, and every cell of the strategy chart
+- the engine version, a hash of the source of the simujack package, so any change to the code starts a fresh cache
+
+The cache is bounded to `max_bytes`; storing an entry evicts the least recently used ones until it fits.
+"""
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from simujack.checkpoint import campaign_key
+
+CACHE_VERSION = 1
+package_dir = Path(__file__).resolve().parent
+engine_hash = None
+
+
+def default_cache_dir():
+    """Returns $XDG_CACHE_HOME/simujack, ~/.cache/simujack when XDG_CACHE_HOME is not set."""
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "simujack"
+
+
+def engine_version():
+    """Returns a hash of every source file and chart of the simujack package, computed once per process."""
+    global engine_hash
+    if engine_hash is None:
+        digest = hashlib.sha256()
+        for path in sorted(package_dir.rglob("*")):
+            if path.suffix in (".py", ".txt") and "__pycache__" not in path.parts:
+                digest.update(path.relative_to(package_dir).as_posix().encode())
+                digest.update(path.read_bytes())
+        engine_hash = digest.hexdigest()
+    return engine_hash
+
+
+def code_fingerprint(func):
+    """Returns a hash of what a callable does: its source (or bytecode) and default arguments."""
+    if hasattr(func, "func"):  # functools.partial, the bound arguments are part of describe_callable()
+        return code_fingerprint(func.func)
+    digest = hashlib.sha256()
+    try:
+        digest.update(inspect.getsource(func).encode())
+    except (OSError, TypeError):
+        code = getattr(func, "__code__", None)
+        digest.update(repr(func).encode() if code is None else code.co_code)
+    digest.update(repr(getattr(func, "__defaults__", None)).encode())
+    digest.update(repr(getattr(func, "__kwdefaults__", None)).encode())
+    return digest.hexdigest()
+
+
+def result_key(bankroll, unit_size, num_simulations, strategy_func, shoe_factory, chart, seed, max_hands,
+               rng="random"):
+    """Returns the cache key of a campaign as a JSON-ready dict."""
+    key = campaign_key(bankroll, unit_size, num_simulations, strategy_func, shoe_factory, chart, seed, max_hands,
+                       rng)
+    key["strategy_code"] = code_fingerprint(strategy_func)
+    key["shoe_code"] = code_fingerprint(shoe_factory)
+    key["engine"] = engine_version()
+    key["cache_version"] = CACHE_VERSION
+    return key
+
+
+class ResultCache:
+    def __init__(self, directory=None, max_bytes=64 * 1024 * 1024):
+        self.directory = Path(directory) if directory is not None else default_cache_dir()
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def path(self, key):
+        digest = hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()
+        return self.directory / f"{digest}.json"
+
+    def get(self, key):
+        """Returns the cached results for `key`, or None."""
+        path = self.path(key)
+        try:
+            with open(path) as entry_file:
+                entry = json.load(entry_file)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        if entry.get("key") != key:  # a hash collision or a damaged file
+            self.misses += 1
+            return None
+        os.utime(path)  # mark it recently used
+        self.hits += 1
+        return entry["results"]
+
+    def put(self, key, results):
+        """Stores results under `key`, then evicts the least recently used entries beyond max_bytes."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.path(key)
+        # A temporary file of its own, so processes storing the same key at once never write into the same file
+        with tempfile.NamedTemporaryFile("w", dir=self.directory, suffix=".tmp", delete=False) as entry_file:
+            json.dump({"key": key, "results": results}, entry_file)
+        os.replace(entry_file.name, path)
+        self.evict()
+
+    def evict(self):
+        entries = []
+        for path in self.directory.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:  # removed by another process
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self):
+        for path in self.directory.glob("*.json"):
+            path.unlink(missing_ok=True)
@@ -0,0 +1,145 @@
+"""Compact integer card encoding for long simulation runs.
+
+A card is a small integer code, suit_index * 13 + rank_index (0-51), so a 6-deck shoe is a 312 byte array('B')
+instead of 312 Card objects. Hand totals come from a precomputed transition table instead of a values[card.rank]
+lookup plus an Ace string compare on every card. Card objects are only kept as shared, read-only views (one per
+code) for display and logging, so dealing never creates a Card.
+
+This saves memory, not time: hands still hold a list of the shared views so the strategies and printing can use
+them, and an ArrayShoe plays about as many hands per second as a Shoe, since shuffling and the play loop cost far
+more than a card lookup. For speed use the NumPy random streams (rng="pcg64") or the batch engine.
+
+Use it by handing an ArrayShoe to the simulation runners, e.g.
+    run_multiple_simulations(bankroll, unit_size, num_simulations, strategy_func, shoe_factory=ArrayShoe)
+"""
+import random
+from array import array
+from itertools import accumulate
+
+from simujack.engine import Card, Hand, Shoe, suits, ranks, values
+from simujack.strategy import HAND_STATES, MAX_TOTAL, hand_state
+
+# One shared Card per code, used whenever a card has to be shown
+CARD_VIEWS = tuple(Card(suit, rank) for suit in suits for rank in ranks)
+
+# Blackjack value (2-11) and rank index (0-12) of every card code
+CARD_VALUES = bytes(values[card.rank] for card in CARD_VIEWS)
+CARD_RANKS = bytes(code % len(ranks) for code in range(len(CARD_VIEWS)))
+
+# Code of every (suit, rank), the numbering shared with the hand history format of simujack.history
+CARD_CODES = {(card.suit, card.rank): code for code, card in enumerate(CARD_VIEWS)}
+
+
+def card_code(suit, rank):
+    """Returns the integer code of the card with the given suit and rank."""
+    return CARD_CODES[suit, rank]
+
+
+def card_view(code):
+    """Returns the shared Card object used to display a card code."""
+    return CARD_VIEWS[code]
+
+
+def build_hand_table():
+    """Builds the table giving a hand's next state after drawing a card, indexed by state * 12 + card value.
+
+    A hand is fully described by its total and whether an Ace is still counted as 11 (see simujack.strategy for the
+    state numbering). Follows the same rules as Hand.add_card and Hand.adjust_for_ace.
+    """
+    table = bytearray(HAND_STATES * 12)
+    for total in range(MAX_TOTAL + 1):
+        for soft in (0, 1):
+            for card_value in range(2, 12):
+                new_total = total + card_value
+                aces = soft + (card_value == 11)
+                while new_total > 21 and aces:
+                    new_total -= 10
+                    aces -= 1
+                new_total = min(new_total, MAX_TOTAL)
+                table[hand_state(total, soft) * 12 + card_value] = hand_state(new_total, min(aces, 1))
+    return bytes(table)
+
+
+HAND_TABLE = build_hand_table()
+
+
+class CompactHand(Hand):
+    """A Hand fed with integer card codes, its value and soft Ace come from HAND_TABLE.
+
+    `cards` still holds Card views so strategies, printing and the GUI can use it like any other Hand, the views
+    are shared so adding a card allocates nothing but it costs about as much as Hand.add_card.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.state = 0
+
+    def add_card(self, code):
+        self.cards.append(CARD_VIEWS[code])
+        self.state = state = HAND_TABLE[self.state * 12 + CARD_VALUES[code]]
+        self.value = state >> 1
+        self.aces = state & 1
+
+    def reset(self):
+        self.cards.clear()
+        self.value = 0
+        self.aces = 0
+        self.state = 0
+
+    def split(self, other):
+        super().split(other)
+        self.state = other.state = hand_state(self.value, self.aces)
+
+
+class ArrayShoe(Shoe):
+    """A Shoe holding card codes in an array('B'), dealt by moving a position instead of popping.
+
+    It takes a byte per card instead of a Card object, but deals and shuffles at about the speed of a Shoe.
+    """
+
+    def __init__(self, num_decks=6, penetration=0.75, cut_card=None, reshuffle="cut_card", rng=None,
+                 count_system=None):
+        self.num_decks = num_decks
+        self.rng = random if rng is None else rng
+        self.deck = array("B", range(len(CARD_VIEWS))) * num_decks
+        self.size = len(self.deck)
+        self.position = 0  # index of the next card to deal
+        self.place_cut_card(self.size, penetration, cut_card, reshuffle)
+        self.set_count_system(count_system, tally=False)
+        self.shuffle()
+
+    def __str__(self):
+        return "The deck has:" + "".join(f"\n {CARD_VIEWS[code]}" for code in self.deck[self.position:])
+
+    def shuffle(self):
+        """Puts every card back into the shoe and shuffles it."""
+        # Shuffling a plain list is faster than swapping array items one by one
+        codes = self.deck.tolist()
+        self.rng.shuffle(codes)
+        self.deck = array("B", codes)
+        self.position = 0
+        self.shuffles += 1
+        if self.count_tags is not None:
+            self.tally_counts()
+
+    def cards_dealt(self):
+        return self.position
+
+    def cards_left(self):
+        return self.size - self.position
+
+    def tally_counts(self):
+        code_tags = [self.count_tags[card.rank] for card in CARD_VIEWS]
+        counts = accumulate((code_tags[code] for code in self.deck[self.position:]), initial=0)
+        self.running_counts = [0] * self.position + list(counts)
+
+    def deal(self):
+        position = self.position
+        if position == self.size:
+            self.shuffle()
+            position = 0
+        self.position = position + 1
+        return self.deck[position]
+
+    def new_hand(self):
+        return CompactHand()
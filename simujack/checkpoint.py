@@ -0,0 +1,84 @@
+"""Checkpoint files for long simulation campaigns.
+
+run_multiple_simulations(..., checkpoint="campaign.json") saves its accumulators and the number of finished
+simulations to the file every `checkpoint_interval` seconds, when it is interrupted and when it finishes. Run the
+same call again and it picks up after the last saved simulation.
+
+Nothing about the random streams has to be saved: a checkpointed campaign is always seeded, and simulation number
+n always shuffles with simulation_rng(seed, n, rng), so resuming at simulation n + 1 deals exactly the cards the
+uninterrupted campaign would have. The accumulators are saved exactly (JSON keeps every float bit for bit) and
+results are added in simulation order, so a resumed campaign returns bit-identical results.
+
+A checkpoint only resumes the campaign it was written for, the bankroll, unit size, number of simulations,
+strategy, shoe, chart, seed, max_hands and random stream must match.
+"""
+import json
+import os
+
+CHECKPOINT_VERSION = 1
+
+
+def describe_callable(func):
+    """Names a strategy or shoe factory the same way in every process, functools.partial included."""
+    if hasattr(func, "func"):  # functools.partial
+        arguments = [describe_callable(func.func)] + [repr(arg) for arg in func.args]
+        arguments += [f"{key}={value!r}" for key, value in sorted(func.keywords.items())]
+        return f"partial({', '.join(arguments)})"
+    return f"{getattr(func, '__module__', '')}.{getattr(func, '__qualname__', repr(func))}"
+
+
+def campaign_key(bankroll, unit_size, num_simulations, strategy_func, shoe_factory, chart, seed, max_hands,
+                 rng="random"):
+    """Returns what identifies a campaign in its checkpoint file."""
+    campaign = {
+        "bankroll": bankroll,
+        "unit_size": unit_size,
+        "num_simulations": num_simulations,
+        "strategy": describe_callable(strategy_func),
+        "shoe": describe_callable(shoe_factory),
+        "chart": chart.name,
+        "table": list(chart.table),
+        "seed": seed,
+        "max_hands": max_hands,
+    }
+    # Only set when they are used, so the keys of earlier campaigns still match
+    if rng != "random":
+        campaign["rng"] = rng
+    if chart.pairs is not None or chart.surrender is not None:
+        campaign["rules"] = chart.rules
+        campaign["pairs"] = None if chart.pairs is None else list(chart.pairs)
+        campaign["surrender"] = None if chart.surrender is None else list(chart.surrender)
+    return campaign
+
+
+def save_checkpoint(path, campaign, completed, state):
+    """Atomically replaces the checkpoint at `path`, a crash while saving leaves the previous one intact."""
+    record = {"version": CHECKPOINT_VERSION, "campaign": campaign, "completed": completed, "state": state}
+    temporary = f"{path}.tmp"
+    with open(temporary, "w") as checkpoint_file:
+        json.dump(record, checkpoint_file)
+        checkpoint_file.flush()
+        os.fsync(checkpoint_file.fileno())
+    os.replace(temporary, path)
+
+
+def load_checkpoint(path, campaign):
+    """Returns the saved record for `campaign` from `path`, or None if there is no checkpoint yet.
+
+    When campaign["seed"] is None the saved seed is accepted whatever it is. Raises ValueError if the file belongs
+    to a different campaign.
+    """
+    if not os.path.exists(path):
+        return None
+    with open(path) as checkpoint_file:
+        record = json.load(checkpoint_file)
+    if record.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(f"{path} is not a simulation checkpoint of version {CHECKPOINT_VERSION}")
+    saved = record["campaign"]
+    for key in campaign.keys() | saved.keys():
+        value = campaign.get(key)
+        if key == "seed" and value is None:
+            continue
+        if saved.get(key) != value:
+            raise ValueError(f"{path} is a checkpoint of a different campaign, {key} does not match")
+    return record
@@ -0,0 +1,393 @@
+"""Command line entry point for batch simulations and benchmarks.
+
+    python -m simujack simulate --strategy martingale --bankroll 1000 --unit 10 --runs 100000 \\
+        --workers 16 --seed 42 --format json --output results.json
+
+The results of run_multiple_simulations are written as JSON (one object) or CSV (a header and one row) to --output,
+or to stdout, and nothing else is printed there so the output can be piped straight into other tools.
+
+The sweep command runs a campaign for every cell of a strategy x bankroll x unit size grid and writes one line
+per cell (JSON lines or CSV rows) as soon as the cell is done.
+
+The table command seats up to 7 players with their own strategy, bankroll and unit at one shoe:
+
+    python -m simujack table --seat martingale:1000:10 --seat basic:1000:10 --runs 1000 --seed 42
+
+The replay command deals a corpus of hand outcomes once (or loads it with --corpus) and replays several betting
+strategies over the same hands, a paired comparison on identical luck:
+
+    python -m simujack replay --strategy martingale oscars half-up --bankroll 1000 --unit 10 --sessions 10000 \
+        --hands 20000 --seed 42 --corpus corpus.npz
+
+The bench and compare commands run the benchmark suite of simujack.bench and check it against a stored baseline.
+"""
+import argparse
+import csv
+import functools
+import json
+import os
+import sys
+
+from simujack import bench
+from simujack.cache import ResultCache, default_cache_dir
+from simujack.cards import ArrayShoe
+from simujack.counting import count_systems
+from simujack.engine import Shoe, rng_kinds, run_multiple_simulations, strategies
+from simujack.history import HandHistoryWriter
+from simujack.infinite_shoe import InfiniteShoe
+from simujack.rank_shoe import RankShoe
+from simujack.strategy import load_chart
+from simujack.sweep import sweep
+from simujack.table import MAX_SEATS, run_table_simulations
+
+shoe_types = {"list": Shoe, "array": ArrayShoe, "rank": RankShoe, "infinite": InfiniteShoe}
+
+# Strategies the replay command can bet (simujack.replay.replay_strategies), named here so the other commands
+# don't need NumPy
+replay_strategy_names = ("basic", "martingale", "reverse-martingale", "half-up", "oscars")
+
+
+def positive_int(text):
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+
+def non_negative_int(text):
+    value = int(text)
+    if value < 0:
+        raise argparse.ArgumentTypeError(f"must not be negative, got {value}")
+    return value
+
+
+def positive_float(text):
+    value = float(text)
+    if not value > 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {text}")
+    return value
+
+
+def fraction(text):
+    value = float(text)
+    if not 0 < value <= 1:
+        raise argparse.ArgumentTypeError(f"must be in (0, 1], got {text}")
+    return value
+
+
+def seat(text):
+    """Reads a STRATEGY:BANKROLL:UNIT seat."""
+    fields = text.split(":")
+    if len(fields) != 3 or fields[0] not in strategies:
+        raise argparse.ArgumentTypeError(f"expected STRATEGY:BANKROLL:UNIT with a strategy from {sorted(strategies)}, "
+                                         f"got {text!r}")
+    return fields[0], positive_float(fields[1]), positive_float(fields[2])
+
+
+def add_table_arguments(parser):
+    """Adds the options describing the shoe and the playing strategy."""
+    parser.add_argument("--decks", type=positive_int, default=6, help="decks in the shoe (default 6)")
+    parser.add_argument("--penetration", type=fraction, default=0.75,
+                        help="fraction of the shoe dealt before the cut card (default 0.75)")
+    parser.add_argument("--reshuffle", choices=Shoe.reshuffle_policies, default="cut_card",
+                        help="when the shoe is reshuffled (default cut_card)")
+    parser.add_argument("--shoe", choices=sorted(shoe_types), default="list",
+                        help="shoe backend: a list of Cards, an array of card codes, per-rank counts or an "
+                             "infinite deck (default list)")
+    parser.add_argument("--count-system", choices=sorted(count_systems),
+                        help="card counting system kept by the shoe (default none, hi-lo for true-count betting)")
+    parser.add_argument("--chart", default="basic_strategy",
+                        help="strategy chart file or the name of a bundled chart: basic_strategy (the default) or "
+                             "das_late_surrender, which also splits pairs and surrenders")
+
+
+def add_rng_argument(parser):
+    parser.add_argument("--rng", choices=rng_kinds, default="random",
+                        help="random streams: Python's random module or block-buffered NumPy pcg64 or philox streams, "
+                             "which are faster and always seeded (default random)")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m simujack", description="SimuJack blackjack simulations")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    simulate = commands.add_parser("simulate", help="run betting strategy simulations until bankruptcy")
+    simulate.add_argument("--strategy", choices=sorted(strategies), required=True, help="betting strategy to simulate")
+    simulate.add_argument("--bankroll", type=positive_float, required=True, help="starting bankroll")
+    simulate.add_argument("--unit", type=positive_float, required=True, help="unit bet size")
+    simulate.add_argument("--runs", type=positive_int, default=1, help="number of simulations (default 1)")
+    simulate.add_argument("--workers", type=non_negative_int, default=1,
+                          help="worker processes (default 1), 0 uses every CPU")
+    simulate.add_argument("--seed", type=int, help="seed for reproducible results")
+    add_rng_argument(simulate)
+    simulate.add_argument("--max-hands", type=positive_int, help="stop each simulation after this many hands")
+    simulate.add_argument("--time-budget", type=positive_float, metavar="SECONDS",
+                          help="stop the whole batch after this many seconds, unfinished runs are reported as censored")
+    add_table_arguments(simulate)
+    simulate.add_argument("--history", help="also record every hand to this binary hand history file (workers=1)")
+    simulate.add_argument("--checkpoint", help="save progress to this file and resume from it when it exists")
+    simulate.add_argument("--checkpoint-interval", type=positive_float, default=60, metavar="SECONDS",
+                          help="seconds between checkpoints (default 60)")
+    simulate.add_argument("--cache", nargs="?", const=str(default_cache_dir()), metavar="DIR",
+                          help=f"reuse the results of seeded runs stored in DIR (default {default_cache_dir()})")
+    simulate.add_argument("--timing", action="store_true", help="also report the time spent in each phase of a hand")
+    simulate.add_argument("--format", choices=("json", "csv"), default="json", help="output format (default json)")
+    simulate.add_argument("--output", default="-", help="output file (default stdout)")
+
+    grid = commands.add_parser("sweep", help="run simulations for every strategy x bankroll x unit size")
+    grid.add_argument("--strategy", nargs="+", choices=sorted(strategies), required=True, help="betting strategies")
+    grid.add_argument("--bankroll", nargs="+", type=positive_float, required=True, help="starting bankrolls")
+    grid.add_argument("--unit", nargs="+", type=positive_float, required=True, help="unit bet sizes")
+    grid.add_argument("--runs", type=positive_int, default=100, help="simulations per grid cell (default 100)")
+    grid.add_argument("--workers", type=non_negative_int, default=1,
+                      help="worker processes (default 1), 0 uses every CPU")
+    grid.add_argument("--seed", type=int, help="seed for reproducible results")
+    add_rng_argument(grid)
+    grid.add_argument("--runs-per-unit", type=positive_int, default=4,
+                      help="simulations per work unit handed to a worker (default 4)")
+    grid.add_argument("--max-hands", type=positive_int, help="stop each simulation after this many hands")
+    add_table_arguments(grid)
+    grid.add_argument("--format", choices=("jsonl", "csv"), default="jsonl", help="output format (default jsonl)")
+    grid.add_argument("--output", default="-", help="output file (default stdout)")
+
+    table = commands.add_parser("table", help="run simulations of several players sharing one shoe")
+    table.add_argument("--seat", action="append", type=seat, required=True, metavar="STRATEGY:BANKROLL:UNIT",
+                       help=f"a player at the table, repeat for up to {MAX_SEATS} seats")
+    table.add_argument("--runs", type=positive_int, default=1, help="number of simulations (default 1)")
+    table.add_argument("--workers", type=non_negative_int, default=1,
+                       help="worker processes (default 1), 0 uses every CPU")
+    table.add_argument("--seed", type=int, help="seed for reproducible results")
+    add_rng_argument(table)
+    table.add_argument("--max-hands", type=positive_int, help="stop each simulation after this many rounds")
+    add_table_arguments(table)
+    table.add_argument("--format", choices=("json", "csv"), default="json",
+                       help="output format (default json), CSV has one row per seat")
+    table.add_argument("--output", default="-", help="output file (default stdout)")
+
+    corpus = commands.add_parser("replay", help="replay betting strategies over one corpus of hand outcomes")
+    corpus.add_argument("--strategy", nargs="+", choices=replay_strategy_names, required=True,
+                        help="betting strategies, the paired differences are taken against the first one")
+    corpus.add_argument("--bankroll", type=positive_float, required=True, help="starting bankroll")
+    corpus.add_argument("--unit", type=positive_float, required=True, help="unit bet size")
+    corpus.add_argument("--sessions", type=positive_int, default=1000, help="sessions in the corpus (default 1000)")
+    corpus.add_argument("--hands", type=positive_int, default=10_000,
+                        help="hands per session in the corpus (default 10000), longer sessions are censored")
+    corpus.add_argument("--seed", type=int, help="seed for a reproducible corpus")
+    corpus.add_argument("--decks", type=positive_int, default=6, help="decks in the shoe (default 6)")
+    corpus.add_argument("--penetration", type=fraction, default=0.75,
+                        help="fraction of the shoe dealt before the cut card (default 0.75)")
+    corpus.add_argument("--corpus", help="load the corpus from this .npz file, or save the new one there")
+    corpus.add_argument("--format", choices=("json", "csv"), default="json",
+                        help="output format (default json), CSV has one row per strategy")
+    corpus.add_argument("--output", default="-", help="output file (default stdout)")
+
+    benchmark = commands.add_parser("bench", help="time the engine and store the results as a JSON baseline")
+    add_bench_arguments(benchmark)
+    benchmark.add_argument("--seed", type=int, default=bench.DEFAULT_SEED,
+                           help=f"shoe seed (default {bench.DEFAULT_SEED})")
+    benchmark.add_argument("--output", default="-", help="results file (default stdout)")
+
+    compare = commands.add_parser("compare", help="compare benchmark results against a stored baseline")
+    compare.add_argument("baseline", help="baseline results file written by the bench command")
+    compare.add_argument("current", nargs="?", help="results file to compare, the benchmarks are run when omitted")
+    compare.add_argument("--threshold", type=fraction, default=bench.DEFAULT_THRESHOLD,
+                         help="slowdown that counts as a regression (default 0.1 = 10%%)")
+    add_bench_arguments(compare)
+    return parser
+
+
+def add_bench_arguments(parser):
+    parser.add_argument("--only", nargs="+", choices=list(bench.benchmarks), metavar="NAME",
+                        help=f"benchmarks to run (default all): {', '.join(bench.benchmarks)}")
+    parser.add_argument("--repeat", type=positive_int, default=3,
+                        help="timings per benchmark, the best one counts (default 3)")
+
+
+def run_benchmarks(names, seed, repeat):
+    """Runs benchmarks reporting progress on stderr, so stdout only gets the results."""
+    def progress(name, result):
+        print(f"{name}: {result['rate']:,.0f} {result['unit']}/s", file=sys.stderr)
+
+    return bench.run_benchmarks(names, seed=seed, repeat=repeat, progress=progress)
+
+
+def shoe_factory_from_args(args):
+    return functools.partial(shoe_types[args.shoe], num_decks=args.decks, penetration=args.penetration,
+                             reshuffle=args.reshuffle, count_system=args.count_system)
+
+
+def flatten(results, prefix=""):
+    """Flattens nested dicts into one level, {"max_bankroll": {"mean": 1.0}} becomes {"max_bankroll_mean": 1.0}."""
+    flat = {}
+    for key, value in results.items():
+        if isinstance(value, dict):
+            flat.update(flatten(value, f"{prefix}{key}_"))
+        else:
+            flat[f"{prefix}{key}"] = value
+    return flat
+
+
+def write_results(record, output_format, output):
+    """Writes a result record to the output path ("-" for stdout) as JSON or CSV."""
+    stream = sys.stdout if output == "-" else open(output, "w", newline="")
+    try:
+        if output_format == "json":
+            json.dump(record, stream, indent=2)
+            stream.write("\n")
+        else:
+            row = flatten(record)
+            writer = csv.DictWriter(stream, fieldnames=list(row))
+            writer.writeheader()
+            writer.writerow(row)
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+
+
+def simulate(args):
+    if args.workers == 0:
+        args.workers = os.cpu_count() or 1
+    if args.history and args.workers > 1:
+        raise SystemExit("--history can only be used with --workers 1")
+    parameters = {
+        "strategy": args.strategy,
+        "bankroll": args.bankroll,
+        "unit_size": args.unit,
+        "num_simulations": args.runs,
+        "workers": args.workers,
+        "num_decks": args.decks,
+        "penetration": args.penetration,
+        "reshuffle": args.reshuffle,
+        "shoe": args.shoe,
+        "chart": args.chart,
+        "max_hands": args.max_hands,
+        "time_budget": args.time_budget,
+        "rng": args.rng,
+    }
+    options = dict(shoe_factory=shoe_factory_from_args(args), workers=args.workers, seed=args.seed, rng=args.rng,
+                   chart=load_chart(args.chart), verbose=False, timing=args.timing,
+                   max_hands=args.max_hands, time_budget=args.time_budget, checkpoint=args.checkpoint,
+                   checkpoint_interval=args.checkpoint_interval,
+                   cache=None if args.cache is None else ResultCache(args.cache))
+    if args.history:
+        with HandHistoryWriter(args.history) as history:
+            results = run_multiple_simulations(args.bankroll, args.unit, args.runs, strategies[args.strategy],
+                                               history=history, **options)
+    else:
+        results = run_multiple_simulations(args.bankroll, args.unit, args.runs, strategies[args.strategy], **options)
+    write_results({"parameters": parameters, "results": results}, args.format, args.output)
+
+
+def benchmark(args):
+    record = run_benchmarks(args.only, args.seed, args.repeat)
+    if args.output == "-":
+        json.dump(record, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        bench.save_results(record, args.output)
+
+
+def compare(args):
+    """Prints the comparison table, exits with status 1 if any benchmark regressed or is missing."""
+    baseline = bench.load_results(args.baseline)
+    if args.only:
+        baseline["results"] = {name: baseline["results"][name] for name in args.only if name in baseline["results"]}
+    if args.current:
+        current = bench.load_results(args.current)
+    else:
+        # Run what the baseline measured, with its seed, so both did the same work
+        names = [name for name in baseline["results"] if name in bench.benchmarks]
+        current = run_benchmarks(names, baseline["seed"], args.repeat)
+    rows = bench.compare_results(baseline, current, args.threshold)
+    print(bench.format_comparison(rows))
+    if any(row["status"] in ("regression", "missing") for row in rows):
+        raise SystemExit(1)
+
+
+def run_sweep(args):
+    """Writes each grid cell as soon as it is done, flushing so the results can be followed while the sweep runs."""
+    workers = args.workers or os.cpu_count() or 1
+    cells = sweep(args.bankroll, args.unit, args.strategy, args.runs, workers=workers, seed=args.seed,
+                  runs_per_unit=args.runs_per_unit, shoe_factory=shoe_factory_from_args(args),
+                  chart=load_chart(args.chart), max_hands=args.max_hands, rng=args.rng)
+    stream = sys.stdout if args.output == "-" else open(args.output, "w", newline="")
+    try:
+        writer = None
+        for cell in cells:
+            if args.format == "jsonl":
+                stream.write(json.dumps(cell) + "\n")
+            else:
+                row = flatten(cell)
+                if writer is None:
+                    writer = csv.DictWriter(stream, fieldnames=list(row))
+                    writer.writeheader()
+                writer.writerow(row)
+            stream.flush()
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+
+
+def run_table(args):
+    if len(args.seat) > MAX_SEATS:
+        raise SystemExit(f"A table has at most {MAX_SEATS} seats, got {len(args.seat)}")
+    results = run_table_simulations(args.seat, args.runs, shoe_factory=shoe_factory_from_args(args),
+                                    workers=args.workers or os.cpu_count() or 1, seed=args.seed,
+                                    chart=load_chart(args.chart), max_hands=args.max_hands, rng=args.rng)
+    if args.format == "json":
+        write_results(results, "json", args.output)
+        return
+    stream = sys.stdout if args.output == "-" else open(args.output, "w", newline="")
+    try:
+        writer = None
+        for number, seat_results in enumerate(results["seats"], 1):
+            row = flatten({"seat": number, **seat_results})
+            if writer is None:
+                writer = csv.DictWriter(stream, fieldnames=list(row))
+                writer.writeheader()
+            writer.writerow(row)
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+
+
+def run_replay(args):
+    from simujack.replay import HandCorpus, compare_progressions, generate_corpus  # needs NumPy
+
+    if args.corpus and os.path.exists(args.corpus):
+        corpus = HandCorpus.load(args.corpus)  # the corpus options are those it was generated with
+    else:
+        corpus = generate_corpus(args.sessions, args.hands, num_decks=args.decks, penetration=args.penetration,
+                                 seed=args.seed)
+        if args.corpus:
+            corpus.save(args.corpus)
+    results = compare_progressions(corpus, args.bankroll, args.unit, args.strategy)
+    results["parameters"].update(bankroll=args.bankroll, unit_size=args.unit)
+    if args.format == "json":
+        write_results(results, "json", args.output)
+        return
+    # One row per strategy, the first one has no paired difference columns filled in
+    rows = [flatten({"strategy": strategy, **results["parameters"], **summary,
+                     "paired": results["paired"].get(strategy, {})})
+            for strategy, summary in results["strategies"].items()]
+    stream = sys.stdout if args.output == "-" else open(args.output, "w", newline="")
+    try:
+        writer = csv.DictWriter(stream, fieldnames=list(dict.fromkeys(key for row in rows for key in row)))
+        writer.writeheader()
+        writer.writerows(rows)
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+
+
+commands = {"simulate": simulate, "sweep": run_sweep, "table": run_table, "replay": run_replay, "bench": benchmark,
+            "compare": compare}
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        commands[args.command](args)
+    except (OSError, ValueError) as error:
+        raise SystemExit(f"error: {error}")
+    return 0
@@ -0,0 +1,28 @@
+"""Card counting tag systems.
+
+A count system gives every rank a tag, the running count is the sum of the tags of the cards dealt since the last
+shuffle, and the true count is the running count per deck still in the shoe. Shoe(count_system="hi-lo") keeps
+both (see Shoe.running_count and Shoe.true_count), any dict of rank -> tag works as a custom system.
+"""
+
+count_systems = {
+    # 2-6 count +1, 7-9 nothing, tens and Aces -1
+    "hi-lo": {"2": 1, "3": 1, "4": 1, "5": 1, "6": 1, "7": 0, "8": 0, "9": 0,
+              "10": -1, "J": -1, "Q": -1, "K": -1, "A": -1},
+    # Knock-Out: Hi-Lo with the 7 counted as well, so the count is unbalanced
+    "ko": {"2": 1, "3": 1, "4": 1, "5": 1, "6": 1, "7": 1, "8": 0, "9": 0,
+           "10": -1, "J": -1, "Q": -1, "K": -1, "A": -1},
+    "hi-opt-i": {"2": 0, "3": 1, "4": 1, "5": 1, "6": 1, "7": 0, "8": 0, "9": 0,
+                 "10": -1, "J": -1, "Q": -1, "K": -1, "A": 0},
+    "omega-ii": {"2": 1, "3": 1, "4": 2, "5": 2, "6": 2, "7": 1, "8": 0, "9": -1,
+                 "10": -2, "J": -2, "Q": -2, "K": -2, "A": 0},
+}
+
+
+def count_tags(count_system):
+    """Returns the rank -> tag dict of a count system given by name or as a dict."""
+    if isinstance(count_system, str):
+        if count_system not in count_systems:
+            raise ValueError(f"Unknown count system {count_system!r}, expected one of {list(count_systems)}")
+        return count_systems[count_system]
+    return dict(count_system)
@@ -0,0 +1,115 @@
+"""Exact probabilities of the dealer's final total.
+
+play_dealer_turn can only be sampled. dealer_probabilities() instead enumerates every way the dealer can draw out
+of a given shoe composition and returns the exact chance of ending on 17, 18, 19, 20, 21 or busting, with the
+dealer standing on all 17s like the engine does.
+
+A shoe composition is a tuple of 10 card counts ordered by card value, 2, 3, ..., 9, ten-valued cards, Ace (see
+full_composition()), or None for an infinite deck. Results are kept in a bounded LRU cache keyed on the upcard
+and the composition, so repeated questions about the same shoe are a dictionary lookup.
+"""
+from functools import lru_cache
+
+from simujack.engine import values
+
+# The order of the probabilities returned by dealer_probabilities
+DEALER_OUTCOMES = (17, 18, 19, 20, 21, "bust")
+
+# Card values in composition order, the ten-valued cards share one bucket
+card_values = tuple(range(2, 12))
+infinite_deck = (4, 4, 4, 4, 4, 4, 4, 4, 16, 4)  # per 52 cards, used as weights when composition is None
+
+
+def full_composition(num_decks=6):
+    """Returns the composition of a full shoe of num_decks decks."""
+    return tuple(count * num_decks for count in infinite_deck)
+
+
+def composition_of(cards):
+    """Returns the composition of a sequence of Card objects, e.g. the cards left in a Shoe (shoe.deck)."""
+    counts = [0] * len(card_values)
+    for card in cards:
+        counts[values[card.rank] - 2] += 1
+    return tuple(counts)
+
+
+def remove_card(composition, card_value):
+    """Returns the composition left after a card of card_value is dealt from it."""
+    index = card_value - 2
+    if not composition[index]:
+        raise ValueError(f"No card of value {card_value} left in the shoe")
+    return composition[:index] + (composition[index] - 1,) + composition[index + 1:]
+
+
+def add_to_total(total, soft, card_value):
+    """Adds a card to a hand total the way Hand.add_card does, returns the new (total, soft)."""
+    total += card_value
+    aces = soft + (card_value == 11)
+    while total > 21 and aces:
+        total -= 10
+        aces -= 1
+    return total, min(aces, 1)
+
+
+# add_to_total for every (total, soft, card value) a drawing hand can be in, indexed by total * 24 + soft * 12 + value
+next_totals = [add_to_total(index // 24, index // 12 % 2, index % 12) for index in range(22 * 24)]
+
+# Where a final total lands in DEALER_OUTCOMES
+outcome_index = {total: total - 17 if total <= 21 else len(DEALER_OUTCOMES) - 1 for total in range(17, 32)}
+
+
+def draw_weights(composition):
+    """Returns (card value, probability, composition after the draw) for every card that can be drawn."""
+    if composition is None:
+        return [(card_value, count / 52, None) for card_value, count in zip(card_values, infinite_deck)]
+    cards_left = sum(composition)
+    if not cards_left:
+        raise ValueError("The shoe ran out of cards")
+    return [(card_value, count / cards_left, remove_card(composition, card_value))
+            for card_value, count in zip(card_values, composition) if count]
+
+
+def dealer_outcomes(total, soft, composition, memo):
+    """Probabilities of the dealer's final total from a hand of (total, soft) with `composition` left to draw."""
+    if total >= 17:
+        outcome = [0.0] * len(DEALER_OUTCOMES)
+        outcome[outcome_index[total]] = 1.0
+        return outcome
+    key = (total, soft, composition)
+    if key in memo:
+        return memo[key]
+    outcome = [0.0] * len(DEALER_OUTCOMES)
+    row = total * 24 + soft * 12
+    for card_value, probability, remaining in draw_weights(composition):
+        new_total, new_soft = next_totals[row + card_value]
+        if new_total >= 17:
+            outcome[outcome_index[new_total]] += probability  # the dealer stands, no need to recurse
+        else:
+            drawn = dealer_outcomes(new_total, new_soft, remaining, memo)
+            outcome = [o + probability * p for o, p in zip(outcome, drawn)]
+    memo[key] = outcome
+    return outcome
+
+
+@lru_cache(maxsize=4096)
+def dealer_probabilities(upcard_value, composition=None, no_blackjack=False):
+    """Returns the exact probabilities of the dealer ending on each of DEALER_OUTCOMES.
+
+    `upcard_value` is 2-11 (Ace = 11) and `composition` the cards left in the shoe once the upcard has been dealt,
+    as a tuple (see full_composition), or None for an infinite deck. With no_blackjack=True the result is
+    conditioned on the dealer not having a blackjack, which is what the player faces whenever the hand gets played
+    out. A dealer blackjack otherwise counts as 21.
+    """
+    total, soft = add_to_total(0, 0, upcard_value)
+    memo = {}
+    outcome = [0.0] * len(DEALER_OUTCOMES)
+    weight = 0.0
+    for card_value, probability, remaining in draw_weights(composition):
+        if no_blackjack and upcard_value + card_value == 21:
+            continue  # this hole card would have been a blackjack
+        weight += probability
+        for index, p in enumerate(dealer_outcomes(*add_to_total(total, soft, card_value), remaining, memo)):
+            outcome[index] += probability * p
+    if not weight:
+        raise ValueError("Every hole card left in the shoe gives the dealer a blackjack")
+    return tuple(p / weight for p in outcome)
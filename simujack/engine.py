@@ -0,0 +1,1165 @@
+"""Blackjack simulation engine used by the SimuJack GUI.
+
+Everything in this module is pure Python and never imports pygame, so the
+simulations and betting strategies can be run from scripts, worker processes
+or tests on machines without a display.
+"""
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate
+
+from simujack.cache import result_key
+from simujack.checkpoint import campaign_key, load_checkpoint, save_checkpoint
+from simujack.counting import count_tags
+from simujack.progressions import (
+    DEFAULT_BET_SPREAD, HalfUp, Martingale, Oscars, ReverseMartingale, TrueCount, make_progression
+)
+from simujack.stats import SummaryStats
+from simujack.strategy import BASIC_STRATEGY_CHART, DOUBLE, HIT, action_names
+from simujack.survival import SurvivalStats
+from simujack.timing import PhaseTimer
+
+# created for cards, taken from original
+suits = ("Spades", "Clubs", "Hearts", "Diamonds")
+ranks = ("2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A")
+values = {
+    "2": 2, "3": 3, "4": 4, "5": 5, "6": 6, "7": 7, "8": 8, "9": 9,
+    "10": 10, "J": 10, "Q": 10, "K": 10, "A": 11
+}
+
+
+# CLASS DEFINTIONS (Card and Deck and Hand taken from original):
+
+
+class Card:
+    def __init__(self, suit, rank):
+        self.suit = suit
+        self.rank = rank
+
+    def __str__(self):
+        return f"{self.rank} of {self.suit}"
+
+
+class Deck:
+    def __init__(self, num_decks=6):
+        self.num_decks = num_decks
+        self.deck = []
+        for _ in range(self.num_decks):
+            for suit in suits:
+                for rank in ranks:
+                    self.deck.append(Card(suit, rank))
+
+    def __str__(self):
+        return "The deck has:" + "".join(f"\n {card}" for card in self.deck)
+
+    def shuffle(self):
+        random.shuffle(self.deck)
+
+    def deal(self):
+        return self.deck.pop()
+
+    def new_hand(self):
+        """Returns an empty hand that can hold the cards this deck deals."""
+        return Hand()
+
+
+class Shoe(Deck):
+    """A multi-deck shoe that is shuffled once and dealt down to a cut card before being reshuffled.
+
+    The cut card sits after `penetration` of the shoe (or at the explicit `cut_card` position, counted in cards
+    dealt). `reshuffle` picks the policy used by start_round():
+        "cut_card"   - reshuffle before a round once the cut card has come out (how casinos deal a shoe)
+        "every_hand" - reshuffle before every round (the old behaviour of building a new Deck per hand)
+    Shuffles use `rng` (anything with a shuffle method, e.g. a seeded random.Random), the global random module by
+    default.
+
+    With a `count_system` (a name from simujack.counting.count_systems such as "hi-lo", or a rank -> tag dict) the
+    shoe also keeps the running count of the cards dealt since the shuffle. Every shuffle adds the tags up along
+    the new card order once, so running_count() and true_count() are a list lookup and deal() does no extra work.
+    """
+
+    reshuffle_policies = ("cut_card", "every_hand")
+
+    def __init__(self, num_decks=6, penetration=0.75, cut_card=None, reshuffle="cut_card", rng=None,
+                 count_system=None):
+        super().__init__(num_decks)
+        self.all_cards = tuple(self.deck)  # the cards are built once and reused by every reshuffle
+        self.rng = random if rng is None else rng
+        self.place_cut_card(len(self.all_cards), penetration, cut_card, reshuffle)
+        self.set_count_system(count_system, tally=False)
+        self.shuffle()
+
+    def place_cut_card(self, shoe_size, penetration, cut_card, reshuffle):
+        """Validates the reshuffle options and sets the cut card position for a shoe of shoe_size cards."""
+        if reshuffle not in self.reshuffle_policies:
+            raise ValueError(f"Unknown reshuffle policy {reshuffle!r}, expected one of {self.reshuffle_policies}")
+        if cut_card is None:
+            cut_card = int(shoe_size * penetration)
+        if not 0 < cut_card <= shoe_size:
+            raise ValueError(f"Cut card must be between 1 and {shoe_size}, got {cut_card}")
+        self.cut_card = cut_card
+        self.reshuffle = reshuffle
+        self.shuffles = 0  # number of times the shoe has been shuffled
+
+    def shuffle(self):
+        """Puts every card back into the shoe and shuffles it."""
+        self.deck = list(self.all_cards)
+        self.rng.shuffle(self.deck)
+        self.shuffles += 1
+        if self.count_tags is not None:
+            self.tally_counts()
+
+    def cards_dealt(self):
+        return len(self.all_cards) - len(self.deck)
+
+    def cards_left(self):
+        return len(self.deck)
+
+    def set_count_system(self, count_system, tally=True):
+        """Starts (or with None stops) keeping the count with a count system, from the next card dealt on."""
+        self.count_tags = None
+        self.running_counts = None
+        if count_system is not None:
+            self.count_tags = count_tags(count_system)
+            missing = [rank for rank in ranks if rank not in self.count_tags]
+            if missing:
+                raise ValueError(f"The count system has no tag for {missing}")
+            if tally:
+                self.tally_counts()
+
+    def tally_counts(self):
+        """Adds up the tags in dealing order, running_counts[n] is the running count once n cards are dealt."""
+        tags = self.count_tags
+        counts = accumulate((tags[card.rank] for card in reversed(self.deck)), initial=0)
+        self.running_counts = [0] * self.cards_dealt() + list(counts)
+
+    def running_count(self):
+        """Returns the running count of the cards dealt since the last shuffle."""
+        return self.running_counts[self.cards_dealt()]
+
+    def decks_remaining(self):
+        return self.cards_left() / 52
+
+    def true_count(self):
+        """Returns the running count per remaining deck, never dividing by less than half a deck."""
+        return self.running_count() / max(self.decks_remaining(), 0.5)
+
+    def needs_shuffle(self):
+        """Returns True if the shoe should be reshuffled before the next round."""
+        dealt = self.cards_dealt()
+        return dealt >= self.cut_card or (self.reshuffle == "every_hand" and dealt > 0)
+
+    def start_round(self):
+        """Called before dealing a new round, reshuffles the shoe if the reshuffle policy asks for it."""
+        if self.needs_shuffle():
+            self.shuffle()
+
+    def deal(self):
+        # Running out mid-round only happens with a very deep cut card, reshuffle the whole shoe and carry on
+        if not self.deck:
+            self.shuffle()
+        return self.deck.pop()
+
+
+class Hand:
+    def __init__(self):
+        self.cards = []  # start with an empty list as we did in the Deck class
+        self.value = 0  # start with zero value
+        self.aces = 0  # add an attribute to keep track of aces
+
+    def add_card(self, card):
+        self.cards.append(card)
+        self.value += values[card.rank]
+        if card.rank == "A":
+            self.aces += 1  # Add to self.aces
+        self.adjust_for_ace()  # Ensure Ace adjustment happens immediately
+
+    def reset(self):
+        """Empties the hand so it can be reused for the next round."""
+        self.cards.clear()
+        self.value = 0
+        self.aces = 0
+
+    def adjust_for_ace(self):
+        while self.value > 21 and self.aces:
+            self.value -= 10
+            self.aces -= 1
+
+    def split(self, other):
+        """Moves the second card of a pair into `other`, both hands are left holding one card."""
+        card = self.cards.pop()
+        other.reset()
+        other.cards.append(card)
+        for hand in (self, other):
+            hand.value = values[card.rank]
+            hand.aces = int(card.rank == "A")
+
+    def __str__(self):
+        return ", ".join(str(card) for card in self.cards)
+
+
+def hit(deck, hand):
+    """Adds a card to the player's hand, adjusts if the card happens to be an Ace"""
+    hand.add_card(deck.deal())
+    hand.adjust_for_ace()
+
+
+def is_blackjack(hand):
+    """Returns True if the hand is a blackjack (value = 21 with exactly 2 cards)."""
+    return hand.value == 21 and len(hand.cards) == 2
+
+
+def is_pair(hand):
+    """Returns True if the hand is two cards of the same value, so any two ten-valued cards make a pair."""
+    cards = hand.cards
+    return len(cards) == 2 and values[cards[0].rank] == values[cards[1].rank]
+
+
+def determine_result(player_hand, dealer_hand, bankroll, bet):
+    """Determines the result of the game and updates the bankroll."""
+    if dealer_hand.value > 21 or player_hand.value > dealer_hand.value:
+        result = "Win"
+        bankroll += bet * 2  # Winning payout
+    elif player_hand.value == dealer_hand.value:
+        result = "Push"
+        bankroll += bet  # Add the bet back on a push
+    else:
+        result = "Lose"
+    return result, bankroll
+
+
+def print_hand_results(hands_played, result, player_hand, dealer_hand, bankroll, bet, doubled=False):
+    """Prints the full results of a hand in a single-line format."""
+    player_cards = ", ".join([str(card) for card in player_hand.cards])
+    dealer_cards = ", ".join([str(card) for card in dealer_hand.cards])
+
+    # Add "(Doubled)" to the bet if it was doubled
+    bet_info = f"${bet}"
+    if doubled:
+        bet_info += " (Doubled)"
+
+    print(
+        f"Hand {hands_played + 1}: {result} | "
+        f"Bet: {bet_info} | Updated Bankroll: ${bankroll} | "
+        f"Player's Hand: [{player_cards}] (Score: {player_hand.value}) | "
+        f"Dealer's Hand: [{dealer_cards}] (Score: {dealer_hand.value})"
+    )
+
+
+def play_dealer_turn(deck, dealer_hand):
+    """Plays the dealer's turn according to dealer rules."""
+    while dealer_hand.value < 17:
+        dealer_hand.add_card(deck.deal())
+
+
+def simulate_player_turn(deck, player_hand, dealer_upcard, bankroll, bet, chart=BASIC_STRATEGY_CHART):
+    """Simulates the player's turn using basic strategy (or another StrategyChart)."""
+    doubled = False  # Tracks if the player doubled
+    table = chart.table
+    upcard_value = values[dealer_upcard.rank]
+    while player_hand.value <= 21:
+        action = table[(player_hand.value * 2 + player_hand.aces) * 12 + upcard_value]
+        if action == HIT:
+            player_hand.add_card(deck.deal())
+        elif action == DOUBLE and len(player_hand.cards) == 2 and bankroll >= bet:
+            bankroll -= bet
+            bet *= 2
+            player_hand.add_card(deck.deal())
+            doubled = True  # Mark that the player doubled
+            break  # Doubling ends the player's turn
+        else:  # Stand
+            break
+
+    return bankroll, bet, doubled
+
+
+def play_split_hands(deck, hands, bets, doubled, dealer_upcard, bankroll, bet, chart=BASIC_STRATEGY_CHART):
+    """Splits the pair in hands[0] and plays every hand it turns into with `chart`, under the chart's rules.
+
+    `hands` is the runner's preallocated hand stack, chart.rules["max_hands"] hands long, and each hand's stake and
+    whether it doubled go into the `bets` and `doubled` lists of the same length, so a split round allocates
+    nothing either. The caller has checked that the chart splits this pair and that the bankroll covers the extra
+    bet. Pairs dealt to a split hand are split again while the stack has room and the bankroll covers another bet.
+    Returns (bankroll, number of hands).
+    """
+    rules = chart.rules
+    table = chart.table
+    max_hands = rules["max_hands"]
+    double_after_split = rules["double_after_split"]
+    aces = hands[0].cards[0].rank == "A"
+    resplit = rules["resplit_aces"] or not aces
+    one_card = aces and not rules["hit_split_aces"]  # split Aces get one card each
+    upcard_value = values[dealer_upcard.rank]
+
+    hands[0].split(hands[1])
+    bankroll -= bet
+    bets[0] = bets[1] = bet
+    count = 2
+    index = 0
+    while index < count:  # resplitting adds hands to play
+        hand = hands[index]
+        doubled[index] = False
+        hand.add_card(deck.deal())
+        while resplit and count < max_hands and bankroll >= bet and is_pair(hand):
+            hand.split(hands[count])
+            bankroll -= bet
+            bets[count] = bet
+            count += 1
+            hand.add_card(deck.deal())
+        while not one_card and hand.value <= 21:
+            action = table[(hand.value * 2 + hand.aces) * 12 + upcard_value]
+            if action == HIT:
+                hand.add_card(deck.deal())
+            elif action == DOUBLE and double_after_split and len(hand.cards) == 2 and bankroll >= bet:
+                bankroll -= bet
+                bets[index] += bet
+                doubled[index] = True
+                hand.add_card(deck.deal())
+                break  # Doubling ends the hand
+            else:  # Stand
+                break
+        index += 1
+    return bankroll, count
+
+
+def settle_split_hands(hands, bets, count, dealer_hand):
+    """Settles the first `count` hands of a split round, returns (amount paid back, list of hand results).
+
+    A two-card 21 after a split is not a blackjack and pays even money.
+    """
+    paid = 0
+    results = []
+    for index in range(count):
+        hand = hands[index]
+        if hand.value > 21:
+            results.append("Lose")
+        elif dealer_hand.value > 21 or hand.value > dealer_hand.value:
+            results.append("Win")
+            paid += bets[index] * 2
+        elif hand.value == dealer_hand.value:
+            results.append("Push")
+            paid += bets[index]
+        else:
+            results.append("Lose")
+    return paid, results
+
+
+def play_split_round(deck, hands, bets, doubled, dealer_hand, bankroll, bet, chart, hands_played, print_hands=False,
+                     history=None, timer=None):
+    """Plays out a round whose pair gets split: the player's hands, the dealer and the settlement.
+
+    Takes the runners' hand stack and bookkeeping lists (see play_split_hands), prints and records one line per
+    hand, all under the round's hand number, and laps `timer` like an unsplit round. Returns (bankroll, result),
+    the round counts as a "Win", "Push" or "Lose" by what it paid back against the total stake.
+    """
+    bankroll, count = play_split_hands(deck, hands, bets, doubled, dealer_hand.cards[0], bankroll, bet, chart)
+    if timer is not None:
+        timer.lap("player_turn")
+    if any(hands[index].value <= 21 for index in range(count)):
+        play_dealer_turn(deck, dealer_hand)
+        if timer is not None:
+            timer.lap("dealer_turn")
+    paid, results = settle_split_hands(hands, bets, count, dealer_hand)
+    bankroll += paid
+    stake = sum(bets[:count])
+    result = "Win" if paid > stake else "Push" if paid == stake else "Lose"
+    if timer is not None:
+        timer.lap("settle")
+    for index in range(count):
+        if print_hands:
+            print_hand_results(hands_played, results[index], hands[index], dealer_hand, bankroll, bets[index],
+                               doubled[index])
+        if history is not None:
+            history.write(hands_played, results[index], hands[index], dealer_hand, bankroll, bets[index],
+                          doubled[index])
+    if timer is not None:
+        if print_hands:
+            timer.lap("print_hand_results")
+        if history is not None:
+            timer.lap("history")
+    return bankroll, result
+
+
+def play_split_or_surrender(deck, hands, bets, doubled, dealer_hand, bankroll, bet, chart, hands_played,
+                            print_hands=False, history=None, timer=None):
+    """Plays a round the chart splits or surrenders, for charts whose rules allow either.
+
+    The player's two cards are hands[0]. A pair the chart splits is played out by play_split_round, a hand the
+    chart surrenders gets half the bet back and is printed and recorded like any other settled hand. Returns
+    (bankroll, result), the result None when the chart does neither and the round is played as usual.
+    """
+    hand = hands[0]
+    upcard_value = values[dealer_hand.cards[0].rank]
+    if (chart.pairs is not None and bankroll >= bet and is_pair(hand)
+            and chart.pairs[values[hand.cards[0].rank] * 12 + upcard_value]):
+        return play_split_round(deck, hands, bets, doubled, dealer_hand, bankroll, bet, chart, hands_played,
+                                print_hands, history, timer)
+    if chart.surrender is None or not chart.surrender[(hand.value * 2 + hand.aces) * 12 + upcard_value]:
+        return bankroll, None
+    bankroll += bet / 2  # Half the bet comes back
+    if timer is not None:
+        timer.lap("settle")
+    if print_hands:
+        print_hand_results(hands_played, "Surrender", hand, dealer_hand, bankroll, bet)
+        if timer is not None:
+            timer.lap("print_hand_results")
+    if history is not None:
+        history.write(hands_played, "Surrender", hand, dealer_hand, bankroll, bet)
+        if timer is not None:
+            timer.lap("history")
+    return bankroll, "Surrender"
+
+
+# Dealer upcards against which basic strategy splits each pair (by card value), and the extra ones when doubling
+# after a split is allowed
+PAIR_SPLITS = {
+    2: (4, 5, 6, 7), 3: (4, 5, 6, 7), 4: (), 5: (), 6: (3, 4, 5, 6), 7: (2, 3, 4, 5, 6, 7),
+    8: (2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 9: (2, 3, 4, 5, 6, 8, 9), 10: (), 11: (2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+}
+PAIR_SPLITS_DAS = {2: (2, 3), 3: (2, 3), 4: (5, 6), 6: (2,)}
+
+
+def basic_strategy(player_hand, dealer_upcard, can_split=False, double_after_split=True, can_surrender=False):
+    """Uses basic blackjack strategy to determine if the player should hit, stand, or double their bet.
+
+    With can_split=True pairs are checked against the pair table first and "Split" is returned where basic strategy
+    splits, and with can_surrender=True the first two cards are surrendered ("Surrender") where late surrender
+    pays: hard 16 against 9, 10 or Ace and hard 15 against a 10. The simulations play the same decisions from the
+    compiled BASIC_STRATEGY_CHART (das_late_surrender.txt for splits and surrender), chart_mismatches() checks
+    that the two agree.
+    """
+    dealer_upcard_value = values[dealer_upcard.rank]
+    total = player_hand.value
+
+    if can_split and is_pair(player_hand):
+        pair_value = values[player_hand.cards[0].rank]
+        if dealer_upcard_value in PAIR_SPLITS[pair_value] or (
+                double_after_split and dealer_upcard_value in PAIR_SPLITS_DAS.get(pair_value, ())):
+            return "Split"
+    if can_surrender and not player_hand.aces and (
+            total == 16 and dealer_upcard_value >= 9 or total == 15 and dealer_upcard_value == 10):
+        return "Surrender"
+
+    # Soft hand (contains Ace counted as 11)
+    if player_hand.aces > 0 and total <= 21:
+        # Soft total adjustments for strategy
+        if total >= 19:
+            return "Stand"
+        elif total == 18:
+            return "Double" if 2 <= dealer_upcard_value <= 6 else "Stand" if dealer_upcard_value in [7, 8] else "Hit"
+        elif total == 17:
+            return "Double" if 3 <= dealer_upcard_value <= 6 else "Hit"
+        elif total in [16, 15]:
+            return "Double" if 4 <= dealer_upcard_value <= 6 else "Hit"
+        elif total in [14, 13]:
+            return "Double" if 5 <= dealer_upcard_value <= 6 else "Hit"
+
+    # Hard hand (no Ace counted as 11 or Ace adjusted to 1)
+    if total >= 17:
+        return "Stand"
+    elif 13 <= total <= 16:
+        return "Stand" if 2 <= dealer_upcard_value <= 6 else "Hit"
+    elif total == 12:
+        return "Stand" if 4 <= dealer_upcard_value <= 6 else "Hit"
+    elif total == 11:
+        return "Double"
+    elif total == 10:
+        return "Double" if 2 <= dealer_upcard_value <= 9 else "Hit"
+    elif total == 9:
+        return "Double" if 3 <= dealer_upcard_value <= 6 else "Hit"
+    else:
+        return "Hit"
+
+
+def chart_mismatches(chart=BASIC_STRATEGY_CHART):
+    """Compares every cell of a strategy chart with basic_strategy().
+
+    Returns a list of (total, soft, upcard value, chart action, basic_strategy action) for the cells that differ,
+    an empty list means the chart plays exactly like basic_strategy(). Charts that split or surrender are compared
+    with the pair table and surrender decisions under the chart's rules, a pair shows up as its two-card total.
+    """
+    upcards = {}
+    for rank in ranks:
+        upcards.setdefault(values[rank], Card(suits[0], rank))
+    can_surrender = chart.surrender is not None
+
+    mismatches = []
+    hand = Hand()
+    for total in range(4, 22):
+        for soft in (0, 1):
+            if soft and total < 12:
+                continue  # a soft hand is at least A + A
+            hand.value = total
+            hand.aces = soft
+            for upcard_value, upcard in upcards.items():
+                if chart.surrenders(total, soft, upcard_value):
+                    chart_action = "Surrender"
+                else:
+                    chart_action = action_names[chart.action(total, soft, upcard_value)]
+                expected = basic_strategy(hand, upcard, can_surrender=can_surrender)
+                if chart_action != expected:
+                    mismatches.append((total, soft, upcard_value, chart_action, expected))
+
+    if chart.pairs is not None:
+        double_after_split = chart.rules["double_after_split"]
+        for card in upcards.values():
+            hand.reset()
+            hand.add_card(card)
+            hand.add_card(card)
+            pair_value = values[card.rank]
+            for upcard_value, upcard in upcards.items():
+                chart_action = "Split" if chart.splits(pair_value, upcard_value) else "No split"
+                expected = basic_strategy(hand, upcard, can_split=True, double_after_split=double_after_split)
+                if (chart_action == "Split") != (expected == "Split"):
+                    mismatches.append((hand.value, hand.aces, upcard_value, chart_action, expected))
+    return mismatches
+
+
+# Random streams a campaign can shuffle with: Python's Mersenne Twister or a simujack.rng.BlockRNG bit generator
+rng_kinds = ("random", "pcg64", "philox")
+
+
+def simulation_rng(seed, sim, rng="random"):
+    """Returns the random stream of simulation number `sim` in a campaign seeded with `seed`.
+
+    The stream only depends on the seed and the simulation number, so a seeded campaign gives the same results
+    whichever process runs each simulation. `rng` picks the generator, one of rng_kinds: "random" is a
+    random.Random, the others a block-buffered NumPy stream, child `sim` of the seed (see simujack.rng).
+    """
+    if rng == "random":
+        return random.Random(f"{seed}:{sim}")
+    if rng not in rng_kinds:
+        raise ValueError(f"Unknown random stream {rng!r}, expected one of {list(rng_kinds)}")
+    from simujack.rng import BlockRNG  # NumPy is only needed for these streams
+    return BlockRNG(seed, rng, spawn_key=(sim,))
+
+
+# Hands played between two looks at the clock when a run has a deadline
+DEADLINE_CHECK_HANDS = 1024
+
+
+def check_caps(hands_played, max_hands, deadline):
+    """Checks a run's caps, returns (why it has to stop or None, the hand count at which to check again).
+
+    `deadline` is a time.monotonic() value. The clock is only read every DEADLINE_CHECK_HANDS hands.
+    """
+    if max_hands is not None and hands_played >= max_hands:
+        return "max_hands", None
+    if deadline is not None and time.monotonic() >= deadline:
+        return "time_budget", None
+    next_check = hands_played + DEADLINE_CHECK_HANDS if deadline is not None else math.inf
+    if max_hands is not None:
+        next_check = min(next_check, max_hands)
+    return None, next_check
+
+
+def run_one_simulation(job):
+    """Runs a single simulation of a campaign and returns its results.
+
+    `job` is (bankroll, unit_size, strategy_func, shoe_factory, chart, seed, rng, sim, print_hands, history, timing,
+    max_hands, deadline). This is a module level function taking one tuple so it can be sent to worker processes.
+    Returns None without playing when the campaign's deadline passed before the simulation got to start.
+    """
+    (bankroll, unit_size, strategy_func, shoe_factory, chart, seed, rng, sim, print_hands, history, timing,
+     max_hands, deadline) = job
+    if deadline is not None and time.monotonic() >= deadline:
+        return None
+    timer = PhaseTimer() if timing else None
+    shoe = shoe_factory() if seed is None else shoe_factory(rng=simulation_rng(seed, sim, rng))
+    if timer is not None:
+        timer.lap("shoe")
+    if history is not None:
+        history.simulation = sim
+    # Check if `strategy_func` is a full simulation function
+    if strategy_func == run_basic_strategy_simulation:
+        # Run directly if it's a simulation function
+        return strategy_func(bankroll, unit_size, print_hands=print_hands, shoe=shoe, chart=chart, history=history,
+                             timer=timer, max_hands=max_hands, deadline=deadline)
+    # Otherwise, treat it as a betting progression or strategy function
+    return run_simulation_with_strategy(bankroll, unit_size, strategy_func, print_hands=print_hands, shoe=shoe,
+                                        chart=chart, history=history, timer=timer, max_hands=max_hands,
+                                        deadline=deadline)
+
+
+def summarize_campaign(hands_stats, max_bankroll_stats, survival, skipped, seed, rng="random"):
+    """Builds the result dict of a campaign from its accumulators."""
+    return {
+        "median_hands_to_bankruptcy": survival.median() if survival.censored_count else hands_stats.median(),
+        "median_max_bankroll": max_bankroll_stats.median(),
+        "hands_to_bankruptcy": hands_stats.summary(),
+        "max_bankroll": max_bankroll_stats.summary(),
+        "runs": {"bankrupt": survival.bankrupt_count, "censored": survival.censored_count, "skipped": skipped},
+        "survival": survival.summary(),
+        "seed": seed,
+        "rng": rng,
+    }
+
+
+def run_multiple_simulations(bankroll, unit_size, num_simulations, strategy_func, shoe_factory=Shoe, workers=1,
+                             seed=None, chart=BASIC_STRATEGY_CHART, history=None, verbose=True, timing=False,
+                             max_hands=None, time_budget=None, checkpoint=None, checkpoint_interval=60, cache=None,
+                             infinite_deck=False, rng="random"):
+    """Runs a simulation multiple times and calculates median hands to bankruptcy and max bankroll.
+
+    Every simulation gets its own shoe from `shoe_factory` (pass e.g. functools.partial(Shoe, penetration=0.8)
+    or functools.partial(Shoe, reshuffle="every_hand") to change the table's shoe), and every hand is played
+    with `chart` (a StrategyChart from simujack.strategy.load_chart).
+
+    With `workers` > 1 the simulations are spread over a pool of worker processes. When a `seed` is given each
+    simulation shuffles with its own stream from simulation_rng(), so the results are reproducible whatever the
+    number of workers. Parallel runs without a seed pick a random one, it is returned with the results.
+    `rng` picks the generator of those streams: "random" (random.Random), or "pcg64" or "philox" for
+    block-buffered NumPy streams (see simujack.rng), which shuffle faster and always get a seed, so any one
+    simulation can be replayed alone from the recorded "seed" and "rng".
+
+    With verbose=False nothing is printed (a single simulation otherwise prints its hands, several print one line
+    per simulation). Every hand is recorded to `history` (a simujack.history.HandHistoryWriter) when one is given,
+    this only works for runs in a single process. With timing=True the results also hold "timings", the time
+    spent in each phase of a hand added up over every simulation (see simujack.timing).
+
+    Besides the medians the results hold count, mean, stdev, min, p5, median, p95 and max of both measures, kept
+    in SummaryStats accumulators (exact up to 10,000 simulations, within 0.5% beyond that).
+
+    Every simulation stops after `max_hands` hands, and the whole campaign after `time_budget` seconds: running
+    simulations are stopped and the ones that have not started yet are skipped. Stopped simulations are censored,
+    they had not gone bankrupt yet. "runs" counts the bankrupt, censored and skipped simulations, and "survival"
+    holds Kaplan-Meier estimates of the hands to bankruptcy (see simujack.survival). With censored runs the
+    median hands to bankruptcy comes from that estimate, None if fewer than half the runs were seen going bankrupt,
+    while "hands_to_bankruptcy" summarizes the hands every run played.
+
+    With a `checkpoint` path the campaign's progress is saved there every `checkpoint_interval` seconds, when it
+    is interrupted and when it finishes, and a campaign that finds its own checkpoint resumes from it and returns
+    the same results as if it had never stopped (see simujack.checkpoint). Checkpointed campaigns are always
+    seeded. When the time budget runs out the checkpoint keeps the simulations finished before the first one the
+    budget cut short, so the next call plays the rest.
+
+    With a `cache` (a simujack.cache.ResultCache) seeded campaigns are looked up there first and stored after
+    they ran. Campaigns recording a history, timing themselves or running on a time budget are never cached.
+
+    infinite_deck=True deals every simulation from a simujack.infinite_shoe.InfiniteShoe, much faster for
+    comparing betting systems but without card removal effects.
+    """
+    if infinite_deck:
+        if shoe_factory is not Shoe:
+            raise ValueError("Pass either infinite_deck=True or a shoe_factory, not both")
+        from simujack.infinite_shoe import InfiniteShoe  # it imports this module
+        shoe_factory = InfiniteShoe
+    if history is not None and workers > 1:
+        raise ValueError("Hand histories can only be recorded when the simulations run with workers=1")
+    if rng not in rng_kinds:
+        raise ValueError(f"Unknown random stream {rng!r}, expected one of {list(rng_kinds)}")
+    cache_key = None
+    if cache is not None and seed is not None and history is None and not timing and time_budget is None:
+        cache_key = result_key(bankroll, unit_size, num_simulations, strategy_func, shoe_factory, chart, seed,
+                               max_hands, rng)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    # Streaming accumulators keep memory bounded however many simulations run
+    hands_stats = SummaryStats()
+    max_bankroll_stats = SummaryStats()
+    survival = SurvivalStats()
+    skipped = 0
+    timer = PhaseTimer() if timing else None
+    completed = 0  # simulations already added to the accumulators
+
+    campaign = None
+    if checkpoint is not None:
+        campaign = campaign_key(bankroll, unit_size, num_simulations, strategy_func, shoe_factory, chart, seed,
+                                max_hands, rng)
+        saved = load_checkpoint(checkpoint, campaign)
+        if saved is not None:
+            seed = saved["campaign"]["seed"]
+            completed = saved["completed"]
+            state = saved["state"]
+            hands_stats = SummaryStats.from_state(state["hands_to_bankruptcy"])
+            max_bankroll_stats = SummaryStats.from_state(state["max_bankroll"])
+            survival = SurvivalStats.from_state(state["survival"])
+            skipped = state["skipped"]
+            if timer is not None and state["timings"] is not None:
+                timer.add_report(state["timings"])
+    if seed is None and (workers > 1 or checkpoint is not None or rng != "random"):
+        seed = random.randrange(2 ** 63)  # the global random state is not shared with the workers or saved
+    if campaign is not None:
+        campaign["seed"] = seed
+
+    def save(completed):
+        state = {
+            "hands_to_bankruptcy": hands_stats.state(),
+            "max_bankroll": max_bankroll_stats.state(),
+            "survival": survival.state(),
+            "skipped": skipped,
+            "timings": None if timer is None else timer.report(),
+        }
+        save_checkpoint(checkpoint, campaign, completed, state)
+
+    print_hands = verbose and num_simulations == 1
+    deadline = None if time_budget is None else time.monotonic() + time_budget
+    jobs = ((bankroll, unit_size, strategy_func, shoe_factory, chart, seed, rng, sim, print_hands, history, timing,
+             max_hands, deadline) for sim in range(completed + 1, num_simulations + 1))
+    saving = checkpoint is not None
+    next_save = time.monotonic() + checkpoint_interval
+    adding = False  # set while a result is half added, the accumulators must not be saved then
+
+    pool = None
+    if workers > 1:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        all_results = pool.map(run_one_simulation, jobs, chunksize=max(1, num_simulations // (workers * 16)))
+    else:
+        all_results = map(run_one_simulation, jobs)
+
+    try:
+        for sim, results in enumerate(all_results, completed + 1):
+            if saving and (results is None or results["stop"] == "time_budget"):
+                # Later calls should play this simulation in full, keep the checkpoint from before it
+                save(completed)
+                saving = False
+            if results is None:  # the time budget ran out before this simulation started
+                skipped += 1
+                continue
+            adding = True
+            hands_stats.add(results["hands_played"])
+            max_bankroll_stats.add(results["max_bankroll"])
+            survival.add(results["hands_played"], results["censored"])
+            if timer is not None:
+                timer.add_report(results["timings"])
+            completed = sim
+            adding = False
+            if saving and time.monotonic() >= next_save:
+                save(completed)
+                next_save = time.monotonic() + checkpoint_interval
+
+            # Print per-simulation results for multiple simulations
+            if verbose and num_simulations > 1:
+                print(
+                    f"Simulation {sim}: Hands to Bankruptcy = {results['hands_played']}, "
+                    f"Max Bankroll = ${results['max_bankroll']:.2f}"
+                    + (f" (stopped by {results['stop']})" if results["censored"] else "")
+                )
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+        if saving and not adding:
+            save(completed)
+
+    if not hands_stats.count:
+        raise ValueError("The time budget ran out before any simulation started")
+    summary = summarize_campaign(hands_stats, max_bankroll_stats, survival, skipped, seed, rng)
+    if timer is not None:
+        summary["timings"] = timer.report()
+    if cache_key is not None:
+        cache.put(cache_key, summary)
+    return summary
+
+
+def run_simulation_with_strategy(bankroll, unit_size, strategy_func, print_hands=True, shoe=None,
+                                 chart=BASIC_STRATEGY_CHART, history=None, timer=None, max_hands=None,
+                                 deadline=None):
+    """Runs simulation with betting strategy until the bankroll is empty.
+
+    Cards come from `shoe`, a new 6-deck Shoe dealt to its cut card when none is given, and the hands are played
+    with `chart`. Every hand is recorded to `history` (a simujack.history.HandHistoryWriter) when one is given.
+    The run also stops after `max_hands` hands or once time.monotonic() passes `deadline`, the results then say
+    it was censored and why in "stop" ("bankrupt" otherwise).
+    With a `timer` (a simujack.timing.PhaseTimer) the time of every phase of a hand is added up and returned
+    under "timings".
+
+    `strategy_func` is a betting progression class from simujack.progressions or a strategy function, which is
+    called with the bankroll, unit size, win and lose streaks, last result and total wins. Either way it is told
+    the result of every hand. Strategies that bet on the count (see simujack.progressions.uses_true_count) also get
+    the shoe's true count before each round, a shoe that does not count yet is switched to Hi-Lo.
+    """
+    if timer is not None:
+        timer.start()
+    if shoe is None:
+        shoe = Shoe(num_decks=6)
+        if timer is not None:
+            timer.lap("shoe")
+    progression = make_progression(strategy_func, unit_size)
+    counting = progression.uses_true_count
+    if counting and shoe.count_tags is None:
+        shoe.set_count_system("hi-lo")
+    # The hands are reused for every round, the player's stack holds every hand a split round can make
+    player_hands = [shoe.new_hand() for _ in range(chart.rules["max_hands"])]
+    player_hand = player_hands[0]
+    dealer_hand = shoe.new_hand()
+    hand_bets = [0] * len(player_hands)
+    hand_doubled = [False] * len(player_hands)
+    pairs = chart.pairs
+    surrender = chart.surrender
+
+    hands_played = 0
+    max_bankroll = bankroll
+    stop = None
+    next_check = math.inf if max_hands is None and deadline is None else 0
+
+    while bankroll > 0:  # Run until bankroll is depleted
+        if hands_played == next_check:
+            stop, next_check = check_caps(hands_played, max_hands, deadline)
+            if stop is not None:
+                break
+
+        # Reshuffle the shoe if the cut card came out and clear the hands for the new round
+        if timer is None:
+            shoe.start_round()
+        else:
+            shuffles = shoe.shuffles
+            shoe.start_round()
+            if shoe.shuffles != shuffles:
+                timer.lap("shuffle")
+        if counting:
+            progression.true_count = shoe.true_count()  # the bet is placed before this round's cards are seen
+        player_hand.reset()
+        dealer_hand.reset()
+        player_hand.add_card(shoe.deal())
+        player_hand.add_card(shoe.deal())
+        dealer_hand.add_card(shoe.deal())
+        dealer_hand.add_card(shoe.deal())
+        if timer is not None:
+            timer.lap("deal")
+
+        # Get the bet amount from the progression
+        bet = progression.next_bet(bankroll)
+        if bankroll < bet:
+            bet = bankroll  # Bet the remaining bankroll if less than the calculated bet
+        bankroll -= bet
+        doubled = False  # Track whether the bet was doubled
+        if timer is not None:
+            timer.lap("bet")
+
+        # Check for blackjack immediately after dealing
+        blackjack = is_blackjack(player_hand) or is_blackjack(dealer_hand)
+        if timer is not None:
+            timer.lap("is_blackjack")
+        if blackjack:
+            if is_blackjack(player_hand) and is_blackjack(dealer_hand):
+                result = "Push"
+                bankroll += bet  # Return the bet for a push
+            elif is_blackjack(player_hand):
+                result = "Blackjack"
+                bankroll += bet * 2.5  # Correct 3:2 payout for Blackjack
+            elif is_blackjack(dealer_hand):
+                result = "Lose"  # Dealer wins
+            progression.record(result)
+            if timer is not None:
+                timer.lap("settle")
+            if print_hands:
+                print_hand_results(hands_played, result, player_hand, dealer_hand, bankroll, bet)
+                if timer is not None:
+                    timer.lap("print_hand_results")
+            if history is not None:
+                history.write(hands_played, result, player_hand, dealer_hand, bankroll, bet)
+                if timer is not None:
+                    timer.lap("history")
+            hands_played += 1
+            continue  # Skip to the next round
+
+        # Splits and late surrender, only for charts whose rules allow them
+        if pairs is not None or surrender is not None:
+            bankroll, result = play_split_or_surrender(shoe, player_hands, hand_bets, hand_doubled, dealer_hand,
+                                                       bankroll, bet, chart, hands_played, print_hands, history, timer)
+            if result is not None:
+                progression.record(result)
+                max_bankroll = max(max_bankroll, bankroll)
+                hands_played += 1
+                continue
+
+        # Play player's turn
+        bankroll, bet, doubled = simulate_player_turn(shoe, player_hand, dealer_hand.cards[0], bankroll, bet, chart)
+        if timer is not None:
+            timer.lap("player_turn")
+
+        # Check if player busts
+        if player_hand.value > 21:
+            result = "Lose"
+        else:
+            # Dealer's turn
+            play_dealer_turn(shoe, dealer_hand)
+            if timer is not None:
+                timer.lap("dealer_turn")
+
+            # Determine the result
+            if dealer_hand.value > 21 or player_hand.value > dealer_hand.value:
+                result = "Win"
+                bankroll += bet * 2  # Winning payout includes doubled bets
+            elif player_hand.value == dealer_hand.value:
+                result = "Push"
+                bankroll += bet  # Return the bet amount on a push
+            else:
+                result = "Lose"
+        progression.record(result)
+
+        max_bankroll = max(max_bankroll, bankroll)
+        if timer is not None:
+            timer.lap("settle")
+
+        # Print per-hand results only if print_hands is True
+        if print_hands:
+            print_hand_results(hands_played, result, player_hand, dealer_hand, bankroll, bet, doubled)
+            if timer is not None:
+                timer.lap("print_hand_results")
+        if history is not None:
+            history.write(hands_played, result, player_hand, dealer_hand, bankroll, bet, doubled)
+            if timer is not None:
+                timer.lap("history")
+
+        hands_played += 1
+
+    results = {
+        "hands_played": hands_played,
+        "max_bankroll": max_bankroll,
+        "censored": stop is not None,
+        "stop": stop or "bankrupt",
+    }
+    if timer is not None:
+        results["timings"] = timer.report()
+    return results
+
+
+def run_basic_strategy_simulation(bankroll, unit_size, print_hands=True, shoe=None, chart=BASIC_STRATEGY_CHART,
+                                  history=None, timer=None, max_hands=None, deadline=None):
+    """Runs basic strategy simulation witt a never-changing bet size"""
+    if timer is not None:
+        timer.start()
+    if shoe is None:
+        shoe = Shoe(num_decks=6)
+        if timer is not None:
+            timer.lap("shoe")
+    table = chart.table
+    # The hands are reused for every round, the player's stack holds every hand a split round can make
+    player_hands = [shoe.new_hand() for _ in range(chart.rules["max_hands"])]
+    player_hand = player_hands[0]
+    dealer_hand = shoe.new_hand()
+    hand_bets = [0] * len(player_hands)
+    hand_doubled = [False] * len(player_hands)
+    pairs = chart.pairs
+    surrender = chart.surrender
+    hands_played = 0
+    max_bankroll = bankroll
+    stop = None
+    next_check = math.inf if max_hands is None and deadline is None else 0
+
+    while bankroll > 0:  # Continue until the bankroll is depleted
+        if hands_played == next_check:
+            stop, next_check = check_caps(hands_played, max_hands, deadline)
+            if stop is not None:
+                break
+
+        # Reshuffle the shoe if the cut card came out
+        if timer is None:
+            shoe.start_round()
+        else:
+            shuffles = shoe.shuffles
+            shoe.start_round()
+            if shoe.shuffles != shuffles:
+                timer.lap("shuffle")
+
+        # Deal initial hands
+        player_hand.reset()
+        dealer_hand.reset()
+        player_hand.add_card(shoe.deal())
+        player_hand.add_card(shoe.deal())
+        dealer_hand.add_card(shoe.deal())
+        dealer_hand.add_card(shoe.deal())
+
+        # Place the bet
+        bet = unit_size
+        if bankroll < unit_size:
+            bet = bankroll  # Bet the remaining bankroll if it's less than the unit size
+        bankroll -= bet
+        if timer is not None:
+            timer.lap("deal")
+
+        # Check for blackjack immediately after dealing
+        blackjack = is_blackjack(player_hand) or is_blackjack(dealer_hand)
+        if timer is not None:
+            timer.lap("is_blackjack")
+        if blackjack:
+            if is_blackjack(player_hand) and is_blackjack(dealer_hand):
+                result = "Push"
+                bankroll += bet  # Return the bet for a push
+            elif is_blackjack(player_hand):
+                result = "Blackjack"
+                bankroll += bet * 2.5  # Correct 3:2 payout for Blackjack
+            elif is_blackjack(dealer_hand):
+                result = "Lose"  # Dealer wins
+            if timer is not None:
+                timer.lap("settle")
+            if print_hands:
+                print_hand_results(hands_played, result, player_hand, dealer_hand, bankroll, bet)
+                if timer is not None:
+                    timer.lap("print_hand_results")
+            if history is not None:
+                history.write(hands_played, result, player_hand, dealer_hand, bankroll, bet)
+                if timer is not None:
+                    timer.lap("history")
+            hands_played += 1
+            continue  # Skip to the next round
+
+        upcard_value = values[dealer_hand.cards[0].rank]
+
+        # Splits and late surrender, only for charts whose rules allow them
+        if pairs is not None or surrender is not None:
+            bankroll, result = play_split_or_surrender(shoe, player_hands, hand_bets, hand_doubled, dealer_hand,
+                                                       bankroll, bet, chart, hands_played, print_hands, history, timer)
+            if result is not None:
+                max_bankroll = max(max_bankroll, bankroll)
+                hands_played += 1
+                continue
+
+        # Play player's turn
+        doubled = False
+        while player_hand.value <= 21:
+            action = table[(player_hand.value * 2 + player_hand.aces) * 12 + upcard_value]
+            if action == HIT:
+                player_hand.add_card(shoe.deal())
+            elif action == DOUBLE and len(player_hand.cards) == 2 and bankroll >= bet:
+                bankroll -= bet
+                bet *= 2
+                player_hand.add_card(shoe.deal())
+                doubled = True
+                break  # Doubling ends the player's turn
+            else:  # Stand
+                break
+        if timer is not None:
+            timer.lap("player_turn")
+
+        # Check if player busts
+        if player_hand.value > 21:
+            result = "Lose"
+        else:
+            # Dealer's turn
+            while dealer_hand.value < 17:
+                dealer_hand.add_card(shoe.deal())
+            if timer is not None:
+                timer.lap("dealer_turn")
+
+            # Determine the result
+            if dealer_hand.value > 21 or player_hand.value > dealer_hand.value:
+                result = "Win"
+                bankroll += bet * 2  # Player wins
+            elif player_hand.value == dealer_hand.value:
+                result = "Push"
+                bankroll += bet  # Push
+            else:
+                result = "Lose"
+
+        max_bankroll = max(max_bankroll, bankroll)
+        if timer is not None:
+            timer.lap("settle")
+
+        # Print results only if print_hands is True
+        if print_hands:
+            print_hand_results(hands_played, result, player_hand, dealer_hand, bankroll, bet, doubled)
+            if timer is not None:
+                timer.lap("print_hand_results")
+        if history is not None:
+            history.write(hands_played, result, player_hand, dealer_hand, bankroll, bet, doubled)
+            if timer is not None:
+                timer.lap("history")
+
+        hands_played += 1
+
+    results = {
+        "hands_played": hands_played,
+        "max_bankroll": max_bankroll,
+        "censored": stop is not None,
+        "stop": stop or "bankrupt",
+    }
+    if timer is not None:
+        results["timings"] = timer.report()
+    return results
+
+
+def reverse_martingale_strategy(bankroll, unit_size, win_streak, lose_streak, last_result, total_wins, streak_cap=4):
+    """Determines the next bet using the Reverse Martingale strategy"""
+    """Defined from great.com article: For every win along a streak, you double your stake. You get to choose how long your 
+    predetermined streak will be (in this case 4) and how much your initial bet will cost."""
+
+    # Start with the initial unit size
+    current_bet = unit_size
+
+    if last_result == "Lose" or win_streak == 0 or win_streak >= streak_cap:
+        # Reset to the initial unit size on a loss, streak cap, or no streak
+        current_bet = unit_size
+    elif last_result == "Push":
+        # Maintain the same bet on a push
+        pass  # The current bet remains unchanged
+    else:
+        # Progressively increase the bet on a win, doubling based on streak
+        current_bet = unit_size * (2 ** win_streak)
+
+    # Ensure the bet does not exceed the bankroll
+    current_bet = min(current_bet, bankroll)
+
+    return current_bet
+
+
+def martingale_strategy(bankroll, unit_size, win_streak, lose_streak, last_result, total_wins):
+    """Determines the next bet using the Martingale strategy"""
+    """Defined from great.com article: ou start at your minimum wager (let’s say you’re starting at $10, the common minimum 
+    bet in blackjack). After every loss, you double your wager. So, if you’d started betting with $10, then you’d bet 
+    $20, then $40, then $80, and so on if you kept losing. If you do win a hand, you restart the entire process and 
+    bet that $10 minimum on the next hand."""
+
+    # Start with the initial unit size
+    current_bet = unit_size
+    if lose_streak > 0:
+        # Double the bet for each loss in the streak
+        current_bet = unit_size * (2 ** lose_streak)
+    elif last_result == "Push":
+        # Maintain the same bet on a push
+        pass  # The current_bet remains unchanged
+    # Cap the bet to the available bankroll
+    current_bet = min(current_bet, bankroll)
+    return current_bet
+
+
+def half_up_strategy(bankroll, unit_size, win_streak, lose_streak, last_result, total_wins):
+    """Determines the next bet using the Half Up strategy"""
+    """Defined from great.com article: You start with a flat bet, and you bet the same amount until you win two consecutive 
+    hands. Then you’ll increase your bet by 50% of your initial stake."""
+    if last_result == "Lose" or win_streak < 2:
+        # Start over at the initial unit size if a loss occurs or win streak < 2
+        return min(unit_size, bankroll)
+    else:
+        # Increase the bet by 50% of the initial unit size after two consecutive wins
+        next_bet = unit_size + int(unit_size * 0.5 * (win_streak - 1))  # Incremental bet increase
+        # caps the bet to available bankroll
+        return min(next_bet, bankroll)
+
+
+def oscars_system_strategy(bankroll, unit_size, win_streak, lose_streak, last_result, total_wins):
+    """Determines the next bet using the Oscar's System strategy"""
+    """Defined from great.com article: You simply continue to add another unit to every wager if you win or stick to the same 
+    amount if you lose (you do not revert back to your original bet)."""
+    first_bet = unit_size
+
+    # Ensure the bet does not exceed the bankroll, the bet will equal the original unit + an extra unit for every winning bet
+    return min(first_bet + (total_wins * first_bet), bankroll)
+
+
+def true_count_strategy(bankroll, unit_size, win_streak, lose_streak, last_result, total_wins, true_count=0,
+                        spread=DEFAULT_BET_SPREAD):
+    """Determines the next bet from the true count, a 1 to 8 unit spread by default"""
+    """Counters bet the minimum while the count is neutral or negative and raise the bet as the true count climbs,
+    since a shoe rich in tens and Aces favours the player. Pass another spread with functools.partial."""
+    index = min(max(math.floor(true_count), 0), len(spread) - 1)
+    return min(spread[index] * unit_size, bankroll)
+
+
+true_count_strategy.uses_true_count = True
+
+
+# Strategies by the names used on the command line and in batch jobs, the betting systems as progression classes
+strategies = {
+    "basic": run_basic_strategy_simulation,
+    "martingale": Martingale,
+    "reverse-martingale": ReverseMartingale,
+    "half-up": HalfUp,
+    "oscars": Oscars,
+    "true-count": TrueCount,
+}
@@ -0,0 +1,145 @@
+"""Compact binary hand histories.
+
+HandHistoryWriter stores one fixed-width 80 byte record per hand instead of printing a line of text, so full
+histories of very long runs stay small and cheap to write. Pass one to the simulation runners as `history`:
+
+    with HandHistoryWriter("run.sjh") as history:
+        run_multiple_simulations(1000, 10, 100, martingale_strategy, history=history)
+
+The file is a 16 byte header followed by the records, so read_history() can memory-map it as a NumPy structured
+array and every field comes back as a column without any parsing:
+
+    hands = read_history("run.sjh")
+    hands["bankroll"][hands["simulation"] == 3]
+
+Record layout (little-endian, no padding):
+    simulation      uint32      simulation number, set by run_multiple_simulations
+    hand            uint64      hand index within the simulation, starting at 0
+    player_cards    22 x uint8  card codes (see simujack.cards), unused slots are 255
+    dealer_cards    22 x uint8
+    player_total    uint8
+    dealer_total    uint8
+    doubled         uint8       1 if the bet was doubled
+    result          uint8       index into RESULTS, a losing hand over 21 is recorded as a "Bust"
+    bet             float64     total stake on the hand, doubling included
+    bankroll        float64     bankroll after the hand
+    reserved        4 bytes
+
+A hand only takes another card while its total is 21 or less and every card counts at least 1, so no hand ever holds
+more than 22 cards and the card slots fit any hand, whatever the number of decks.
+
+A round whose pair was split writes one record per hand, all with the round's hand index.
+"""
+import struct
+
+from simujack.cards import CARD_CODES
+
+RESULTS = ("Lose", "Push", "Win", "Blackjack", "Bust", "Surrender")
+result_codes = {result: code for code, result in enumerate(RESULTS)}
+
+MAGIC = b"SJHH"
+VERSION = 2
+MAX_CARDS = 22  # the most cards a hand can hold, 21 cards of 1 and the card that busts it
+NO_CARD = 255
+
+header_format = struct.Struct("<4sII4x")
+record_format = struct.Struct(f"<IQ{MAX_CARDS}s{MAX_CARDS}sBBBBdd4x")
+
+
+def history_dtype():
+    """Returns the NumPy dtype of a hand record."""
+    import numpy as np  # only the reader needs NumPy
+
+    return np.dtype([
+        ("simulation", "<u4"),
+        ("hand", "<u8"),
+        ("player_cards", "u1", (MAX_CARDS,)),
+        ("dealer_cards", "u1", (MAX_CARDS,)),
+        ("player_total", "u1"),
+        ("dealer_total", "u1"),
+        ("doubled", "u1"),
+        ("result", "u1"),
+        ("bet", "<f8"),
+        ("bankroll", "<f8"),
+        ("reserved", "V4"),
+    ])
+
+
+def encode_cards(hand):
+    codes = bytes(CARD_CODES[card.suit, card.rank] for card in hand.cards)
+    return codes.ljust(MAX_CARDS, bytes((NO_CARD,)))
+
+
+class HandHistoryWriter:
+    """Writes hand records to a binary file, buffering `buffer_records` records between writes."""
+
+    def __init__(self, path, buffer_records=4096):
+        self.path = path
+        self.file = open(path, "wb")
+        self.file.write(header_format.pack(MAGIC, VERSION, record_format.size))
+        self.buffer = bytearray()
+        self.buffer_size = buffer_records * record_format.size
+        self.simulation = 0
+        self.records = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def write(self, hands_played, result, player_hand, dealer_hand, bankroll, bet, doubled=False):
+        """Records one hand, takes the same arguments as print_hand_results."""
+        if result == "Lose" and player_hand.value > 21:
+            result = "Bust"
+        self.buffer += record_format.pack(
+            self.simulation, hands_played, encode_cards(player_hand), encode_cards(dealer_hand),
+            min(player_hand.value, 255), min(dealer_hand.value, 255), doubled, result_codes[result], bet, bankroll
+        )
+        self.records += 1
+        if len(self.buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        self.file.write(self.buffer)
+        self.buffer.clear()
+        self.file.flush()
+
+    def close(self):
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+
+
+def read_header(path):
+    """Checks the header of a history file and returns the byte offset of the first record."""
+    with open(path, "rb") as history_file:
+        header = history_file.read(header_format.size)
+    if len(header) < header_format.size:
+        raise ValueError(f"{path} is too short to be a hand history")
+    magic, version, record_size = header_format.unpack(header)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a hand history file")
+    if version != VERSION or record_size != record_format.size:
+        raise ValueError(f"{path} has an unsupported hand history version {version}")
+    return header_format.size
+
+
+def read_history(path, mmap=True):
+    """Returns every record of a history file as a NumPy structured array.
+
+    With mmap=True the array is a read-only memory map of the file, records are only read from disk when used.
+    """
+    import numpy as np
+
+    offset = read_header(path)
+    if mmap:
+        return np.memmap(path, dtype=history_dtype(), mode="r", offset=offset)
+    return np.fromfile(path, dtype=history_dtype(), offset=offset)
+
+
+def iter_history(path, chunk_records=1_000_000):
+    """Yields the records of a history file as consecutive structured array chunks of up to chunk_records."""
+    records = read_history(path)
+    for start in range(0, len(records), chunk_records):
+        yield records[start:start + chunk_records]
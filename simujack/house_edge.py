@@ -0,0 +1,95 @@
+"""Exact expected return of basic strategy under the rules the engine plays.
+
+Rules: blackjack pays 3:2 and is settled before anyone acts, the player may double on any two cards (one more card,
+then stand), the dealer stands on all 17s, no splitting or surrender. The player follows a StrategyChart, the built-in
+basic strategy chart by default.
+
+expected_return() walks every combination of player cards, dealer upcard, dealer hole card and later draws out of a
+shoe composition (see simujack.dealer), so the result carries no sampling noise and the Monte Carlo engines can be
+checked against it:
+
+    house_edge(num_decks=6)  # fraction of each unit bet the house keeps
+"""
+from simujack.dealer import add_to_total, dealer_outcomes, draw_weights, full_composition
+from simujack.strategy import BASIC_STRATEGY_CHART, DOUBLE, HIT
+
+
+class ExpectedReturn:
+    """Recursive expected value calculator for one chart, memoized across every hand it evaluates."""
+
+    def __init__(self, chart=BASIC_STRATEGY_CHART):
+        if chart.pairs is not None or chart.surrender is not None:
+            raise ValueError(f"Splits and surrender are not modelled, chart {chart.name!r} uses them")
+        self.chart = chart
+        self.dealer_memo = {}
+        self.player_memo = {}
+
+    def stand(self, player_total, dealer_total, dealer_soft, composition):
+        """Expected value of standing on player_total against a dealer hand drawing from composition."""
+        if player_total > 21:
+            return -1.0
+        outcome = dealer_outcomes(dealer_total, dealer_soft, composition, self.dealer_memo)
+        dealer_bust = outcome[-1]
+        if player_total < 17:
+            return 2 * dealer_bust - 1  # win only when the dealer busts
+        beaten = sum(outcome[:player_total - 17])  # dealer finished below the player
+        lost = sum(outcome[player_total - 16:-1])  # dealer finished above the player
+        return dealer_bust + beaten - lost
+
+    def play(self, total, soft, two_cards, upcard_value, dealer_total, dealer_soft, composition):
+        """Expected value of a player hand played from here with the chart."""
+        if total > 21:
+            return -1.0
+        key = (total, soft, two_cards, upcard_value, dealer_total, dealer_soft, composition)
+        if key in self.player_memo:
+            return self.player_memo[key]
+
+        action = self.chart.action(total, soft, upcard_value)
+        if action == HIT:
+            value = 0.0
+            for card_value, probability, remaining in draw_weights(composition):
+                new_total, new_soft = add_to_total(total, soft, card_value)
+                value += probability * self.play(new_total, new_soft, False, upcard_value, dealer_total,
+                                                 dealer_soft, remaining)
+        elif action == DOUBLE and two_cards:
+            value = 0.0
+            for card_value, probability, remaining in draw_weights(composition):
+                new_total, _ = add_to_total(total, soft, card_value)
+                value += probability * 2 * self.stand(new_total, dealer_total, dealer_soft, remaining)
+        else:  # Stand, doubling after the first two cards stands like in simulate_player_turn
+            value = self.stand(total, dealer_total, dealer_soft, composition)
+
+        self.player_memo[key] = value
+        return value
+
+    def round_value(self, composition):
+        """Expected value of a whole round dealt from composition, in units of the initial bet."""
+        value = 0.0
+        for first, p_first, after_first in draw_weights(composition):
+            for second, p_second, after_second in draw_weights(after_first):
+                total, soft = add_to_total(*add_to_total(0, 0, first), second)
+                for upcard, p_upcard, after_upcard in draw_weights(after_second):
+                    for hole, p_hole, remaining in draw_weights(after_upcard):
+                        probability = p_first * p_second * p_upcard * p_hole
+                        player_blackjack = total == 21
+                        dealer_blackjack = upcard + hole == 21
+                        if player_blackjack or dealer_blackjack:
+                            if player_blackjack and not dealer_blackjack:
+                                value += probability * 1.5
+                            elif dealer_blackjack and not player_blackjack:
+                                value -= probability
+                            continue
+                        dealer_total, dealer_soft = add_to_total(*add_to_total(0, 0, upcard), hole)
+                        value += probability * self.play(total, soft, True, upcard, dealer_total, dealer_soft,
+                                                         remaining)
+        return value
+
+
+def expected_return(composition=None, chart=BASIC_STRATEGY_CHART):
+    """Returns the exact expected return per unit bet of one round dealt from composition (None = infinite deck)."""
+    return ExpectedReturn(chart).round_value(composition)
+
+
+def house_edge(num_decks=6, chart=BASIC_STRATEGY_CHART):
+    """Returns the house edge (the negated expected return) of a freshly shuffled shoe of num_decks decks."""
+    return -expected_return(full_composition(num_decks), chart)
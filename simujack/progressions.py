@@ -0,0 +1,205 @@
+"""Betting progressions as small state machines.
+
+A progression keeps only the state its system needs and is asked for one number per hand:
+
+    progression = Martingale(unit_size=10)
+    bet = progression.next_bet(bankroll)   # never more than the bankroll
+    ...                                    # play the hand
+    progression.record("Lose")             # the hand's result
+
+Results are the names the runners use: "Win" and "Blackjack" count as wins, "Lose" and "Surrender" as losses and
+"Push" leaves the streaks alone. Each class bets exactly like the strategy function of the same name in
+simujack.engine fed with the runners' streak bookkeeping, without rebuilding a six-argument call and recomputing
+the bet from the streaks on every hand.
+
+The runners accept a Progression class (or a functools.partial of one, e.g. partial(ReverseMartingale,
+streak_cap=3)) wherever they accept a strategy function, and make_progression() wraps plain strategy functions in
+a StrategyFunction adapter so both kinds run through the same code. simujack.batch has the batch forms, which
+advance the state of many sessions at once from arrays of net results.
+"""
+import math
+from functools import partial
+
+# Units bet at a true count of 0 or less, 1, 2, ..., the last entry is used for every higher count
+DEFAULT_BET_SPREAD = (1, 1, 2, 4, 6, 8)
+
+
+def uses_true_count(strategy_func):
+    """Returns True if the strategy takes the true count as a 7th argument (functools.partial objects included).
+
+    Progression classes that bet on the count say so the same way, the runners then set their `true_count`
+    attribute before every next_bet() call.
+    """
+    while isinstance(strategy_func, partial):
+        strategy_func = strategy_func.func
+    return getattr(strategy_func, "uses_true_count", False)
+
+
+def is_progression(strategy):
+    """Returns True if `strategy` is a Progression class or a functools.partial of one."""
+    while isinstance(strategy, partial):
+        strategy = strategy.func
+    return isinstance(strategy, type) and issubclass(strategy, Progression)
+
+
+def make_progression(strategy, unit_size):
+    """Returns the progression a runner bets with for one session of `strategy` (a Progression class or a
+    strategy function)."""
+    if is_progression(strategy):
+        return strategy(unit_size)
+    return StrategyFunction(strategy, unit_size)
+
+
+class Progression:
+    """Base class of the betting progressions, flat betting: one unit every hand."""
+
+    uses_true_count = False
+
+    def __init__(self, unit_size):
+        self.unit_size = unit_size
+
+    def __repr__(self):
+        return f"{type(self).__name__}(unit_size={self.unit_size})"
+
+    def next_bet(self, bankroll):
+        """Returns the bet for the next hand, capped to the bankroll."""
+        return min(self.unit_size, bankroll)
+
+    def record(self, result):
+        """Takes the result of the hand that was just played."""
+
+
+class FlatBet(Progression):
+    """Bets one unit every hand whatever happens."""
+
+
+class Martingale(Progression):
+    """Doubles the bet after every loss and goes back to one unit after a win, a push keeps the bet."""
+
+    def __init__(self, unit_size):
+        super().__init__(unit_size)
+        self.bet = unit_size
+
+    def next_bet(self, bankroll):
+        return min(self.bet, bankroll)
+
+    def record(self, result):
+        if result == "Win" or result == "Blackjack":
+            self.bet = self.unit_size
+        elif result != "Push":
+            self.bet *= 2
+
+
+class ReverseMartingale(Progression):
+    """Doubles the bet after every win along a streak, one unit after a loss or a push and once the streak
+    reaches `streak_cap` wins."""
+
+    def __init__(self, unit_size, streak_cap=4):
+        super().__init__(unit_size)
+        self.streak_cap = streak_cap
+        self.win_streak = 0
+        self.bet = unit_size
+
+    def next_bet(self, bankroll):
+        return min(self.bet, bankroll)
+
+    def record(self, result):
+        if result == "Win" or result == "Blackjack":
+            self.win_streak += 1
+            if self.win_streak < self.streak_cap:
+                self.bet = self.unit_size * (2 ** self.win_streak)
+            else:
+                self.bet = self.unit_size
+        elif result == "Push":
+            self.bet = self.unit_size  # the streak goes on, but the next bet is back to one unit
+        else:
+            self.win_streak = 0
+            self.bet = self.unit_size
+
+
+class HalfUp(Progression):
+    """Flat bets until two wins in a row, then adds half a unit (rounded down) for every further win."""
+
+    def __init__(self, unit_size):
+        super().__init__(unit_size)
+        self.win_streak = 0
+        self.bet = unit_size
+
+    def next_bet(self, bankroll):
+        return min(self.bet, bankroll)
+
+    def record(self, result):
+        if result == "Win" or result == "Blackjack":
+            self.win_streak += 1
+            if self.win_streak >= 2:
+                self.bet = self.unit_size + int(self.unit_size * 0.5 * (self.win_streak - 1))
+        elif result != "Push":
+            self.win_streak = 0
+            self.bet = self.unit_size
+
+
+class Oscars(Progression):
+    """Adds a unit to the bet for every win so far and keeps it after a loss."""
+
+    def __init__(self, unit_size):
+        super().__init__(unit_size)
+        self.total_wins = 0
+        self.bet = unit_size
+
+    def next_bet(self, bankroll):
+        return min(self.bet, bankroll)
+
+    def record(self, result):
+        if result == "Win" or result == "Blackjack":
+            self.total_wins += 1
+            self.bet = self.unit_size + self.total_wins * self.unit_size
+
+
+class TrueCount(Progression):
+    """Bets on the true count, spread[count] units (see simujack.engine.true_count_strategy)."""
+
+    uses_true_count = True
+
+    def __init__(self, unit_size, spread=DEFAULT_BET_SPREAD):
+        super().__init__(unit_size)
+        self.spread = spread
+        self.true_count = 0
+
+    def next_bet(self, bankroll):
+        index = min(max(math.floor(self.true_count), 0), len(self.spread) - 1)
+        return min(self.spread[index] * self.unit_size, bankroll)
+
+
+class StrategyFunction(Progression):
+    """Adapts a six-argument strategy function (seven for true count strategies) to the progression protocol by
+    keeping the streaks it is called with."""
+
+    def __init__(self, strategy_func, unit_size):
+        super().__init__(unit_size)
+        self.strategy_func = strategy_func
+        self.uses_true_count = uses_true_count(strategy_func)
+        self.true_count = 0
+        self.win_streak = 0
+        self.lose_streak = 0
+        self.total_wins = 0
+        self.last_result = None
+
+    def __repr__(self):
+        return f"StrategyFunction({self.strategy_func!r}, unit_size={self.unit_size})"
+
+    def next_bet(self, bankroll):
+        if self.uses_true_count:
+            return self.strategy_func(bankroll, self.unit_size, self.win_streak, self.lose_streak, self.last_result,
+                                      self.total_wins, self.true_count)
+        return self.strategy_func(bankroll, self.unit_size, self.win_streak, self.lose_streak, self.last_result,
+                                  self.total_wins)
+
+    def record(self, result):
+        if result == "Win" or result == "Blackjack":
+            self.win_streak += 1
+            self.total_wins += 1
+            self.lose_streak = 0
+        elif result != "Push":
+            self.lose_streak += 1
+            self.win_streak = 0
+        self.last_result = result
@@ -0,0 +1,78 @@
+"""A shoe that only keeps how many cards of each rank are left.
+
+RankShoe stores 13 counts instead of the cards themselves and deals by drawing a rank with probability proportional
+to its count, then taking one off, so it never shuffles: "shuffling" just refills the counts. Memory and setup cost
+are the same for 1 deck or 100, and so is the cost of dealing.
+
+Each draw picks one of the cards left uniformly, r = int(rng.random() * cards left), and walks the 13 counts
+until r falls inside a rank, so every rank comes out exactly in proportion to its remaining count. That is one
+rng.random() call and at most 13 steps per card whatever the number of decks and however deep the shoe is dealt.
+
+Cards come back as shared Card objects, one per rank (all Spades), since suits are not tracked. `rng` only needs a
+random() method (random.Random, the random module, ...).
+
+    run_multiple_simulations(bankroll, unit_size, num_simulations, strategy_func, shoe_factory=RankShoe)
+"""
+import random
+
+from simujack.engine import Card, Hand, Shoe, ranks, suits
+
+
+class RankShoe(Shoe):
+    """A Shoe of per-rank counts, dealt by weighted sampling without replacement."""
+
+    views = tuple(Card(suits[0], rank) for rank in ranks)
+
+    def __init__(self, num_decks=6, penetration=0.75, cut_card=None, reshuffle="cut_card", rng=None,
+                 count_system=None):
+        self.num_decks = num_decks
+        self.rng = random if rng is None else rng
+        self.per_rank = 4 * num_decks
+        self.size = self.per_rank * len(ranks)
+        self.place_cut_card(self.size, penetration, cut_card, reshuffle)
+        self.set_count_system(count_system)
+        self.shuffle()
+
+    def __str__(self):
+        return "The shoe has:" + "".join(f"\n {count} x {rank}" for rank, count in zip(ranks, self.counts))
+
+    def shuffle(self):
+        """Puts every card back into the shoe, no card order is kept so nothing has to be shuffled."""
+        self.counts = [self.per_rank] * len(ranks)
+        self.left = self.size
+        self.shuffles += 1
+
+    def cards_dealt(self):
+        return self.size - self.left
+
+    def cards_left(self):
+        return self.left
+
+    def deal(self):
+        if not self.left:
+            self.shuffle()
+        counts = self.counts
+        remaining = int(self.rng.random() * self.left)
+        for rank_index, count in enumerate(counts):
+            if remaining < count:
+                break
+            remaining -= count
+        counts[rank_index] -= 1
+        self.left -= 1
+        return self.views[rank_index]
+
+    def new_hand(self):
+        return Hand()
+
+    def tally_counts(self):
+        """The count follows from the counts left (so it covers every card dealt since the last shuffle)."""
+        self.rank_tags = [self.count_tags[rank] for rank in ranks]
+
+    def running_count(self):
+        per_rank = self.per_rank
+        return sum(tag * (per_rank - count) for tag, count in zip(self.rank_tags, self.counts))
+
+    def composition(self):
+        """Returns the cards left as a simujack.dealer composition, counts by value 2-9, tens, Ace."""
+        counts = self.counts
+        return tuple(counts[:8]) + (sum(counts[8:12]), counts[12])
@@ -0,0 +1,185 @@
+"""Replays betting progressions over a precomputed corpus of hand outcomes.
+
+How a hand of basic strategy plays out does not depend on the bet, apart from a double the bankroll cannot cover,
+so the cards only need to be simulated once. generate_corpus() plays flat 1 unit hands through the batch engine of
+simujack.batch and keeps three bytes per hand: the net result in half units, whether the player doubled and whether
+they were dealt a blackjack. replay() then bets a progression over every session of the corpus, scaling each
+result by the bet, which is far cheaper than dealing the cards again for every betting system. Every system
+replayed over the same corpus sees exactly the same hands, so comparing them is a paired comparison on identical
+luck:
+
+    corpus = generate_corpus(num_sessions=10_000, num_hands=20_000, seed=42)
+    corpus.save("corpus.npz")
+    results = compare_progressions(corpus, 1000, 10, ["martingale", "oscars", "half-up"])
+    results["strategies"]["oscars"]["median_hands_to_bankruptcy"], results["paired"]["oscars"]["mean"]
+
+A double the bankroll cannot cover is settled as half the doubled result, the hand played for the single bet with
+the card that was doubled on. Playing on instead would hit or stand and change the cards of every later hand, so
+replayed sessions are an approximation wherever that happens. Sessions still alive after the last hand of the
+corpus are censored.
+"""
+import json
+import math
+import random
+
+import numpy as np
+
+from simujack.batch import BatchTable, batch_progressions, make_batch_progression
+from simujack.engine import strategies, summarize_campaign
+from simujack.progressions import FlatBet
+from simujack.stats import SummaryStats
+from simujack.strategy import BASIC_STRATEGY_CHART
+from simujack.survival import SurvivalStats
+
+# Strategies by name that can be replayed, "basic" bets one unit every hand
+replay_strategies = {"basic": FlatBet}
+replay_strategies.update((name, strategy) for name, strategy in strategies.items() if strategy in batch_progressions)
+
+
+class HandCorpus:
+    """The outcomes of flat 1 unit hands, arrays indexed by [hand, session].
+
+    `net` holds the net results in half units (int8, a blackjack is 3), `doubled` and `blackjack` are booleans.
+    """
+
+    def __init__(self, net, doubled, blackjack, seed=None, num_decks=6, penetration=0.75, chart="basic_strategy"):
+        if not net.shape == doubled.shape == blackjack.shape:
+            raise ValueError(f"Corpus arrays differ in shape: {net.shape}, {doubled.shape} and {blackjack.shape}")
+        self.net = net
+        self.doubled = doubled
+        self.blackjack = blackjack
+        self.seed = seed
+        self.num_decks = num_decks
+        self.penetration = penetration
+        self.chart = chart
+
+    def __repr__(self):
+        return f"HandCorpus(num_sessions={self.num_sessions}, num_hands={self.num_hands}, seed={self.seed})"
+
+    @property
+    def num_hands(self):
+        return self.net.shape[0]
+
+    @property
+    def num_sessions(self):
+        return self.net.shape[1]
+
+    def parameters(self):
+        return {"seed": self.seed, "num_decks": self.num_decks, "penetration": self.penetration, "chart": self.chart}
+
+    def save(self, path):
+        """Writes the corpus to a compressed .npz file."""
+        with open(path, "wb") as stream:
+            np.savez_compressed(stream, net=self.net, doubled=self.doubled, blackjack=self.blackjack,
+                                parameters=np.array(json.dumps(self.parameters())))
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            return cls(data["net"], data["doubled"], data["blackjack"], **json.loads(str(data["parameters"])))
+
+
+def generate_corpus(num_sessions, num_hands, num_decks=6, penetration=0.75, seed=None, chart=BASIC_STRATEGY_CHART):
+    """Plays num_hands flat 1 unit hands in each of num_sessions independent shoes and returns their HandCorpus.
+
+    Charts that split or surrender are rejected, like in the batch engine. Without a seed one is picked and
+    recorded in the corpus.
+    """
+    if seed is None:
+        seed = random.randrange(2 ** 63)
+    table = BatchTable(num_sessions, num_decks=num_decks, penetration=penetration, rng=np.random.default_rng(seed),
+                       chart=chart)
+    lanes = np.arange(num_sessions)
+    bankrolls = np.zeros(num_sessions)
+    net = np.zeros((num_hands, num_sessions), dtype=np.int8)
+    doubled = np.zeros((num_hands, num_sessions), dtype=bool)
+    blackjack = np.zeros((num_hands, num_sessions), dtype=bool)
+    for hand in range(num_hands):
+        bankrolls[:] = 2.0  # always enough to double
+        results, doubled[hand], blackjack[hand] = table.play_round(lanes, bankrolls, 1.0)
+        net[hand] = results * 2
+    return HandCorpus(net, doubled, blackjack, seed=seed, num_decks=num_decks, penetration=penetration,
+                      chart=chart.name)
+
+
+def replay(corpus, bankroll, unit_size, progression, max_hands=None):
+    """Bets a progression over every session of the corpus until it is bankrupt or the hands run out.
+
+    `progression` is a progression class with a batch form, a functools.partial of one or its name in
+    replay_strategies. Returns the "hands_played", "max_bankroll" and "censored" flag of every session as arrays,
+    like the batch engine, the max bankroll not being updated on blackjack hands like in the scalar engine.
+    """
+    if isinstance(progression, str):
+        progression = replay_strategies[progression]
+    num_hands = corpus.num_hands if max_hands is None else min(max_hands, corpus.num_hands)
+    progression = make_batch_progression(progression, corpus.num_sessions, unit_size)
+    bankrolls = np.full(corpus.num_sessions, float(bankroll))
+    max_bankroll = bankrolls.copy()
+    hands_played = np.zeros(corpus.num_sessions, dtype=np.int64)
+
+    active = np.flatnonzero(bankrolls > 0)
+    for hand in range(num_hands):
+        if not active.size:
+            break
+        bet = progression.next_bets(active, bankrolls)
+        net = corpus.net[hand, active] / 2
+        # A double the bankroll can't cover is played for the single bet
+        short = corpus.doubled[hand, active] & (bankrolls[active] - bet < bet)
+        net[short] /= 2
+        bankrolls[active] += bet * net
+        progression.record(active, net)
+        settled = active[~corpus.blackjack[hand, active]]
+        max_bankroll[settled] = np.maximum(max_bankroll[settled], bankrolls[settled])
+        hands_played[active] += 1
+        active = active[bankrolls[active] > 0]
+
+    return {
+        "hands_played": hands_played,
+        "max_bankroll": max_bankroll,
+        "censored": bankrolls > 0,
+    }
+
+
+def paired_difference(first, second):
+    """Compares the hands played per session of two replays of the same corpus, first minus second."""
+    difference = (first["hands_played"] - second["hands_played"]).astype(float)
+    return {
+        "mean": float(difference.mean()),
+        "standard_error": float(difference.std(ddof=1) / math.sqrt(difference.size)) if difference.size > 1 else 0.0,
+        "longer": int(np.count_nonzero(difference > 0)),
+        "shorter": int(np.count_nonzero(difference < 0)),
+        "same": int(np.count_nonzero(difference == 0)),
+    }
+
+
+def summarize_replay(corpus, results):
+    """Summarizes a replay like run_multiple_simulations summarizes a campaign."""
+    hands_stats = SummaryStats()
+    max_bankroll_stats = SummaryStats()
+    survival = SurvivalStats()
+    for hands, max_bankroll, censored in zip(results["hands_played"].tolist(), results["max_bankroll"].tolist(),
+                                             results["censored"].tolist()):
+        hands_stats.add(hands)
+        max_bankroll_stats.add(max_bankroll)
+        survival.add(hands, censored)
+    summary = summarize_campaign(hands_stats, max_bankroll_stats, survival, 0, corpus.seed)
+    del summary["rng"]  # the corpus was dealt by its own numpy Generator
+    return summary
+
+
+def compare_progressions(corpus, bankroll, unit_size, progressions, max_hands=None):
+    """Replays several progressions over the same corpus.
+
+    `progressions` holds names from replay_strategies or progression classes. Returns the corpus "parameters",
+    the summary of every strategy under "strategies" and, under "paired", every strategy's paired_difference()
+    against the first one.
+    """
+    labels = [progression if isinstance(progression, str) else getattr(progression, "__name__", repr(progression))
+              for progression in progressions]
+    replays = [replay(corpus, bankroll, unit_size, progression, max_hands=max_hands) for progression in progressions]
+    return {
+        "parameters": {**corpus.parameters(), "num_sessions": corpus.num_sessions, "num_hands": corpus.num_hands},
+        "strategies": {label: summarize_replay(corpus, results) for label, results in zip(labels, replays)},
+        "paired": {label: paired_difference(results, replays[0])
+                   for label, results in zip(labels[1:], replays[1:])},
+    }
@@ -0,0 +1,68 @@
+"""Block-buffered random streams on NumPy Generators.
+
+BlockRNG offers the three methods the shoes use (shuffle, random and choices) on top of a NumPy Generator with a
+PCG64 or Philox bit generator, and fetches the numbers in bulk instead of one Python call per number:
+random() pops floats off a block of `block_size` generated at once, shuffle() applies one generated permutation and
+choices() draws all k indices in one call. Shuffling a 6-deck shoe this way is several times faster than
+random.shuffle.
+
+Streams are built from a numpy SeedSequence, so they can be split into independent child streams. Simulation n of
+a campaign seeded with `seed` uses BlockRNG(seed, spawn_key=(n,)), the stream SeedSequence(seed).spawn() hands its
+n-th child, so any single simulation can be replayed on its own from the recorded seed and its number:
+
+    run_multiple_simulations(1000, 10, 100, martingale_strategy, seed=42, rng="pcg64")
+    shoe = Shoe(rng=BlockRNG(42, spawn_key=(17,)))  # deals exactly what simulation 17 was dealt
+"""
+import numpy as np
+
+bit_generators = {"pcg64": np.random.PCG64, "philox": np.random.Philox}
+
+
+class BlockRNG:
+    def __init__(self, seed=None, bit_generator="pcg64", spawn_key=(), block_size=4096):
+        if bit_generator not in bit_generators:
+            raise ValueError(f"Unknown bit generator {bit_generator!r}, expected one of {list(bit_generators)}")
+        if block_size < 1:
+            raise ValueError(f"block_size must be at least 1, got {block_size}")
+        self.seed_sequence = np.random.SeedSequence(seed, spawn_key=tuple(spawn_key))
+        self.bit_generator = bit_generator
+        self.generator = np.random.Generator(bit_generators[bit_generator](self.seed_sequence))
+        self.block_size = block_size
+        self.floats = []  # unused part of the current block, consumed from the end
+
+    def __repr__(self):
+        return f"BlockRNG(seed={self.seed}, bit_generator={self.bit_generator!r}, spawn_key={self.spawn_key})"
+
+    @property
+    def seed(self):
+        """The root seed, the generated one when the stream was created without a seed."""
+        return self.seed_sequence.entropy
+
+    @property
+    def spawn_key(self):
+        return self.seed_sequence.spawn_key
+
+    def child(self, index):
+        """Returns child stream `index`, independent of this stream and of every other child."""
+        return BlockRNG(self.seed, self.bit_generator, self.spawn_key + (index,), self.block_size)
+
+    def spawn(self, count):
+        """Returns `count` independent child streams, numbered from 0."""
+        return [self.child(index) for index in range(count)]
+
+    def random(self):
+        """Returns the next float in [0, 1)."""
+        floats = self.floats
+        if not floats:
+            floats = self.floats = self.generator.random(self.block_size).tolist()
+        return floats.pop()
+
+    def shuffle(self, items):
+        """Shuffles a list in place."""
+        order = self.generator.permutation(len(items)).tolist()
+        items[:] = [items[index] for index in order]
+
+    def choices(self, population, k=1):
+        """Returns k items drawn uniformly from population with replacement."""
+        indices = self.generator.integers(0, len(population), size=k).tolist()
+        return [population[index] for index in indices]
@@ -0,0 +1,194 @@
+"""Streaming summary statistics with bounded memory.
+
+SummaryStats takes values one at a time and tracks count, mean, variance, min and max exactly (Welford's method),
+plus quantiles such as the median, p5 and p95. Memory stays bounded however many values are added:
+
+- While no more than `exact_limit` values have been added they are all kept, so quantiles are exact and the median
+  is the same as statistics.median() of the values.
+- Past that the values are moved into a log-bucketed histogram (the DDSketch scheme). Bucket i holds the values in
+  (gamma^(i-1), gamma^i] with gamma = (1 + a) / (1 - a), a = relative_accuracy, and reports them as
+  2 * gamma^i / (gamma + 1). Any quantile is then within a relative error of `relative_accuracy` of a true value at
+  that rank (0.5% by default). Values from 1e-9 to 1e12 need fewer than 5,000 buckets at that accuracy.
+
+Two accumulators can be merged (e.g. partial results from worker processes) and the result is the same as if every
+value had been added to one of them, up to the sketch's accuracy.
+"""
+import math
+import statistics
+
+
+class SummaryStats:
+    def __init__(self, relative_accuracy=0.005, exact_limit=10_000):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError(f"relative_accuracy must be between 0 and 1, got {relative_accuracy}")
+        self.relative_accuracy = relative_accuracy
+        self.exact_limit = exact_limit
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0  # sum of squared differences from the mean
+        self.min = math.inf
+        self.max = -math.inf
+
+        self.values = []  # every value while count <= exact_limit, None once the sketch took over
+        self.positive = {}  # sketch buckets, bucket index -> count
+        self.negative = {}  # buckets of -value for negative values
+        self.zeros = 0
+
+    def __repr__(self):
+        if not self.count:
+            return "SummaryStats(count=0, mean=None, median=None)"  # median() raises without values
+        return f"SummaryStats(count={self.count}, mean={self.mean:.6g}, median={self.median():.6g})"
+
+    def state(self):
+        """Returns the whole accumulator as JSON-ready data, from_state() rebuilds it exactly."""
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "exact_limit": self.exact_limit,
+            "count": self.count,
+            "mean": self.mean,
+            "m2": self.m2,
+            "min": self.min,
+            "max": self.max,
+            "values": self.values,
+            "positive": sorted(self.positive.items()),
+            "negative": sorted(self.negative.items()),
+            "zeros": self.zeros,
+        }
+
+    @classmethod
+    def from_state(cls, state):
+        stats = cls(state["relative_accuracy"], state["exact_limit"])
+        for name in ("count", "mean", "m2", "min", "max", "values", "zeros"):
+            setattr(stats, name, state[name])
+        stats.positive = {index: count for index, count in state["positive"]}
+        stats.negative = {index: count for index, count in state["negative"]}
+        return stats
+
+    def bucket(self, value):
+        return math.ceil(math.log(value) / self.log_gamma)
+
+    def bucket_value(self, index):
+        return 2 * self.gamma ** index / (self.gamma + 1)
+
+    def add_to_sketch(self, value, count=1):
+        if value > 0:
+            index = self.bucket(value)
+            self.positive[index] = self.positive.get(index, 0) + count
+        elif value < 0:
+            index = self.bucket(-value)
+            self.negative[index] = self.negative.get(index, 0) + count
+        else:
+            self.zeros += count
+
+    def switch_to_sketch(self):
+        for value in self.values:
+            self.add_to_sketch(value)
+        self.values = None
+
+    def add(self, value):
+        """Adds one value."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+        if self.values is None:
+            self.add_to_sketch(value)
+        else:
+            self.values.append(value)
+            if len(self.values) > self.exact_limit:
+                self.switch_to_sketch()
+
+    def merge(self, other):
+        """Adds every value of another SummaryStats (with the same relative_accuracy) to this one."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Only accumulators with the same relative_accuracy can be merged")
+        if not other.count:
+            return self
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+        if self.values is not None and other.values is not None and count <= self.exact_limit:
+            self.values.extend(other.values)
+            return self
+        if self.values is not None:
+            self.switch_to_sketch()
+        if other.values is not None:
+            for value in other.values:
+                self.add_to_sketch(value)
+        else:
+            for index, bucket_count in other.positive.items():
+                self.positive[index] = self.positive.get(index, 0) + bucket_count
+            for index, bucket_count in other.negative.items():
+                self.negative[index] = self.negative.get(index, 0) + bucket_count
+            self.zeros += other.zeros
+        return self
+
+    def variance(self):
+        """Sample variance, 0 for fewer than two values."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    def stdev(self):
+        return math.sqrt(self.variance())
+
+    def sorted_buckets(self):
+        """Yields (value, count) for the sketch buckets from the lowest value to the highest."""
+        for index in sorted(self.negative, reverse=True):
+            yield -self.bucket_value(index), self.negative[index]
+        if self.zeros:
+            yield 0.0, self.zeros
+        for index in sorted(self.positive):
+            yield self.bucket_value(index), self.positive[index]
+
+    def quantile(self, q):
+        """Returns the q-quantile (0 <= q <= 1), interpolating between ranks like statistics.median."""
+        if not self.count:
+            raise ValueError("No values to take a quantile of")
+        if not 0 <= q <= 1:
+            raise ValueError(f"Quantile must be between 0 and 1, got {q}")
+        if self.values is not None:
+            if q == 0.5:
+                return statistics.median(self.values)
+            ordered = sorted(self.values)
+            position = q * (len(ordered) - 1)
+            low = math.floor(position)
+            high = min(low + 1, len(ordered) - 1)
+            return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+        rank = q * (self.count - 1)
+        seen = 0
+        for value, bucket_count in self.sorted_buckets():
+            seen += bucket_count
+            if seen > rank:
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def median(self):
+        return self.quantile(0.5)
+
+    def summary(self):
+        """Returns the statistics as a plain dict."""
+        if not self.count:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "stdev": self.stdev(),
+            "min": self.min,
+            "p5": self.quantile(0.05),
+            "median": self.median(),
+            "p95": self.quantile(0.95),
+            "max": self.max,
+        }
@@ -0,0 +1,197 @@
+"""Strategy charts compiled into flat lookup tables.
+
+A chart is a text file (see charts/basic_strategy.txt) with a [hard] and a [soft] section. Each section has a header
+row of dealer upcards and one row of actions per player total. load_chart() compiles it into a bytes table, indexed
+by hand state * 12 + dealer upcard value, that holds small integer action codes. The hot loop gets a decision from a
+single index instead of a chain of comparisons, and another chart (H17, other rule sets) can be swapped in without
+touching the code.
+
+A hand state packs a hand's total and whether an Ace is still counted as 11 into one number, state = total * 2 + soft.
+For a Hand that is hand.value * 2 + hand.aces.
+
+Charts can also split pairs and surrender. A [pairs] section has one row per pair (2-10 or A) saying against which
+upcards to split: Y splits, N plays the pair as its total and Y/N splits only if doubling after a split is allowed.
+R in the [hard] or [soft] section surrenders the first two cards, it hits whenever surrender is not allowed. Both
+need a [rules] section turning them on, one "name value" line per rule from default_rules, e.g. "max_hands 4".
+"""
+import os
+
+# Integer action codes returned by chart lookups. SURRENDER only appears in parsed charts, compiled tables hold HIT
+# there and mark the cell in StrategyChart.surrender
+STAND, HIT, DOUBLE, SURRENDER = 0, 1, 2, 3
+action_letters = {"S": STAND, "H": HIT, "D": DOUBLE, "R": SURRENDER}
+action_names = {STAND: "Stand", HIT: "Hit", DOUBLE: "Double"}
+
+# [pairs] codes: never split, always split, split only when doubling after a split is allowed
+NO_SPLIT, SPLIT, SPLIT_DAS = 0, 1, 2
+pair_letters = {"N": NO_SPLIT, "Y": SPLIT, "Y/N": SPLIT_DAS}
+
+# Table rules a chart can set in its [rules] section, by default the player never splits or surrenders
+default_rules = {
+    "max_hands": 1,  # hands a player can split up to in one round, 1 never splits
+    "double_after_split": False,
+    "resplit_aces": False,
+    "hit_split_aces": False,  # otherwise split Aces get one card each
+    "late_surrender": False,  # surrender the first two cards once the dealer has checked for blackjack
+}
+
+# Busted totals stop at 31, nothing is ever added to a busted hand
+MAX_TOTAL = 31
+HAND_STATES = (MAX_TOTAL + 1) * 2
+
+upcard_labels = {"2": 2, "3": 3, "4": 4, "5": 5, "6": 6, "7": 7, "8": 8, "9": 9, "10": 10, "T": 10, "A": 11}
+
+charts_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "charts")
+
+
+def hand_state(total, soft):
+    return total * 2 + soft
+
+
+class StrategyChart:
+    """A compiled strategy chart, `table[hand_state * 12 + upcard_value]` is the action code to play.
+
+    `pairs[pair_value * 12 + upcard_value]` is 1 where a pair is split and `surrender[hand_state * 12 + upcard_value]`
+    1 where the first two cards are surrendered, either is None when the chart's rules never allow it. `rules` is
+    default_rules updated with the chart's [rules] section.
+    """
+
+    def __init__(self, name, table, pairs=None, surrender=None, rules=None):
+        self.name = name
+        self.table = table
+        self.pairs = pairs
+        self.surrender = surrender
+        self.rules = dict(default_rules) if rules is None else rules
+
+    def __repr__(self):
+        return f"StrategyChart({self.name!r})"
+
+    def action(self, total, soft, upcard_value):
+        """Returns the action code for a hand total, soft flag (0 or 1) and dealer upcard value (2-11)."""
+        return self.table[hand_state(total, soft) * 12 + upcard_value]
+
+    def splits(self, pair_value, upcard_value):
+        """Returns True if a pair of cards worth `pair_value` (2-11) is split against the upcard."""
+        return self.pairs is not None and bool(self.pairs[pair_value * 12 + upcard_value])
+
+    def surrenders(self, total, soft, upcard_value):
+        """Returns True if the first two cards are surrendered."""
+        return self.surrender is not None and bool(self.surrender[hand_state(total, soft) * 12 + upcard_value])
+
+
+def parse_totals(label):
+    """Turns a row label like "12", "13-16" or "A" (a pair of Aces) into the list of totals it covers."""
+    if label.upper() in ("A", "T"):
+        return [upcard_labels[label.upper()]]
+    low, _, high = label.partition("-")
+    return list(range(int(low), int(high or low) + 1))
+
+
+def parse_rule(line, name, line_number):
+    """Reads a "name value" line of a [rules] section, returns (rule, value)."""
+    fields = line.split()
+    if len(fields) != 2 or fields[0] not in default_rules:
+        raise ValueError(f"{name}:{line_number}: expected one of {list(default_rules)} and a value, found {line!r}")
+    rule, value = fields
+    if isinstance(default_rules[rule], bool):
+        if value.lower() not in ("yes", "no"):
+            raise ValueError(f"{name}:{line_number}: {rule} must be yes or no, found {value!r}")
+        return rule, value.lower() == "yes"
+    if not value.isdigit() or int(value) < 1:
+        raise ValueError(f"{name}:{line_number}: {rule} must be a whole number of at least 1, found {value!r}")
+    return rule, int(value)
+
+
+def parse_chart(lines, name="chart"):
+    """Reads the sections of a chart into {section: {total: {upcard_value: action code}}}.
+
+    The [rules] section comes back as {rule: value}.
+    """
+    sections = {}
+    section = None
+    section_name = None
+    upcards = None
+    for line_number, line in enumerate(lines, 1):
+        line = line.split("#", 1)[0].strip()
+        if not line:
+            continue
+        if line.startswith("[") and line.endswith("]"):
+            section_name = line[1:-1].strip().lower()
+            section = sections.setdefault(section_name, {})
+            upcards = None
+            continue
+        if section is None:
+            raise ValueError(f"{name}:{line_number}: chart rows must come after a [section] header")
+        if section_name == "rules":
+            rule, value = parse_rule(line, name, line_number)
+            section[rule] = value
+            continue
+        fields = line.split()
+        if upcards is None:
+            try:
+                upcards = [upcard_labels[field.upper()] for field in fields]
+            except KeyError as error:
+                raise ValueError(f"{name}:{line_number}: unknown dealer upcard {error.args[0]!r}") from None
+            continue
+        label, actions = fields[0], fields[1:]
+        if len(actions) != len(upcards):
+            raise ValueError(f"{name}:{line_number}: expected {len(upcards)} actions, found {len(actions)}")
+        letters = pair_letters if section_name == "pairs" else action_letters
+        try:
+            codes = [letters[action.upper()] for action in actions]
+            totals = parse_totals(label)
+        except (KeyError, ValueError):
+            raise ValueError(f"{name}:{line_number}: cannot read row {line!r}") from None
+        for total in totals:
+            section[total] = dict(zip(upcards, codes))
+    return sections
+
+
+def compile_chart(sections, name="chart"):
+    """Flattens parsed chart sections into a StrategyChart lookup table."""
+    hard = sections.get("hard", {})
+    soft = sections.get("soft", {})
+    unknown = set(sections) - {"hard", "soft", "pairs", "rules"}
+    if unknown:
+        raise ValueError(f"{name}: unknown chart sections {sorted(unknown)}")
+    rules = dict(default_rules, **sections.get("rules", {}))
+
+    table = bytearray(HAND_STATES * 12)  # anything the chart leaves out (busted or impossible hands) stands
+    surrender = bytearray(HAND_STATES * 12)
+    for total in range(4, 22):
+        if total not in hard or len(hard[total]) != 10:
+            raise ValueError(f"{name}: the [hard] section needs a full row for every total from 4 to 21")
+        for soft_flag in (0, 1):
+            row = soft.get(total, hard[total]) if soft_flag else hard[total]
+            for upcard_value, code in row.items():
+                index = hand_state(total, soft_flag) * 12 + upcard_value
+                if code == SURRENDER:
+                    surrender[index] = 1
+                    code = HIT
+                table[index] = code
+
+    pairs = None
+    if "pairs" in sections and rules["max_hands"] > 1:
+        pairs = bytearray(12 * 12)  # pairs without a row are played as their total
+        for pair_value, row in sections["pairs"].items():
+            if not 2 <= pair_value <= 11:
+                raise ValueError(f"{name}: the [pairs] section has a row for {pair_value}, pairs go from 2 to A")
+            for upcard_value, code in row.items():
+                split = code == SPLIT or code == SPLIT_DAS and rules["double_after_split"]
+                pairs[pair_value * 12 + upcard_value] = split
+        pairs = bytes(pairs)
+    return StrategyChart(name, bytes(table), pairs, bytes(surrender) if rules["late_surrender"] else None, rules)
+
+
+def load_chart(path):
+    """Reads and compiles a chart file. A bare name like "basic_strategy" loads one of the charts shipped in
+    simujack/charts."""
+    if not os.path.exists(path):
+        path = os.path.join(charts_dir, path if path.endswith(".txt") else path + ".txt")
+    name = os.path.splitext(os.path.basename(path))[0]
+    with open(path) as chart_file:
+        return compile_chart(parse_chart(chart_file, name), name)
+
+
+# The chart played by the engine unless told otherwise
+BASIC_STRATEGY_CHART = load_chart("basic_strategy")
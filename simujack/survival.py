@@ -0,0 +1,116 @@
+"""Hands-to-bankruptcy statistics that account for censored runs.
+
+A run stopped by max_hands or a time budget before going bankrupt is censored: all we know is that it lasted longer
+than the hands it played. Leaving such runs out, or counting their hands as if they had gone bankrupt, both bias the
+median low. SurvivalStats keeps the Kaplan-Meier estimate of the survival curve instead, S(h) = the chance a run
+is still solvent after h hands, and reads medians and other quantiles off it. Without censored runs the estimate is
+just the share of runs still going, so the median is the usual one.
+
+Memory grows with the number of distinct hand counts, not the number of runs, and two accumulators can be merged.
+"""
+from bisect import bisect_right
+
+# Tolerance when comparing the survival curve with a quantile, absorbs float error in the product
+EPSILON = 1e-9
+
+
+class SurvivalStats:
+    def __init__(self):
+        self.bankrupt = {}  # hands played -> runs that went bankrupt after that many hands
+        self.censored = {}  # hands played -> runs that were stopped after that many hands
+        self.curve = None  # cached (hands, survival) lists, rebuilt after every change
+
+    def __repr__(self):
+        return f"SurvivalStats(runs={self.count}, censored={self.censored_count})"
+
+    @property
+    def count(self):
+        return self.bankrupt_count + self.censored_count
+
+    @property
+    def bankrupt_count(self):
+        return sum(self.bankrupt.values())
+
+    @property
+    def censored_count(self):
+        return sum(self.censored.values())
+
+    def state(self):
+        """Returns the run counts as JSON-ready data, from_state() rebuilds the accumulator."""
+        return {"bankrupt": sorted(self.bankrupt.items()), "censored": sorted(self.censored.items())}
+
+    @classmethod
+    def from_state(cls, state):
+        stats = cls()
+        stats.bankrupt = {hands: runs for hands, runs in state["bankrupt"]}
+        stats.censored = {hands: runs for hands, runs in state["censored"]}
+        return stats
+
+    def add(self, hands, censored=False):
+        """Adds a run that went bankrupt after `hands` hands, or was stopped after them with censored=True."""
+        counts = self.censored if censored else self.bankrupt
+        counts[hands] = counts.get(hands, 0) + 1
+        self.curve = None
+
+    def merge(self, other):
+        """Adds every run of another SurvivalStats to this one."""
+        for hands, runs in other.bankrupt.items():
+            self.bankrupt[hands] = self.bankrupt.get(hands, 0) + runs
+        for hands, runs in other.censored.items():
+            self.censored[hands] = self.censored.get(hands, 0) + runs
+        self.curve = None
+        return self
+
+    def survival_curve(self):
+        """Returns the Kaplan-Meier curve as ([hands], [survival]) at every hand count where a run went bankrupt."""
+        if self.curve is None:
+            at_risk = self.count
+            survival = 1.0
+            hands_list, survival_list = [], []
+            for hands in sorted(set(self.bankrupt) | set(self.censored)):
+                bankrupt = self.bankrupt.get(hands, 0)
+                if bankrupt:
+                    survival *= 1 - bankrupt / at_risk
+                    hands_list.append(hands)
+                    survival_list.append(survival)
+                at_risk -= bankrupt + self.censored.get(hands, 0)  # runs censored at h were still at risk at h
+            self.curve = hands_list, survival_list
+        return self.curve
+
+    def survival(self, hands):
+        """Returns the estimated chance that a run is still solvent after `hands` hands."""
+        hands_list, survival_list = self.survival_curve()
+        index = bisect_right(hands_list, hands)
+        return survival_list[index - 1] if index else 1.0
+
+    def quantile(self, q):
+        """Returns the number of hands by which a fraction q of the runs is estimated to have gone bankrupt.
+
+        Returns None when too many runs were censored for the curve to get that far. Where the curve sits exactly
+        on 1 - q the midpoint to the next bankruptcy is returned, like statistics.median does.
+        """
+        if not 0 < q < 1:
+            raise ValueError(f"Quantile must be between 0 and 1, got {q}")
+        hands_list, survival_list = self.survival_curve()
+        for index, survival in enumerate(survival_list):
+            if survival <= 1 - q + EPSILON:
+                if abs(survival - (1 - q)) <= EPSILON and index + 1 < len(hands_list):
+                    return (hands_list[index] + hands_list[index + 1]) / 2
+                return hands_list[index]
+        return None
+
+    def median(self):
+        return self.quantile(0.5)
+
+    def summary(self):
+        """Returns the run counts and the p5, median and p95 hands to bankruptcy (None where unknown)."""
+        if not self.count:
+            return {"runs": 0}
+        return {
+            "runs": self.count,
+            "bankrupt": self.bankrupt_count,
+            "censored": self.censored_count,
+            "p5": self.quantile(0.05),
+            "median": self.median(),
+            "p95": self.quantile(0.95),
+        }
@@ -0,0 +1,130 @@
+"""Parameter sweeps over bankroll x unit size x betting strategy grids.
+
+sweep() turns every cell of the grid into a campaign of `num_simulations` simulations and splits those into small
+work units of `runs_per_unit` simulations. The units go into one shared queue that the worker processes pull from
+whenever they are idle, so a worker that finishes its quick Martingale units simply takes the next unit of a slow
+Oscar's system cell instead of waiting for a statically assigned chunk. Only a few units per worker are in flight
+at once, which keeps the tail short and the pickling overhead low.
+
+Results stream back as a generator, one dict per cell as soon as its last unit is done:
+
+    for cell in sweep([500, 1000], [5, 10], ["martingale", "oscars"], num_simulations=1000, workers=8, seed=1):
+        print(cell["strategy"], cell["bankroll"], cell["unit_size"], cell["results"]["median_hands_to_bankruptcy"])
+
+Every cell uses the same seed, so cell results are exactly what run_multiple_simulations returns for that cell
+and seed (the cells also play against the same shuffles, which makes comparing them less noisy).
+"""
+import itertools
+import random
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from simujack.engine import Shoe, rng_kinds, run_one_simulation, strategies, summarize_campaign
+from simujack.stats import SummaryStats
+from simujack.strategy import BASIC_STRATEGY_CHART
+from simujack.survival import SurvivalStats
+
+# Work units handed out per worker before waiting for one to finish
+UNITS_IN_FLIGHT = 4
+
+
+def strategy_label(strategy):
+    """Returns the name of a strategy given by name or as a function."""
+    if isinstance(strategy, str):
+        return strategy
+    for name, func in strategies.items():
+        if func is strategy:
+            return name
+    return getattr(strategy, "__name__", repr(strategy))
+
+
+def run_sweep_unit(job):
+    """Runs simulations first..last of one grid cell, returns (cell index, first, [(hands, max bankroll, censored)])."""
+    cell_index, bankroll, unit_size, strategy_func, shoe_factory, chart, seed, rng, first, last, max_hands = job
+    outcomes = []
+    for sim in range(first, last + 1):
+        results = run_one_simulation((bankroll, unit_size, strategy_func, shoe_factory, chart, seed, rng, sim, False,
+                                      None, False, max_hands, None))
+        outcomes.append((results["hands_played"], results["max_bankroll"], results["censored"]))
+    return cell_index, first, outcomes
+
+
+class CellProgress:
+    """Accumulates the work units of one grid cell in simulation order, whatever order they finish in."""
+
+    def __init__(self, units):
+        self.units_left = units
+        self.next_sim = 1
+        self.pending = {}  # first simulation of a finished unit -> its outcomes, until the units before it are in
+        self.hands_stats = SummaryStats()
+        self.max_bankroll_stats = SummaryStats()
+        self.survival = SurvivalStats()
+
+    def add_unit(self, first, outcomes):
+        """Adds a finished unit, returns True once the whole cell is done."""
+        self.pending[first] = outcomes
+        while self.next_sim in self.pending:
+            outcomes = self.pending.pop(self.next_sim)
+            for hands_played, max_bankroll, censored in outcomes:
+                self.hands_stats.add(hands_played)
+                self.max_bankroll_stats.add(max_bankroll)
+                self.survival.add(hands_played, censored)
+            self.next_sim += len(outcomes)
+        self.units_left -= 1
+        return not self.units_left
+
+
+def sweep(bankrolls, unit_sizes, strategy_funcs, num_simulations, workers=1, seed=None, runs_per_unit=4,
+          shoe_factory=Shoe, chart=BASIC_STRATEGY_CHART, max_hands=None, rng="random"):
+    """Runs a campaign for every (strategy, bankroll, unit size) of the grid and yields each cell once it is done.
+
+    `strategy_funcs` holds strategy functions or their names in simujack.engine.strategies. Each yielded dict has
+    the cell's "strategy" name, "bankroll", "unit_size" and "results", the same dict run_multiple_simulations
+    returns. Cells are yielded in the order they finish. Without a seed a random one is picked, it is in the
+    results. `rng` picks the random streams as in run_multiple_simulations.
+    """
+    if runs_per_unit < 1:
+        raise ValueError(f"runs_per_unit must be at least 1, got {runs_per_unit}")
+    if rng not in rng_kinds:
+        raise ValueError(f"Unknown random stream {rng!r}, expected one of {list(rng_kinds)}")
+    strategy_funcs = [strategies[strategy] if isinstance(strategy, str) else strategy for strategy in strategy_funcs]
+    if seed is None:
+        seed = random.randrange(2 ** 63)
+    cells = list(itertools.product(strategy_funcs, bankrolls, unit_sizes))
+    units_per_cell = -(-num_simulations // runs_per_unit)
+    progress = [CellProgress(units_per_cell) for _ in cells]
+    jobs = ((index, bankroll, unit_size, strategy_func, shoe_factory, chart, seed, rng, first,
+             min(first + runs_per_unit - 1, num_simulations), max_hands)
+            for index, (strategy_func, bankroll, unit_size) in enumerate(cells)
+            for first in range(1, num_simulations + 1, runs_per_unit))
+
+    def finished(cell_index):
+        strategy_func, bankroll, unit_size = cells[cell_index]
+        cell = progress[cell_index]
+        progress[cell_index] = None  # free the accumulators
+        results = summarize_campaign(cell.hands_stats, cell.max_bankroll_stats, cell.survival, 0, seed, rng)
+        return {"strategy": strategy_label(strategy_func), "bankroll": bankroll, "unit_size": unit_size,
+                "results": results}
+
+    if workers <= 1:
+        for job in jobs:
+            cell_index, first, outcomes = run_sweep_unit(job)
+            if progress[cell_index].add_unit(first, outcomes):
+                yield finished(cell_index)
+        return
+
+    pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        running = set()
+        for job in itertools.islice(jobs, workers * UNITS_IN_FLIGHT):
+            running.add(pool.submit(run_sweep_unit, job))
+        while running:
+            done, running = wait(running, return_when=FIRST_COMPLETED)
+            # Hand the freed slots to the next units straight away, before the results are processed
+            for job in itertools.islice(jobs, len(done)):
+                running.add(pool.submit(run_sweep_unit, job))
+            for future in done:
+                cell_index, first, outcomes = future.result()
+                if progress[cell_index].add_unit(first, outcomes):
+                    yield finished(cell_index)
+    finally:
+        pool.shutdown(cancel_futures=True)
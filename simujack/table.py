@@ -0,0 +1,257 @@
+"""A full table: up to 7 seats playing against one dealer out of one shared shoe.
+
+Every seat has its own betting strategy, bankroll and unit size. Each round the seats that still have money bet,
+get their two cards in seat order, then the dealer gets two, and every seat plays its hand (splits and surrender
+included when the chart allows them). The dealer's hand is played once for the whole table and settled against
+every seat, so dealer play and shoe handling are shared instead of repeated per player, and the seats see the card
+removal of a crowded table. A seat that goes bankrupt leaves the table, the others keep playing.
+
+    seats = [("martingale", 1000, 10), ("basic", 1000, 10), ("true-count", 2000, 10)]
+    results = run_table_simulations(seats, num_simulations=100, seed=42)
+    results["seats"][0]["results"]["median_hands_to_bankruptcy"]
+
+A lone seat betting "basic" plays exactly the hands run_basic_strategy_simulation plays from the same shoe.
+"""
+import math
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from simujack.engine import (
+    Shoe, check_caps, determine_result, is_blackjack, is_pair, play_dealer_turn, play_split_hands, rng_kinds,
+    run_basic_strategy_simulation, settle_split_hands, simulate_player_turn, simulation_rng, strategies,
+    summarize_campaign, values
+)
+from simujack.progressions import FlatBet, make_progression
+from simujack.stats import SummaryStats
+from simujack.strategy import BASIC_STRATEGY_CHART
+from simujack.survival import SurvivalStats
+from simujack.sweep import strategy_label
+
+MAX_SEATS = 7
+
+
+class Seat:
+    """One player at the table: a betting progression and its bankroll."""
+
+    def __init__(self, strategy_func, bankroll, unit_size, shoe, chart):
+        if bankroll <= 0 or unit_size <= 0:
+            raise ValueError(f"A seat needs a positive bankroll and unit size, got {bankroll} and {unit_size}")
+        if isinstance(strategy_func, str):
+            strategy_func = strategies[strategy_func]
+        if strategy_func is run_basic_strategy_simulation:
+            strategy_func = FlatBet  # the "basic" strategy bets one unit every hand
+        self.progression = make_progression(strategy_func, unit_size)
+        self.counting = self.progression.uses_true_count
+        self.bankroll = bankroll
+        self.unit_size = unit_size
+        self.max_bankroll = bankroll
+        self.hands_played = 0
+        # The hands are reused for every round, the stack holds every hand a split round can make
+        self.hands = [shoe.new_hand() for _ in range(chart.rules["max_hands"])]
+        self.hand = self.hands[0]
+        self.hand_bets = [0] * len(self.hands)
+        self.hand_doubled = [False] * len(self.hands)
+        self.bet = 0
+        self.in_play = False  # set while the round's bet waits for the dealer
+        self.split_hands = 0  # hands in play this round after splitting, 0 for an unsplit round
+
+    def place_bet(self, true_count):
+        """Takes this round's bet off the bankroll."""
+        if self.counting:
+            self.progression.true_count = true_count
+        bet = self.progression.next_bet(self.bankroll)
+        if self.bankroll < bet:
+            bet = self.bankroll  # Bet the remaining bankroll if less than the calculated bet
+        self.bankroll -= bet
+        self.bet = bet
+        self.in_play = True
+        self.split_hands = 0
+        self.hand.reset()
+
+    def record(self, result, blackjack=False):
+        """Settles the round: tells the progression its result and updates the counts.
+
+        Like the single-player runners, a round settled on a dealt blackjack (`blackjack`) leaves max_bankroll alone.
+        """
+        self.in_play = False
+        self.progression.record(result)
+        if not blackjack:
+            self.max_bankroll = max(self.max_bankroll, self.bankroll)
+        self.hands_played += 1
+
+    def results(self, stop):
+        return {
+            "hands_played": self.hands_played,
+            "max_bankroll": self.max_bankroll,
+            "censored": stop is not None,
+            "stop": stop or "bankrupt",
+        }
+
+
+def run_table_simulation(seats, shoe=None, chart=BASIC_STRATEGY_CHART, max_hands=None, deadline=None):
+    """Plays rounds at a table of 1 to 7 seats until every seat is bankrupt.
+
+    `seats` is a list of (strategy, bankroll, unit_size), the strategy given as a progression class, a strategy
+    function or by its name in simujack.engine.strategies ("basic" bets one unit every hand). Cards come from
+    `shoe`, a new 6-deck Shoe when none is given, and every hand is played with `chart`. The table also stops after
+    `max_hands` rounds or once time.monotonic() passes `deadline`, the seats still playing are then censored.
+
+    Returns {"rounds": rounds played, "seats": [results per seat]}, each seat's results like
+    run_simulation_with_strategy's: "hands_played", "max_bankroll", "censored" and "stop".
+    """
+    if not 1 <= len(seats) <= MAX_SEATS:
+        raise ValueError(f"A table has 1 to {MAX_SEATS} seats, got {len(seats)}")
+    if shoe is None:
+        shoe = Shoe(num_decks=6)
+    table_seats = [Seat(strategy_func, bankroll, unit_size, shoe, chart)
+                   for strategy_func, bankroll, unit_size in seats]
+    counting = any(seat.counting for seat in table_seats)
+    if counting and shoe.count_tags is None:
+        shoe.set_count_system("hi-lo")
+    dealer_hand = shoe.new_hand()
+    pairs = chart.pairs
+    surrender = chart.surrender
+    results = [None] * len(table_seats)
+    playing = list(enumerate(table_seats))  # (seat index, seat) of the seats that still have money
+
+    rounds = 0
+    true_count = None
+    stop = None
+    next_check = math.inf if max_hands is None and deadline is None else 0
+
+    while playing:
+        if rounds == next_check:
+            stop, next_check = check_caps(rounds, max_hands, deadline)
+            if stop is not None:
+                break
+
+        # Bet, then two cards for every seat in turn and two for the dealer
+        shoe.start_round()
+        if counting:
+            true_count = shoe.true_count()  # the bets are placed before this round's cards are seen
+        for _, seat in playing:
+            seat.place_bet(true_count)
+            seat.hand.add_card(shoe.deal())
+            seat.hand.add_card(shoe.deal())
+        dealer_hand.reset()
+        dealer_hand.add_card(shoe.deal())
+        dealer_hand.add_card(shoe.deal())
+        dealer_blackjack = is_blackjack(dealer_hand)
+        upcard = dealer_hand.cards[0]
+        upcard_value = values[upcard.rank]
+
+        # Blackjacks are settled straight away, every other seat plays its hand
+        dealer_plays = False
+        for _, seat in playing:
+            hand = seat.hand
+            bet = seat.bet
+            if dealer_blackjack or is_blackjack(hand):
+                if not dealer_blackjack:
+                    seat.bankroll += bet * 2.5  # Correct 3:2 payout for Blackjack
+                    seat.record("Blackjack", blackjack=True)
+                elif is_blackjack(hand):
+                    seat.bankroll += bet  # Return the bet for a push
+                    seat.record("Push", blackjack=True)
+                else:
+                    seat.record("Lose", blackjack=True)
+                continue
+            if (pairs is not None and seat.bankroll >= bet and is_pair(hand)
+                    and pairs[values[hand.cards[0].rank] * 12 + upcard_value]):
+                seat.bankroll, seat.split_hands = play_split_hands(shoe, seat.hands, seat.hand_bets,
+                                                                   seat.hand_doubled, upcard, seat.bankroll, bet,
+                                                                   chart)
+                dealer_plays = dealer_plays or any(seat.hands[index].value <= 21
+                                                   for index in range(seat.split_hands))
+                continue
+            if surrender is not None and surrender[(hand.value * 2 + hand.aces) * 12 + upcard_value]:
+                seat.bankroll += bet / 2  # Half the bet comes back
+                seat.record("Surrender")
+                continue
+            seat.bankroll, seat.bet, _ = simulate_player_turn(shoe, hand, upcard, seat.bankroll, bet, chart)
+            dealer_plays = dealer_plays or hand.value <= 21
+
+        # The dealer plays once for the whole table, then the hands still in play are settled
+        if dealer_plays:
+            play_dealer_turn(shoe, dealer_hand)
+        for _, seat in playing:
+            if seat.split_hands:
+                paid, _ = settle_split_hands(seat.hands, seat.hand_bets, seat.split_hands, dealer_hand)
+                seat.bankroll += paid
+                stake = sum(seat.hand_bets[:seat.split_hands])
+                seat.record("Win" if paid > stake else "Push" if paid == stake else "Lose")
+            elif seat.in_play:
+                if seat.hand.value > 21:
+                    result = "Lose"
+                else:
+                    result, seat.bankroll = determine_result(seat.hand, dealer_hand, seat.bankroll, seat.bet)
+                seat.record(result)
+        rounds += 1
+
+        if any(seat.bankroll <= 0 for _, seat in playing):
+            for index, seat in playing:
+                if seat.bankroll <= 0:
+                    results[index] = seat.results(None)
+            playing = [(index, seat) for index, seat in playing if seat.bankroll > 0]
+
+    for index, seat in playing:
+        results[index] = seat.results(stop)
+    return {"rounds": rounds, "seats": results}
+
+
+def run_one_table(job):
+    """Runs one table simulation of a campaign, `job` is (seats, shoe_factory, chart, seed, rng, sim, max_hands)."""
+    seats, shoe_factory, chart, seed, rng, sim, max_hands = job
+    shoe = shoe_factory() if seed is None else shoe_factory(rng=simulation_rng(seed, sim, rng))
+    return run_table_simulation(seats, shoe=shoe, chart=chart, max_hands=max_hands)
+
+
+def run_table_simulations(seats, num_simulations, shoe_factory=Shoe, workers=1, seed=None,
+                          chart=BASIC_STRATEGY_CHART, max_hands=None, rng="random"):
+    """Runs a table simulation `num_simulations` times and summarizes every seat.
+
+    Seeding and workers work as in run_multiple_simulations: each simulation deals from its own stream of the
+    seed, so the results do not depend on the number of workers, and parallel runs without a seed pick one.
+    Returns {"seats": [...], "rounds": summary of the rounds played, "seed": seed, "rng": rng}, each seat a dict
+    with its "strategy" name, "bankroll", "unit_size" and "results", the same summary run_multiple_simulations
+    returns for a single player.
+    """
+    if not 1 <= len(seats) <= MAX_SEATS:
+        raise ValueError(f"A table has 1 to {MAX_SEATS} seats, got {len(seats)}")
+    if rng not in rng_kinds:
+        raise ValueError(f"Unknown random stream {rng!r}, expected one of {list(rng_kinds)}")
+    seats = [(strategies[strategy] if isinstance(strategy, str) else strategy, bankroll, unit_size)
+             for strategy, bankroll, unit_size in seats]
+    if seed is None and (workers > 1 or rng != "random"):
+        seed = random.randrange(2 ** 63)  # the global random state is not shared with the workers
+
+    hands_stats = [SummaryStats() for _ in seats]
+    max_bankroll_stats = [SummaryStats() for _ in seats]
+    survival = [SurvivalStats() for _ in seats]
+    rounds_stats = SummaryStats()
+    jobs = ((seats, shoe_factory, chart, seed, rng, sim, max_hands) for sim in range(1, num_simulations + 1))
+    pool = None
+    if workers > 1:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        all_results = pool.map(run_one_table, jobs, chunksize=max(1, num_simulations // (workers * 16)))
+    else:
+        all_results = map(run_one_table, jobs)
+    try:
+        for table in all_results:
+            rounds_stats.add(table["rounds"])
+            for index, results in enumerate(table["seats"]):
+                hands_stats[index].add(results["hands_played"])
+                max_bankroll_stats[index].add(results["max_bankroll"])
+                survival[index].add(results["hands_played"], results["censored"])
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    return {
+        "seats": [{"strategy": strategy_label(strategy_func), "bankroll": bankroll, "unit_size": unit_size,
+                   "results": summarize_campaign(hands_stats[index], max_bankroll_stats[index], survival[index], 0,
+                                                 seed, rng)}
+                  for index, (strategy_func, bankroll, unit_size) in enumerate(seats)],
+        "rounds": rounds_stats.summary(),
+        "seed": seed,
+        "rng": rng,
+    }
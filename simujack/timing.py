@@ -0,0 +1,50 @@
+"""Opt-in per-phase timing of the simulation loops.
+
+Pass a PhaseTimer to run_simulation_with_strategy or run_basic_strategy_simulation (or timing=True to
+run_multiple_simulations) and the runner adds up the time spent and the number of calls of each phase of a hand.
+The report comes back under "timings" in the result dict:
+
+    results = run_basic_strategy_simulation(1000, 10, print_hands=False, timer=PhaseTimer())
+    results["timings"]["dealer_turn"]  # {"calls": ..., "seconds": ...}
+
+The runners time with laps: each lap() charges the time since the previous one to a phase, so a hand costs one
+clock read per phase. Without a timer the loops only test `timer is not None` once per phase.
+"""
+from time import perf_counter
+
+# The phases of a hand in the order they happen, "shoe" is building the shoe (Deck construction)
+PHASES = ("shoe", "shuffle", "deal", "bet", "is_blackjack", "player_turn", "dealer_turn", "settle",
+          "print_hand_results", "history")
+
+
+class PhaseTimer:
+    def __init__(self):
+        self.seconds = dict.fromkeys(PHASES, 0.0)
+        self.calls = dict.fromkeys(PHASES, 0)
+        self.mark = perf_counter()
+
+    def start(self):
+        """Starts the next lap now, the time since the previous lap is not charged to any phase."""
+        self.mark = perf_counter()
+
+    def lap(self, phase):
+        """Charges the time since the previous lap to `phase`."""
+        now = perf_counter()
+        self.seconds[phase] += now - self.mark
+        self.calls[phase] += 1
+        self.mark = now
+
+    def add_report(self, report):
+        """Adds the totals of another timer's report(), e.g. one sent back by a worker process."""
+        for phase, totals in report.items():
+            if phase != "total":
+                self.seconds[phase] += totals["seconds"]
+                self.calls[phase] += totals["calls"]
+        return self
+
+    def report(self):
+        """Returns {phase: {"calls": ..., "seconds": ...}} for every phase that ran, plus the total time."""
+        report = {phase: {"calls": self.calls[phase], "seconds": self.seconds[phase]}
+                  for phase in PHASES if self.calls[phase]}
+        report["total"] = {"seconds": sum(self.seconds.values())}
+        return report
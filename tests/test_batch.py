@@ -0,0 +1,27 @@
+import random
+
+import numpy as np
+
+from simujack.batch import compare_with_scalar, hand_outcomes, scalar_hand_outcomes
+
+NUM_HANDS = 100_000
+# The chi-square p-value below which the engines count as disagreeing, a 1 in 1000 chance for engines that agree
+MIN_P_VALUE = 0.001
+
+
+def test_batch_and_scalar_outcome_distributions_agree():
+    # Every net result is compared, so a blackjack paying 1:1 or a double that does not double the stake fails
+    comparison = compare_with_scalar(NUM_HANDS, seed=1)
+    assert all(comparison["batch_counts"]) and all(comparison["scalar_counts"]), comparison
+    assert len(comparison["batch_counts"]) == len(hand_outcomes), comparison
+    assert comparison["p_value"] > MIN_P_VALUE, comparison
+
+
+def test_scalar_hand_outcomes_leave_the_global_random_state_alone():
+    state = random.getstate()
+    scalar_hand_outcomes(100, seed=1)
+    assert random.getstate() == state
+
+
+def test_scalar_hand_outcomes_are_reproducible():
+    assert np.array_equal(scalar_hand_outcomes(1000, seed=3), scalar_hand_outcomes(1000, seed=3))
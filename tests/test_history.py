@@ -0,0 +1,33 @@
+from simujack.engine import Card, Hand
+from simujack.history import MAX_CARDS, NO_CARD, RESULTS, HandHistoryWriter, read_history
+
+
+def hand_of(*ranks):
+    hand = Hand()
+    for rank in ranks:
+        hand.add_card(Card("Spades", rank))
+    return hand
+
+
+def test_the_longest_possible_hand_is_recorded(tmp_path):
+    # 21 Aces count 21, the 22nd card busts the hand
+    player = hand_of(*["A"] * 21, "2")
+    dealer = hand_of("10", "7")
+    path = tmp_path / "run.sjh"
+    with HandHistoryWriter(path) as history:
+        history.write(0, "Lose", player, dealer, 990.0, 10.0)
+    record = read_history(path, mmap=False)[0]
+    assert len(player.cards) == MAX_CARDS
+    assert NO_CARD not in record["player_cards"].tolist()
+    assert record["player_total"] == player.value
+    assert RESULTS[record["result"]] == "Bust"
+
+
+def test_records_keep_the_result_of_hands_that_did_not_bust(tmp_path):
+    path = tmp_path / "run.sjh"
+    with HandHistoryWriter(path) as history:
+        history.write(0, "Lose", hand_of("10", "7"), hand_of("10", "9"), 990.0, 10.0)
+        history.write(1, "Surrender", hand_of("10", "6"), hand_of("10", "9"), 985.0, 10.0)
+    records = read_history(path, mmap=False)
+    assert [RESULTS[code] for code in records["result"]] == ["Lose", "Surrender"]
+    assert records["dealer_cards"][0].tolist()[2:] == [NO_CARD] * (MAX_CARDS - 2)
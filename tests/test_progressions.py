@@ -0,0 +1,31 @@
+from functools import partial
+
+import numpy as np
+import pytest
+
+from simujack.batch import make_batch_progression
+from simujack.progressions import HalfUp, Martingale, Oscars, ReverseMartingale, make_progression
+
+
+def results_of(net):
+    return "Win" if net > 0 else "Push" if net == 0 else "Lose"
+
+
+@pytest.mark.parametrize("progression", [
+    Martingale, HalfUp, Oscars, ReverseMartingale, partial(ReverseMartingale, streak_cap=2),
+    partial(ReverseMartingale, 5), partial(partial(ReverseMartingale), 5),
+])
+def test_batch_form_bets_like_the_progression(progression):
+    rng = np.random.default_rng(1)
+    num_lanes = 50
+    nets = rng.choice([-2, -1, 0, 1, 1.5, 2], size=(200, num_lanes))
+    bankrolls = rng.uniform(5, 500, size=(200, num_lanes))
+    lanes = np.arange(num_lanes)
+    batch = make_batch_progression(progression, num_lanes, 10)
+    scalars = [make_progression(progression, 10) for _ in lanes]
+    for net, bankroll in zip(nets, bankrolls):
+        expected = [scalar.next_bet(lane_bankroll) for scalar, lane_bankroll in zip(scalars, bankroll)]
+        assert batch.next_bets(lanes, bankroll).tolist() == pytest.approx(expected)
+        batch.record(lanes, net)
+        for scalar, lane_net in zip(scalars, net):
+            scalar.record(results_of(lane_net))
@@ -0,0 +1,12 @@
+from simujack.stats import SummaryStats
+
+
+def test_repr_of_an_empty_accumulator():
+    assert repr(SummaryStats()) == "SummaryStats(count=0, mean=None, median=None)"
+
+
+def test_repr_shows_count_mean_and_median():
+    stats = SummaryStats()
+    for value in (1, 2, 6):
+        stats.add(value)
+    assert repr(stats) == "SummaryStats(count=3, mean=3, median=2)"
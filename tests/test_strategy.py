@@ -0,0 +1,13 @@
+import pytest
+
+from simujack.engine import chart_mismatches
+from simujack.strategy import BASIC_STRATEGY_CHART, load_chart
+
+
+def test_default_chart_plays_like_basic_strategy():
+    assert chart_mismatches(BASIC_STRATEGY_CHART) == []
+
+
+@pytest.mark.parametrize("name", ["basic_strategy", "das_late_surrender"])
+def test_bundled_chart_plays_like_basic_strategy(name):
+    assert chart_mismatches(load_chart(name)) == []